@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING, List
-from collections import OrderedDict
-import random
 
+from gsocialsim.agents.agent_rng import AgentRng
 from gsocialsim.agents.identity_state import IdentityState
 from gsocialsim.agents.belief_state import BeliefStore
 from gsocialsim.agents.emotion_state import EmotionState
@@ -16,6 +15,8 @@ from gsocialsim.stimuli.content_item import ContentItem
 from gsocialsim.policy.bandit_learner import BanditLearner, RewardVector
 from gsocialsim.stimuli.interaction import Interaction, InteractionVerb
 from gsocialsim.agents.impression import Impression, IntakeMode
+from gsocialsim.agents.working_memory import WorkingMemory
+from gsocialsim.agents.daily_digest import DailyDigest
 from gsocialsim.social.politics import DEFAULT_POLITICAL_TOPICS, effective_lean
 
 if TYPE_CHECKING:
@@ -35,11 +36,11 @@ class PlannedAction:
     action_key: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PerceptionPlan:
     agent_id: str
     content: ContentItem
-    impression: Impression
+    impression: Optional[Impression]  # None when not exposed
     is_physical: bool
     stimulus_id: Optional[str]
     exposed: bool
@@ -70,7 +71,10 @@ class Agent:
     emotion: EmotionState = field(default_factory=EmotionState)
     budgets: BudgetState = field(default_factory=BudgetState)
     personality: RewardWeights = field(default_factory=RewardWeights)
-    rng: random.Random = field(init=False)
+    rng: AgentRng = field(init=False)
+    # Sub-stream for day-boundary draws (budget regen, dream), so they do not depend
+    # on how many ACT/PERCEIVE draws the agent made in the boundary tick.
+    daily_rng: AgentRng = field(init=False, repr=False)
     attention: AttentionSystem = field(default_factory=AttentionSystem)
     belief_update_engine: BeliefUpdateEngine = field(default_factory=BeliefUpdateEngine)
     memory: MemoryStore = field(default_factory=MemoryStore)
@@ -79,15 +83,20 @@ class Agent:
 
     # Working memory
     max_recent_impressions: int = 200
-    recent_impressions: OrderedDict[str, Impression] = field(default_factory=OrderedDict)
+    recent_impressions: WorkingMemory = field(default_factory=WorkingMemory)
 
     # Daily buffers (for dream / consolidation)
-    daily_impressions_consumed: List[Impression] = field(default_factory=list)
+    daily_digest: DailyDigest = field(init=False)  # streaming aggregates of consumed impressions
     daily_actions: List[Interaction] = field(default_factory=list)
 
     def __post_init__(self):
-        self.rng = random.Random(self.seed)
-        self.budgets._rng = self.rng
+        # Counter-based stream keyed by (seed, id); the population binds it to the clock.
+        self.rng = AgentRng.for_agent(self.seed, self.id)
+        self.daily_rng = self.rng.stream("daily")
+        self.budgets._rng = self.daily_rng
+        self.recent_impressions.capacity = self.max_recent_impressions
+        # Unbound (clock-free) sub-stream: reservoir draws never shift the agent's own.
+        self.daily_digest = DailyDigest(self.rng.stream("dream/reservoir"), max_samples=30)
 
     @staticmethod
     def _clamp01(x: float) -> float:
@@ -98,13 +107,13 @@ class Agent:
         if not content_id:
             return
         try:
-            # Refresh recency if already present
-            if content_id in self.recent_impressions:
-                self.recent_impressions.move_to_end(content_id)
-            self.recent_impressions[content_id] = impression
-            # Bound memory growth (attention span)
-            while len(self.recent_impressions) > max(1, int(self.max_recent_impressions)):
-                self.recent_impressions.popitem(last=False)
+            memory = self.recent_impressions
+            # Bound memory growth (attention span); max_recent_impressions may change at runtime
+            capacity = max(1, int(self.max_recent_impressions))
+            if memory.capacity != capacity:
+                memory.capacity = capacity
+            # Refreshes recency if already present
+            memory.remember(content_id, impression)
         except Exception:
             # Fallback: do nothing on unexpected mapping issues
             pass
@@ -250,6 +259,35 @@ class Agent:
         self.beliefs.apply_delta(delta)
         return False
 
+    def _read_propensity(self, is_physical: bool) -> float:
+        try:
+            prefs = getattr(self, "activity", None)
+            read_pref = float(getattr(prefs, "read_propensity", 0.5)) if prefs else 0.5
+        except Exception:
+            read_pref = 0.5
+        if is_physical:
+            read_pref = min(1.0, 0.05 + 1.1 * read_pref)
+        return read_pref
+
+    def _build_impression(self, content: ContentItem, context: "WorldContext", is_physical: bool) -> Impression:
+        cache = None
+        try:
+            cache = context.impression_template_cache()
+        except Exception:
+            cache = None
+        impression = self.attention.evaluate(content, is_physical=is_physical, cache=cache)
+
+        # mark self-source for downstream logic
+        try:
+            if content.author_id == self.id:
+                impression.is_self_source = True
+        except Exception:
+            pass
+
+        # apply political identity context (may raise identity_threat)
+        self._apply_political_context(context, impression)
+        return impression
+
     def plan_perception(
         self,
         content: ContentItem,
@@ -261,33 +299,26 @@ class Agent:
     ) -> PerceptionPlan:
         """
         Compute a perception plan without mutating shared state.
-        """
-        impression = self.attention.evaluate(content, is_physical=is_physical)
 
-        # mark self-source for downstream logic
-        try:
-            if content.author_id == self.id:
-                setattr(impression, "is_self_source", True)
-        except Exception:
-            pass
-
-        # apply political identity context (may raise identity_threat)
-        self._apply_political_context(context, impression)
-
-        try:
-            prefs = getattr(self, "activity", None)
-            read_pref = float(getattr(prefs, "read_propensity", 0.5)) if prefs else 0.5
-        except Exception:
-            read_pref = 0.5
-        if is_physical:
-            read_pref = min(1.0, 0.05 + 1.1 * read_pref)
-
-        exposed = self.rng.random() < read_pref
+        Staged: the exposure roll only needs the read propensity, so the Impression
+        (attention evaluation, self-source mark, political threat, cost estimate) is
+        built only for exposed items. Neither stage draws from the rng, so the draw
+        sequence and the resulting plans are the same as evaluating first; plans
+        for unexposed items carry impression=None.
+        """
+        exposed = self.rng.random() < self._read_propensity(is_physical)
         if not exposed:
+            # Evaluation used to create the topic in the GSR for every item; keep that.
+            gsr = getattr(context, "gsr", None)
+            if gsr is not None:
+                try:
+                    gsr.ensure_topic(content.topic)
+                except Exception:
+                    pass
             return PerceptionPlan(
                 agent_id=self.id,
                 content=content,
-                impression=impression,
+                impression=None,
                 is_physical=is_physical,
                 stimulus_id=stimulus_id,
                 exposed=False,
@@ -300,6 +331,8 @@ class Agent:
                 old_stance=0.0,
             )
 
+        impression = self._build_impression(content, context, is_physical)
+
         consumed_prob = self._clamp01(float(getattr(impression, "consumed_prob", 1.0)))
         consumed_roll = self.rng.random() < consumed_prob
         attention_cost = float(getattr(impression, "attention_cost_minutes", 0.0))
@@ -384,7 +417,7 @@ class Agent:
         )
 
         # Record for daily dream
-        self.daily_impressions_consumed.append(impression)
+        self.daily_digest.add(impression)
 
         if plan.belief_delta is None:
             return
@@ -505,21 +538,14 @@ class Agent:
         """
         Daily consolidation ("dreaming / reflection").
         """
-        if not self.daily_impressions_consumed:
+        digest = self.daily_digest
+        if not digest:
             return
 
-        self.identity.consolidate_from_impressions(
-            self.daily_impressions_consumed,
-            rng=self.rng,
-            max_samples=30,
-        )
+        self.identity.consolidate_from_sample(digest.sample(), rng=self.daily_rng)
 
-        counts: dict[str, int] = {}
-        sums: dict[str, float] = {}
-        for imp in self.daily_impressions_consumed:
-            t = str(getattr(imp, "topic", ""))
-            counts[t] = counts.get(t, 0) + 1
-            sums[t] = sums.get(t, 0.0) + float(getattr(imp, "stance_signal", 0.0))
+        counts = digest.topic_counts
+        sums = digest.topic_stance_sums
 
         for topic, c in counts.items():
             self.beliefs.nudge_salience(topic, 0.02 * min(10, c))
@@ -541,7 +567,7 @@ class Agent:
             world_context.analytics.log_dream(
                 timestamp=world_context.clock.t,
                 agent_id=self.id,
-                consolidated=len(self.daily_impressions_consumed),
+                consolidated=digest.count,
                 topic_counts=counts,
                 actions=len(self.daily_actions),
             )
@@ -555,5 +581,5 @@ class Agent:
         self.dream(world_context)
         self.budgets.regen_daily()
 
-        self.daily_impressions_consumed.clear()
+        self.daily_digest.reset()
         self.daily_actions.clear()
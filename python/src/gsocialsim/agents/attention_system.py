@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import copy
+from typing import Any, Dict, Optional, Tuple
+
 from gsocialsim.stimuli.content_item import ContentItem
 from gsocialsim.agents.impression import Impression, IntakeMode
 from gsocialsim.stimuli.stimulus import MediaType
@@ -14,9 +17,16 @@ class AttentionSystem:
       - Provide consumed_prob and interact_prob based on media_type and intake_mode
 
     Contract helper:
-      - Attach a suggested attention_cost_minutes (dynamic attribute) to the Impression.
-        This lets Agent.perceive() enforce per-tick attention budgets without changing
-        the Impression dataclass yet.
+      - Fill in the Impression's suggested attention_cost_minutes.
+        This lets Agent.perceive() enforce per-tick attention budgets.
+
+    Flyweight:
+      - Everything evaluate() computes depends only on the content and the intake
+        mode, so one template per (content, intake mode) is shared by all viewers
+        and evaluate() hands out a shallow copy for per-viewer overrides
+        (is_self_source, political threat). The cache is owned by the caller,
+        normally the per-tick dict from WorldContext.impression_template_cache();
+        without one every call evaluates afresh.
     """
 
     _BASE_CONSUME = {
@@ -100,9 +110,39 @@ class AttentionSystem:
     def _clamp01(x: float) -> float:
         return max(0.0, min(1.0, x))
 
-    def evaluate(self, content: ContentItem, is_physical: bool = False) -> Impression:
+    def template(
+        self,
+        content: ContentItem,
+        is_physical: bool = False,
+        cache: Optional[Dict[Any, Tuple[ContentItem, Impression]]] = None,
+    ) -> Impression:
+        """
+        Content-level Impression, shared through `cache` when given; do not mutate
+        a cached template (evaluate() returns a copy).
+        """
         intake_mode = IntakeMode.PHYSICAL if is_physical else IntakeMode.SCROLL
+        if cache is None:
+            return self._evaluate(content, intake_mode)
+        key = (type(self), id(content), intake_mode)
+        hit = cache.get(key)
+        # The content reference held in the entry keeps id(content) from being reused.
+        if hit is not None and hit[0] is content:
+            return hit[1]
+        imp = self._evaluate(content, intake_mode)
+        cache[key] = (content, imp)
+        return imp
 
+    def evaluate(
+        self,
+        content: ContentItem,
+        is_physical: bool = False,
+        cache: Optional[Dict[Any, Tuple[ContentItem, Impression]]] = None,
+    ) -> Impression:
+        if cache is None:
+            return self.template(content, is_physical=is_physical)
+        return copy.copy(self.template(content, is_physical=is_physical, cache=cache))
+
+    def _evaluate(self, content: ContentItem, intake_mode: IntakeMode) -> Impression:
         mt = getattr(content, "media_type", MediaType.UNKNOWN)
         if not isinstance(mt, MediaType):
             try:
@@ -145,6 +185,11 @@ class AttentionSystem:
         except Exception:
             identity_threat = 0.0
 
+        # Contract helper: estimated attention time cost in minutes
+        base_cost = float(self._BASE_ATTENTION_COST_MIN.get(mt, self._BASE_ATTENTION_COST_MIN[MediaType.UNKNOWN]))
+        mult = float(self._INTAKE_COST_MULT.get(intake_mode, 1.0))
+        attention_cost_minutes = max(0.0, base_cost * mult)
+
         imp = Impression(
             intake_mode=intake_mode,
             content_id=content.id,
@@ -160,18 +205,7 @@ class AttentionSystem:
             consumed_prob=consumed_prob,
             interact_prob=interact_prob,
             primal_activation=primal_activation,
+            attention_cost_minutes=attention_cost_minutes,
         )
         imp.clamp()
-
-        # Attach contract helper: estimated attention time cost in minutes
-        base_cost = float(self._BASE_ATTENTION_COST_MIN.get(mt, self._BASE_ATTENTION_COST_MIN[MediaType.UNKNOWN]))
-        mult = float(self._INTAKE_COST_MULT.get(intake_mode, 1.0))
-        attention_cost_minutes = max(0.0, base_cost * mult)
-
-        # Dynamic attribute: safe with existing Impression dataclass
-        try:
-            setattr(imp, "attention_cost_minutes", attention_cost_minutes)
-        except Exception:
-            pass
-
         return imp
@@ -5,6 +5,7 @@ from typing import Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from gsocialsim.agents.belief_update_engine import BeliefDelta
+    from gsocialsim.agents.belief_tensor import BeliefTensor
 
 TopicId = str
 
@@ -30,13 +31,64 @@ class BeliefStore:
     Contract note:
     - apply_delta() must be pure state mutation (no logging, no side effects).
     - WorldKernel CONSOLIDATE(t) is responsible for calling apply_delta() for queued deltas.
+
+    Storage:
+    - Standalone stores keep a dict of TopicBelief objects.
+    - bind() turns the store into a thin view over one row of a population-level
+      BeliefTensor; `topics` then becomes a dict-like view and get() returns live
+      TopicBelief-compatible views.
     """
     topics: Dict[TopicId, TopicBelief] = field(default_factory=dict)
+    _tensor: Optional["BeliefTensor"] = field(default=None, init=False, repr=False, compare=False)
+    _row: int = field(default=-1, init=False, repr=False, compare=False)
+
+    # ---- Tensor binding ----
+    @property
+    def tensor(self) -> Optional["BeliefTensor"]:
+        return self._tensor
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    def bind(self, tensor: "BeliefTensor", row: int) -> None:
+        """Move existing beliefs into `tensor` row `row` and become a view over it."""
+        from gsocialsim.agents.belief_tensor import TensorTopicsView
+
+        existing = list(self.topics.items())
+        self._tensor = tensor
+        self._row = int(row)
+        for topic_id, b in existing:
+            tensor.set(self._row, topic_id, b.stance, b.confidence, b.salience, b.knowledge)
+        self.topics = TensorTopicsView(tensor, self._row)  # type: ignore[assignment]
+
+    def unbind(self) -> None:
+        """Copy beliefs back into a private dict and detach from the tensor."""
+        if self._tensor is None:
+            return
+        snapshot = {
+            topic_id: TopicBelief(
+                topic=topic_id,
+                stance=b.stance,
+                confidence=b.confidence,
+                salience=b.salience,
+                knowledge=b.knowledge,
+            )
+            for topic_id, b in self.topics.items()
+        }
+        self._tensor = None
+        self._row = -1
+        self.topics = snapshot
 
     def get(self, topic_id: TopicId) -> Optional[TopicBelief]:
+        if self._tensor is not None:
+            return self._tensor.get(self._row, topic_id)  # type: ignore[return-value]
         return self.topics.get(topic_id)
 
     def update(self, topic_id: TopicId, stance: float, confidence: float, salience: float, knowledge: float) -> None:
+        if self._tensor is not None:
+            self._tensor.set(self._row, topic_id, stance, confidence, salience, knowledge)
+            return
         belief = self.topics.get(topic_id)
         if belief is None:
             belief = TopicBelief(topic=topic_id)
@@ -56,6 +108,9 @@ class BeliefStore:
         - Clamps stance/confidence.
         """
         topic_id = delta.topic_id
+        if self._tensor is not None:
+            self._tensor.apply_delta(self._row, topic_id, delta.stance_delta, delta.confidence_delta)
+            return
         belief = self.topics.get(topic_id)
 
         if belief is None:
@@ -69,6 +124,9 @@ class BeliefStore:
 
     # ---- Consolidation helpers ----
     def nudge_salience(self, topic_id: TopicId, delta: float) -> None:
+        if self._tensor is not None:
+            self._tensor.nudge(self._row, topic_id, "salience", delta)
+            return
         belief = self.topics.get(topic_id)
         if belief is None:
             belief = TopicBelief(topic=topic_id)
@@ -76,6 +134,9 @@ class BeliefStore:
         belief.salience = _clamp(belief.salience + float(delta), 0.0, 1.0)
 
     def nudge_knowledge(self, topic_id: TopicId, delta: float) -> None:
+        if self._tensor is not None:
+            self._tensor.nudge(self._row, topic_id, "knowledge", delta)
+            return
         belief = self.topics.get(topic_id)
         if belief is None:
             belief = TopicBelief(topic=topic_id)
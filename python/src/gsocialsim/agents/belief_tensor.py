@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from gsocialsim.agents.belief_state import TopicId
+
+
+class BeliefTensor:
+    """
+    Population-level structure-of-arrays belief store.
+
+    Layout:
+      - stance / confidence / salience / knowledge: float32 [agent_rows x topics]
+      - present: bool [agent_rows x topics] (a belief "exists" for get() purposes)
+      - topics are interned to column indices (topic_index / topic_ids)
+      - each bound BeliefStore owns one row (row_owner[row] = agent id)
+      - row_cols[row] lists the row's present columns in creation order, so a
+        row iterates its topics like the dict it replaces (a cleared topic that
+        comes back moves to the end)
+
+    Arrays grow by doubling; views handed out by column() are invalidated by growth.
+    """
+
+    FIELDS = ("stance", "confidence", "salience", "knowledge")
+
+    def __init__(self, agent_capacity: int = 1024, topic_capacity: int = 16) -> None:
+        rows = max(1, int(agent_capacity))
+        cols = max(1, int(topic_capacity))
+        self.stance = np.zeros((rows, cols), dtype=np.float32)
+        self.confidence = np.zeros((rows, cols), dtype=np.float32)
+        self.salience = np.zeros((rows, cols), dtype=np.float32)
+        self.knowledge = np.zeros((rows, cols), dtype=np.float32)
+        self.present = np.zeros((rows, cols), dtype=np.bool_)
+
+        self.topic_ids: List[TopicId] = []
+        self.topic_index: Dict[TopicId, int] = {}
+        self.row_owner: List[Optional[str]] = []
+        self.row_cols: List[List[int]] = []
+        self._free_rows: List[int] = []
+
+    # ----------------------------
+    # Shape management
+    # ----------------------------
+    @property
+    def n_rows(self) -> int:
+        return len(self.row_owner)
+
+    @property
+    def n_topics(self) -> int:
+        return len(self.topic_ids)
+
+    def _grow(self, rows: int, cols: int) -> None:
+        cur_rows, cur_cols = self.stance.shape
+        if rows <= cur_rows and cols <= cur_cols:
+            return
+        new_rows = cur_rows
+        while new_rows < rows:
+            new_rows *= 2
+        new_cols = cur_cols
+        while new_cols < cols:
+            new_cols *= 2
+        for name in self.FIELDS + ("present",):
+            old = getattr(self, name)
+            new = np.zeros((new_rows, new_cols), dtype=old.dtype)
+            new[:cur_rows, :cur_cols] = old
+            setattr(self, name, new)
+
+    def intern(self, topic_id: TopicId) -> int:
+        col = self.topic_index.get(topic_id)
+        if col is None:
+            col = len(self.topic_ids)
+            self._grow(self.stance.shape[0], col + 1)
+            self.topic_ids.append(topic_id)
+            self.topic_index[topic_id] = col
+        return col
+
+    def allocate_row(self, owner: Optional[str] = None) -> int:
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self.row_owner[row] = owner
+            return row
+        row = len(self.row_owner)
+        self._grow(row + 1, self.stance.shape[1])
+        self.row_owner.append(owner)
+        self.row_cols.append([])
+        return row
+
+    def release_row(self, row: int) -> None:
+        if row < 0 or row >= len(self.row_owner) or self.row_owner[row] is None:
+            return
+        for name in self.FIELDS + ("present",):
+            getattr(self, name)[row, :] = 0
+        self.row_owner[row] = None
+        self.row_cols[row] = []
+        self._free_rows.append(row)
+
+    # ----------------------------
+    # Row (single agent) API
+    # ----------------------------
+    def has(self, row: int, topic_id: TopicId) -> bool:
+        col = self.topic_index.get(topic_id)
+        return col is not None and bool(self.present[row, col])
+
+    def get(self, row: int, topic_id: TopicId) -> Optional["TopicBeliefView"]:
+        col = self.topic_index.get(topic_id)
+        if col is None or not self.present[row, col]:
+            return None
+        return TopicBeliefView(self, row, col)
+
+    def set(self, row: int, topic_id: TopicId, stance: float, confidence: float, salience: float, knowledge: float) -> None:
+        col = self.intern(topic_id)
+        self.stance[row, col] = min(1.0, max(-1.0, float(stance)))
+        self.confidence[row, col] = min(1.0, max(0.0, float(confidence)))
+        self.salience[row, col] = min(1.0, max(0.0, float(salience)))
+        self.knowledge[row, col] = min(1.0, max(0.0, float(knowledge)))
+        self.mark_present(row, col)
+
+    def ensure(self, row: int, topic_id: TopicId) -> int:
+        """Create a zero-initialized belief if missing; returns the column index."""
+        col = self.intern(topic_id)
+        if not self.present[row, col]:
+            self.stance[row, col] = 0.0
+            self.confidence[row, col] = 0.0
+            self.salience[row, col] = 0.0
+            self.knowledge[row, col] = 0.0
+            self.mark_present(row, col)
+        return col
+
+    def mark_present(self, row: int, col: int) -> None:
+        """Flag (row, col) as an existing belief, appending it to the row's topic order."""
+        if not self.present[row, col]:
+            self.present[row, col] = True
+            self.row_cols[row].append(col)
+
+    def clear(self, row: int, topic_id: TopicId) -> bool:
+        col = self.topic_index.get(topic_id)
+        if col is None or not self.present[row, col]:
+            return False
+        self.present[row, col] = False
+        self.row_cols[row].remove(col)
+        self.stance[row, col] = 0.0
+        self.confidence[row, col] = 0.0
+        self.salience[row, col] = 0.0
+        self.knowledge[row, col] = 0.0
+        return True
+
+    def apply_delta(self, row: int, topic_id: TopicId, stance_delta: float, confidence_delta: float) -> None:
+        col = self.ensure(row, topic_id)
+        s = float(self.stance[row, col]) + float(stance_delta)
+        c = float(self.confidence[row, col]) + float(confidence_delta)
+        self.stance[row, col] = min(1.0, max(-1.0, s))
+        self.confidence[row, col] = min(1.0, max(0.0, c))
+
+    def nudge(self, row: int, topic_id: TopicId, field_name: str, delta: float) -> None:
+        col = self.ensure(row, topic_id)
+        arr = getattr(self, field_name)
+        arr[row, col] = min(1.0, max(0.0, float(arr[row, col]) + float(delta)))
+
+    def row_topics(self, row: int) -> List[TopicId]:
+        """The row's topics in creation order (see row_cols)."""
+        ids = self.topic_ids
+        return [ids[c] for c in self.row_cols[row]]
+
+    # ----------------------------
+    # Column (whole population) API
+    # ----------------------------
+    def column(self, topic_id: TopicId, field_name: str = "stance") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (values, present) views for one topic across all allocated rows.
+        Rows without the belief hold 0.0 and present=False.
+        """
+        n = self.n_rows
+        col = self.topic_index.get(topic_id)
+        if col is None:
+            return np.zeros(n, dtype=np.float32), np.zeros(n, dtype=np.bool_)
+        return getattr(self, field_name)[:n, col], self.present[:n, col]
+
+    def field_matrix(self, field_name: str = "stance") -> np.ndarray:
+        """[rows x topics] view of one field for the allocated region."""
+        return getattr(self, field_name)[: self.n_rows, : self.n_topics]
+
+
+class TopicBeliefView:
+    """
+    Live TopicBelief-compatible view of one (row, topic) cell of a BeliefTensor.
+    Reads and writes go straight to the arrays (values are exposed as Python floats).
+    """
+
+    __slots__ = ("_tensor", "_row", "_col")
+
+    def __init__(self, tensor: BeliefTensor, row: int, col: int) -> None:
+        self._tensor = tensor
+        self._row = row
+        self._col = col
+
+    @property
+    def topic(self) -> TopicId:
+        return self._tensor.topic_ids[self._col]
+
+    def _read(self, name: str) -> float:
+        return float(getattr(self._tensor, name)[self._row, self._col])
+
+    def _write(self, name: str, value: float) -> None:
+        getattr(self._tensor, name)[self._row, self._col] = float(value)
+
+    stance = property(lambda self: self._read("stance"), lambda self, v: self._write("stance", v))
+    confidence = property(lambda self: self._read("confidence"), lambda self, v: self._write("confidence", v))
+    salience = property(lambda self: self._read("salience"), lambda self, v: self._write("salience", v))
+    knowledge = property(lambda self: self._read("knowledge"), lambda self, v: self._write("knowledge", v))
+
+    def __repr__(self) -> str:
+        return (
+            f"TopicBelief(topic={self.topic!r}, stance={self.stance}, confidence={self.confidence}, "
+            f"salience={self.salience}, knowledge={self.knowledge})"
+        )
+
+
+class TensorTopicsView:
+    """
+    Mapping view that lets BeliefStore.topics keep its dict-like API when bound to a BeliefTensor.
+    """
+
+    __slots__ = ("_tensor", "_row")
+
+    def __init__(self, tensor: BeliefTensor, row: int) -> None:
+        self._tensor = tensor
+        self._row = row
+
+    def __getitem__(self, topic_id: TopicId) -> TopicBeliefView:
+        b = self._tensor.get(self._row, topic_id)
+        if b is None:
+            raise KeyError(topic_id)
+        return b
+
+    def __setitem__(self, topic_id: TopicId, belief) -> None:
+        self._tensor.set(
+            self._row,
+            topic_id,
+            getattr(belief, "stance", 0.0),
+            getattr(belief, "confidence", 0.0),
+            getattr(belief, "salience", 0.0),
+            getattr(belief, "knowledge", 0.0),
+        )
+
+    def __delitem__(self, topic_id: TopicId) -> None:
+        if not self._tensor.clear(self._row, topic_id):
+            raise KeyError(topic_id)
+
+    def __contains__(self, topic_id: object) -> bool:
+        return self._tensor.has(self._row, topic_id)  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[TopicId]:
+        return iter(self._tensor.row_topics(self._row))
+
+    def __len__(self) -> int:
+        return len(self._tensor.row_cols[self._row])
+
+    def __bool__(self) -> bool:
+        return bool(self._tensor.row_cols[self._row])
+
+    def get(self, topic_id: TopicId, default=None):
+        b = self._tensor.get(self._row, topic_id)
+        return default if b is None else b
+
+    def keys(self) -> List[TopicId]:
+        return self._tensor.row_topics(self._row)
+
+    def values(self) -> List[TopicBeliefView]:
+        t = self._tensor
+        return [TopicBeliefView(t, self._row, t.topic_index[k]) for k in t.row_topics(self._row)]
+
+    def items(self) -> List[Tuple[TopicId, TopicBeliefView]]:
+        t = self._tensor
+        return [(k, TopicBeliefView(t, self._row, t.topic_index[k])) for k in t.row_topics(self._row)]
+
+    def pop(self, topic_id: TopicId, *default):
+        b = self._tensor.get(self._row, topic_id)
+        if b is None:
+            if default:
+                return default[0]
+            raise KeyError(topic_id)
+        snapshot = _snapshot(b)
+        self._tensor.clear(self._row, topic_id)
+        return snapshot
+
+    def __repr__(self) -> str:
+        return repr({k: _snapshot(v) for k, v in self.items()})
+
+
+def _snapshot(view: TopicBeliefView):
+    from gsocialsim.agents.belief_state import TopicBelief
+
+    return TopicBelief(
+        topic=view.topic,
+        stance=view.stance,
+        confidence=view.confidence,
+        salience=view.salience,
+        knowledge=view.knowledge,
+    )
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+"""
+Streaming accumulators for the daily consolidation ("dream").
+
+Agents used to keep every consumed Impression in a list until the day
+boundary, where dream() walked it for per-topic counts and stance sums and
+IdentityState drew a weighted sample of up to 30 impressions from it. A
+DailyDigest keeps the same information in constant memory, updated on each
+consumption:
+
+  - count, plus per-topic consumption count and stance_signal sum;
+  - a bounded weighted reservoir (Efraimidis-Spirakis A-Res): item i gets the
+    key log(u_i) / w_i with w_i = IdentityState.consolidation_weight and the
+    `max_samples` largest keys are kept in a min-heap. This draws the same
+    distribution as repeatedly picking proportional to weight without
+    replacement, which is what consolidate_from_impressions() does.
+
+The uniforms come from a dedicated, clock-free sub-stream of the agent's rng,
+so sampling never shifts the agent's other draws within a tick.
+"""
+
+import heapq
+import math
+from typing import Any, Dict, List, Tuple
+
+from gsocialsim.agents.identity_state import IdentityState
+from gsocialsim.agents.impression import Impression
+
+
+class DailyDigest:
+    __slots__ = ("max_samples", "count", "topic_counts", "topic_stance_sums", "_rng", "_reservoir")
+
+    def __init__(self, rng: Any, max_samples: int = 30) -> None:
+        self.max_samples = max(0, int(max_samples))
+        self._rng = rng
+        self.count = 0
+        self.topic_counts: Dict[str, int] = {}
+        self.topic_stance_sums: Dict[str, float] = {}
+        # (key, arrival index, impression); the index breaks key ties deterministically.
+        self._reservoir: List[Tuple[float, int, Impression]] = []
+
+    def add(self, impression: Impression) -> None:
+        topic = str(getattr(impression, "topic", ""))
+        self.topic_counts[topic] = self.topic_counts.get(topic, 0) + 1
+        self.topic_stance_sums[topic] = self.topic_stance_sums.get(topic, 0.0) + float(
+            getattr(impression, "stance_signal", 0.0)
+        )
+
+        if self.max_samples > 0:
+            # 1 - random() is in (0, 1], so the log is finite.
+            key = math.log(1.0 - self._rng.random()) / IdentityState.consolidation_weight(impression)
+            entry = (key, self.count, impression)
+            if len(self._reservoir) < self.max_samples:
+                heapq.heappush(self._reservoir, entry)
+            elif key > self._reservoir[0][0]:
+                heapq.heapreplace(self._reservoir, entry)
+        self.count += 1
+
+    def extend(self, impressions) -> None:
+        for imp in impressions:
+            self.add(imp)
+
+    def sample(self) -> List[Impression]:
+        """The weighted sample, in draw order (largest key first)."""
+        return [imp for _, _, imp in sorted(self._reservoir, key=lambda e: (-e[0], e[1]))]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+    def reset(self) -> None:
+        # Fresh dicts: the previous day's may still be referenced (e.g. by analytics).
+        self.count = 0
+        self.topic_counts = {}
+        self.topic_stance_sums = {}
+        self._reservoir = []
+
+    def __repr__(self) -> str:
+        return f"DailyDigest(count={self.count}, topics={len(self.topic_counts)}, sampled={len(self._reservoir)})"
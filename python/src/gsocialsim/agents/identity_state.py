@@ -37,6 +37,15 @@ class IdentityState:
         # Deterministic mapping to a dimension (stable across runs).
         return abs(hash(topic)) % max(1, dims)
 
+    @staticmethod
+    def consolidation_weight(imp: Impression) -> float:
+        """Sampling weight of an impression for consolidation."""
+        # Emphasize identity threat + arousal + social proof.
+        it = float(getattr(imp, "identity_threat", 0.0))
+        ar = float(getattr(imp, "arousal", 0.0))
+        sp = float(getattr(imp, "social_proof", 0.0))
+        return max(0.0001, 0.2 + 0.5 * it + 0.3 * ar + 0.2 * sp)
+
     def consolidate_from_impressions(
         self,
         impressions: Iterable[Impression],
@@ -59,20 +68,9 @@ class IdentityState:
         if not imps:
             return
 
-        dims = len(self.identity_vector) if self.identity_vector else 8
-        if not self.identity_vector:
-            self.identity_vector = [0.0] * dims
-
         # Weighted sample of impressions for consolidation.
-        def weight(imp: Impression) -> float:
-            # Emphasize identity threat + arousal + social proof.
-            it = float(getattr(imp, "identity_threat", 0.0))
-            ar = float(getattr(imp, "arousal", 0.0))
-            sp = float(getattr(imp, "social_proof", 0.0))
-            return 0.2 + 0.5 * it + 0.3 * ar + 0.2 * sp
-
         pool = imps[:]
-        weights = [max(0.0001, weight(x)) for x in pool]
+        weights = [self.consolidation_weight(x) for x in pool]
         k = min(max_samples, len(pool))
 
         chosen: List[Impression] = []
@@ -83,6 +81,17 @@ class IdentityState:
             chosen.append(pool.pop(idx))
             weights.pop(idx)
 
+        self.consolidate_from_sample(chosen, rng)
+
+    def consolidate_from_sample(self, chosen: Iterable[Impression], rng: random.Random) -> None:
+        """
+        Consolidation step on an already drawn weighted sample (e.g. the
+        agent's DailyDigest reservoir).
+        """
+        dims = len(self.identity_vector) if self.identity_vector else 8
+        if not self.identity_vector:
+            self.identity_vector = [0.0] * dims
+
         # Aggregate consolidation signals.
         total_w = 0.0
         threat_w = 0.0
@@ -92,7 +101,7 @@ class IdentityState:
             topic = str(getattr(imp, "topic", ""))
             dim = self._topic_to_dim(topic, dims)
 
-            w = max(0.0001, weight(imp))
+            w = self.consolidation_weight(imp)
             total_w += w
 
             it = float(getattr(imp, "identity_threat", 0.0))
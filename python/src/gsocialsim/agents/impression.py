@@ -1,5 +1,6 @@
 from enum import Enum
-from dataclasses import dataclass
+from operator import attrgetter
+from dataclasses import dataclass, field
 from typing import Optional
 
 from gsocialsim.types import ContentId, TopicId
@@ -14,7 +15,7 @@ class IntakeMode(Enum):
     DEEP_FOCUS = "deep_focus" # Focused, expensive processing
 
 
-@dataclass
+@dataclass(slots=True)
 class Impression:
     """
     A richer representation of an agent's internal reaction to a ContentItem/Stimulus.
@@ -23,6 +24,10 @@ class Impression:
     New fields (safe defaults):
       - media_type
       - consumed_prob / interact_prob (separate knobs)
+
+    Slotted: millions of these are built per run and kept in working memory, so
+    the attributes that used to be attached with setattr (attention cost,
+    self-source flag) are declared fields rather than forcing a __dict__.
     """
     intake_mode: IntakeMode
     content_id: ContentId
@@ -43,6 +48,19 @@ class Impression:
     interact_prob: float = 0.0              # Probability agent interacts (like/comment/reshare/reply)
     primal_activation: float = 0.0          # Neuromarketing-style activation [0,1]
 
+    # Per-perception annotations (not part of equality, like the old dynamic attributes)
+    attention_cost_minutes: float = field(default=0.0, compare=False)  # Set by AttentionSystem
+    is_self_source: bool = field(default=False, compare=False)         # Viewer authored the content
+    _is_threatening_hack: bool = field(default=False, compare=False, repr=False)  # Legacy threat override
+
+    def __copy__(self) -> "Impression":
+        # copy.copy() of a slotted object goes through __reduce_ex__; copying the
+        # slots directly is what per-viewer copies of shared templates need.
+        new = object.__new__(type(self))
+        for name, value in zip(_FIELD_NAMES, _get_fields(self)):
+            setattr(new, name, value)
+        return new
+
     def clamp(self) -> None:
         """Keep probabilities and bounded signals sane."""
         self.arousal = max(0.0, min(1.0, self.arousal))
@@ -53,3 +71,7 @@ class Impression:
         self.consumed_prob = max(0.0, min(1.0, self.consumed_prob))
         self.interact_prob = max(0.0, min(1.0, self.interact_prob))
         self.primal_activation = max(0.0, min(1.0, self.primal_activation))
+
+
+_FIELD_NAMES = Impression.__slots__
+_get_fields = attrgetter(*_FIELD_NAMES)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+"""
+Bounded, recency-ordered working memory of recent impressions.
+
+Agent.recent_impressions used to be an OrderedDict capped by a
+move_to_end / popitem loop on every exposure, and the policy copied all of its
+keys into a list every time it generated an action. WorkingMemory keeps the
+same contents (the last `capacity` distinct content ids, most recent last, a
+re-seen id moving to the end) in two parallel slot lists that grow on demand:
+
+  - remember() appends a slot and tombstones the id's previous slot, evicting
+    from the oldest end once more than `capacity` ids are live;
+  - when the lists reach 2*capacity slots the live slots are compacted, which
+    at most every `capacity` inserts costs O(capacity), so inserts are
+    amortized O(1) and an agent never holds more than 2*capacity slots;
+  - last_ids(k) walks back from the newest slot, so the policy's "last k"
+    costs O(k) regardless of capacity.
+
+Nothing is preallocated: an agent that has not perceived anything holds two
+empty lists, which matters at population scale.
+
+It is a MutableMapping (content id -> Impression) iterating oldest to newest,
+so code and checkpoints that treated recent_impressions as a dict still work;
+assignment always makes the id the most recent one.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class WorkingMemory(MutableMapping):
+    __slots__ = ("_capacity", "_ids", "_items", "_start", "_pos")
+
+    def __init__(self, capacity: int = 200) -> None:
+        self._capacity = max(1, int(capacity))
+        self._ids: List[Optional[str]] = []  # None marks a dead slot
+        self._items: List[Any] = []
+        self._start = 0  # oldest live slot (== len(_ids) when empty)
+        self._pos: Dict[str, int] = {}  # content id -> slot
+
+    # -------------------------
+    # Capacity
+    # -------------------------
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int) -> None:
+        value = max(1, int(value))
+        if value == self._capacity:
+            return
+        self._capacity = value
+        while len(self._pos) > value:
+            self._evict_oldest()
+        if len(self._ids) >= 2 * value:
+            self._compact()
+
+    # -------------------------
+    # Writes
+    # -------------------------
+    def remember(self, content_id: str, impression: Any) -> None:
+        """Store impression as the most recent entry for content_id."""
+        slot = self._pos.get(content_id)
+        if slot is not None:
+            self._ids[slot] = None
+            self._items[slot] = None
+            if slot == self._start:
+                self._skip_dead()
+        if len(self._ids) >= 2 * self._capacity:
+            self._compact()
+        self._pos[content_id] = len(self._ids)
+        self._ids.append(content_id)
+        self._items.append(impression)
+        if len(self._pos) > self._capacity:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        slot = self._start
+        del self._pos[self._ids[slot]]
+        self._ids[slot] = None
+        self._items[slot] = None
+        self._skip_dead()
+
+    def _skip_dead(self) -> None:
+        ids = self._ids
+        i = self._start
+        end = len(ids)
+        while i < end and ids[i] is None:
+            i += 1
+        self._start = i
+
+    def _compact(self) -> None:
+        ids: List[Optional[str]] = []
+        items: List[Any] = []
+        pos: Dict[str, int] = {}
+        for i in range(self._start, len(self._ids)):
+            k = self._ids[i]
+            if k is not None:
+                pos[k] = len(ids)
+                ids.append(k)
+                items.append(self._items[i])
+        self._ids = ids
+        self._items = items
+        self._pos = pos
+        self._start = 0
+
+    # -------------------------
+    # Reads
+    # -------------------------
+    def last_ids(self, k: int = 0) -> List[str]:
+        """The k most recent content ids, oldest first (all of them when k <= 0)."""
+        if k <= 0 or k >= len(self._pos):
+            return list(self)
+        out: List[str] = []
+        ids = self._ids
+        i = len(ids) - 1
+        while len(out) < k:
+            cid = ids[i]
+            if cid is not None:
+                out.append(cid)
+            i -= 1
+        out.reverse()
+        return out
+
+    # -------------------------
+    # Mapping protocol
+    # -------------------------
+    def __getitem__(self, content_id: str) -> Any:
+        return self._items[self._pos[content_id]]
+
+    def __setitem__(self, content_id: str, impression: Any) -> None:
+        self.remember(content_id, impression)
+
+    def __delitem__(self, content_id: str) -> None:
+        slot = self._pos.pop(content_id)
+        self._ids[slot] = None
+        self._items[slot] = None
+        if slot == self._start:
+            self._skip_dead()
+
+    def __contains__(self, content_id: object) -> bool:
+        return content_id in self._pos
+
+    def __len__(self) -> int:
+        return len(self._pos)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([k for k in self._ids[self._start :] if k is not None])
+
+    def clear(self) -> None:
+        self._ids = []
+        self._items = []
+        self._pos = {}
+        self._start = 0
+
+    def __repr__(self) -> str:
+        return f"WorkingMemory(len={len(self._pos)}, capacity={self._capacity})"
@@ -5,7 +5,7 @@ from collections import defaultdict, deque
 from gsocialsim.types import AgentId, TopicId, ActorId
 
 
-@dataclass
+@dataclass(slots=True)
 class ExposureEvent:
     timestamp: int
     source_actor_id: ActorId
@@ -55,6 +55,10 @@ class BeliefCrossingDetector:
         # Simple: sign-crossing
         return (old_stance <= 0 and new_stance > 0) or (old_stance >= 0 and new_stance < 0)
 
+    def check_many(self, old_stance, new_stance):
+        """Vectorized check() over aligned NumPy arrays; returns a bool mask."""
+        return ((old_stance <= 0) & (new_stance > 0)) | ((old_stance >= 0) & (new_stance < 0))
+
 
 class AttributionEngine:
     """
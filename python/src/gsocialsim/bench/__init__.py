@@ -0,0 +1,32 @@
+"""
+Scaling benchmarks for the Python kernel.
+
+    python -m gsocialsim.bench --agents 1k,10k --ticks 10 --out bench.json
+    python -m gsocialsim.bench --agents 1k,10k --ticks 10 --out new.json --compare bench.json
+
+See bench/scenario.py for the synthetic scenarios and bench/runner.py for the
+baseline JSON format.
+"""
+
+from gsocialsim.bench.runner import (
+    BenchCase,
+    compare_baselines,
+    load_baseline,
+    run_case,
+    run_cases,
+    write_baseline,
+)
+from gsocialsim.bench.scenario import MODES, BenchScenario, SyntheticDataSource, build_kernel
+
+__all__ = [
+    "BenchCase",
+    "BenchScenario",
+    "MODES",
+    "SyntheticDataSource",
+    "build_kernel",
+    "compare_baselines",
+    "load_baseline",
+    "run_case",
+    "run_cases",
+    "write_baseline",
+]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import List
+
+from gsocialsim.bench.runner import (
+    BACKEND_ALIASES,
+    BenchCase,
+    compare_baselines,
+    format_diff,
+    load_baseline,
+    regressions,
+    run_cases,
+    write_baseline,
+)
+from gsocialsim.bench.scenario import DEFAULT_MODES, MODES, BenchScenario
+
+
+def parse_size(text: str) -> int:
+    """'1000', '10k', '1M' -> int."""
+    s = text.strip().lower().replace("_", "")
+    mult = 1
+    if s.endswith("k"):
+        mult, s = 1_000, s[:-1]
+    elif s.endswith("m"):
+        mult, s = 1_000_000, s[:-1]
+    return int(float(s) * mult)
+
+
+def _csv(text: str) -> List[str]:
+    return [part.strip() for part in text.split(",") if part.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m gsocialsim.bench", description="gsocialsim kernel scaling benchmarks")
+    p.add_argument("--agents", type=str, default="1k,10k", help="Population sizes, e.g. 1k,10k,100k,1M.")
+    p.add_argument("--ticks", type=int, default=10, help="Timed ticks per case.")
+    p.add_argument("--warmup", type=int, default=1, help="Untimed ticks before timing starts.")
+    p.add_argument("--follow-degree", type=int, default=10, help="Accounts followed per agent.")
+    p.add_argument("--stimuli-per-tick", type=int, default=50, help="Exogenous stimuli per tick.")
+    p.add_argument("--broadcast-fraction", type=float, default=0.0, help="Share of stimuli seen by every agent.")
+    p.add_argument("--topics", type=int, default=4, help="Number of belief topics.")
+    p.add_argument("--seed", type=int, default=7, help="Scenario seed.")
+    p.add_argument("--life-cycle", action="store_true", help="Enable GeoWorld schedules (active-set filtering).")
+    p.add_argument(
+        "--max-perceptions",
+        type=int,
+        default=0,
+        help="WorldKernel.max_perceptions_per_tick for every case (0 = unbounded).",
+    )
+    p.add_argument(
+        "--modes",
+        type=str,
+        default=",".join(DEFAULT_MODES),
+        help=f"Kernel modes to run ({', '.join(MODES)}).",
+    )
+    p.add_argument(
+        "--fast",
+        type=str,
+        default="on,off",
+        help="Belief-delta backends: on (=cpp), off (=python), numpy. Unbuilt backends are recorded as unavailable.",
+    )
+    p.add_argument("--no-isolate", action="store_true", help="Run cases in-process (peak RSS is then cumulative).")
+    p.add_argument("--out", type=str, default="bench_baseline.json", help="Baseline JSON to write.")
+    p.add_argument("--compare", type=str, default=None, help="Previous baseline JSON to diff against.")
+    p.add_argument(
+        "--fail-over",
+        type=float,
+        default=None,
+        help="With --compare: exit 1 if ticks/s drops or peak RSS grows by more than this percent.",
+    )
+    return p
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    modes = _csv(args.modes)
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        print(f"unknown mode(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    backends = [BACKEND_ALIASES.get(b, b) for b in _csv(args.fast)]
+    bad = [b for b in backends if b not in ("cpp", "numpy", "python")]
+    if bad:
+        print(f"unknown backend(s): {', '.join(bad)}", file=sys.stderr)
+        return 2
+
+    overrides = {}
+    if args.max_perceptions:
+        overrides["max_perceptions_per_tick"] = int(args.max_perceptions)
+
+    cases: List[BenchCase] = []
+    for size in _csv(args.agents):
+        scenario = BenchScenario(
+            n_agents=parse_size(size),
+            follow_degree=args.follow_degree,
+            stimuli_per_tick=args.stimuli_per_tick,
+            broadcast_fraction=args.broadcast_fraction,
+            n_topics=args.topics,
+            seed=args.seed,
+            life_cycle=args.life_cycle,
+        )
+        for mode in modes:
+            for backend in backends:
+                cases.append(
+                    BenchCase(
+                        scenario=scenario,
+                        mode=mode,
+                        backend=backend,
+                        ticks=args.ticks,
+                        warmup=args.warmup,
+                        kernel_overrides=dict(overrides),
+                    )
+                )
+
+    results = run_cases(cases, isolate=not args.no_isolate, progress=lambda msg: print(msg, flush=True))
+    config = {k: v for k, v in vars(args).items() if k not in ("out", "compare", "fail_over")}
+    doc = write_baseline(args.out, results, config=config)
+    print(f"wrote {args.out}")
+
+    if args.compare:
+        diff = compare_baselines(load_baseline(args.compare), doc)
+        print(format_diff(diff))
+        if args.fail_over is not None:
+            bad_rows = regressions(diff, args.fail_over)
+            for case, metric, pct in bad_rows:
+                print(f"REGRESSION {case} {metric} {pct:+.1f}%", file=sys.stderr)
+            if bad_rows:
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
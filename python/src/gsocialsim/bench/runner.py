@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+"""
+Benchmark runner: one case = (scenario, kernel mode, belief-delta backend).
+
+Each case runs in its own forked child (when fork is available) so that its
+peak RSS is not polluted by earlier cases or by the runner itself; the child
+builds the kernel, runs `warmup` untimed ticks, then `ticks` timed ticks with
+the kernel's PerfTracker on, and pipes back a flat result dict.
+
+Baselines are plain JSON ({"meta": ..., "results": [...]}) so they can be
+committed and compared between revisions with compare_baselines().
+"""
+
+import datetime as _dt
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from gsocialsim.bench.scenario import MODES, BenchScenario, build_kernel
+from gsocialsim.fast import perception as fast
+from gsocialsim.kernel.sharding import fork_available, run_forked
+
+# Spans reported per case (see WorldKernel.step).
+PHASE_SPANS = (
+    "tick/reset_budgets",
+    "phase/ingest",
+    "phase/act_batch",
+    "phase/perceive_batch",
+    "phase/consolidate",
+    "tick/clear_buffers",
+)
+
+# "on" / "off" aliases for the fast-extension axis.
+BACKEND_ALIASES = {"on": "cpp", "off": "python"}
+
+
+@dataclass
+class BenchCase:
+    scenario: BenchScenario
+    mode: str
+    backend: str
+    ticks: int = 10
+    warmup: int = 1
+    kernel_overrides: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return f"{self.scenario.n_agents}/{self.mode}/{self.backend}"
+
+
+# ----------------------------
+# Process metrics
+# ----------------------------
+def peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    scale = 1.0 if sys.platform == "darwin" else 1024.0
+    return peak * scale / (1024.0 * 1024.0)
+
+
+def current_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024.0 * 1024.0)
+    except Exception:
+        return None
+
+
+def backend_available(backend: str) -> bool:
+    if backend == "cpp":
+        return fast._fast is not None
+    if backend == "numpy":
+        return fast._np is not None
+    return backend == "python"
+
+
+# ----------------------------
+# Single case
+# ----------------------------
+def run_case(case: BenchCase) -> Dict[str, Any]:
+    """Run one case in the current process and return its result row."""
+    row: Dict[str, Any] = {
+        "case": case.name,
+        "n_agents": case.scenario.n_agents,
+        "mode": case.mode,
+        "backend": case.backend,
+        "ticks": case.ticks,
+    }
+    if not backend_available(case.backend):
+        row["status"] = "unavailable"
+        return row
+
+    previous = fast.set_backend(case.backend)
+    try:
+        flags = dict(MODES[case.mode])
+        if flags.get("enable_parallel"):
+            flags.setdefault("parallel_workers", max(2, os.cpu_count() or 2))
+        flags.update(case.kernel_overrides)
+
+        t0 = time.perf_counter()
+        kernel = build_kernel(case.scenario, enable_timing=True, **flags)
+        kernel.start()
+        setup_s = time.perf_counter() - t0
+        rss_setup = current_rss_mb()
+
+        if case.warmup > 0:
+            kernel.step(case.warmup)
+        kernel.perf.reset()
+
+        t0 = time.perf_counter()
+        kernel.step(case.ticks)
+        run_s = time.perf_counter() - t0
+    finally:
+        fast.set_backend(previous)
+
+    stats = kernel.perf.stats
+    row.update(
+        {
+            "status": "ok",
+            "setup_s": round(setup_s, 6),
+            "run_s": round(run_s, 6),
+            "ticks_per_s": round(case.ticks / run_s, 6) if run_s > 0 else None,
+            "phase_s_per_tick": {
+                name: round(stats[name].total / case.ticks, 6) for name in PHASE_SPANS if name in stats
+            },
+            "rss_setup_mb": rss_setup,
+            "peak_rss_mb": peak_rss_mb(),
+            "exposures": int(sum(kernel.analytics.exposure_counts.values())),
+        }
+    )
+    return row
+
+
+def run_cases(cases: Sequence[BenchCase], *, isolate: bool = True, progress=None) -> List[Dict[str, Any]]:
+    """
+    Run cases one at a time. With isolate (and fork available) each case runs in
+    a fresh child process, so peak_rss_mb is that case's own high-water mark.
+    """
+    results: List[Dict[str, Any]] = []
+    for case in cases:
+        if progress is not None:
+            progress(f"running {case.name} ({case.ticks} ticks)")
+        if isolate and fork_available():
+            try:
+                row = run_forked(run_case, [case])[0]
+            except RuntimeError as exc:
+                row = {
+                    "case": case.name,
+                    "n_agents": case.scenario.n_agents,
+                    "mode": case.mode,
+                    "backend": case.backend,
+                    "ticks": case.ticks,
+                    "status": "error",
+                    "error": str(exc),
+                }
+        else:
+            row = run_case(case)
+        results.append(row)
+        if progress is not None:
+            progress(format_row(row))
+    return results
+
+
+# ----------------------------
+# Baselines
+# ----------------------------
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def environment_meta() -> Dict[str, Any]:
+    try:
+        import numpy
+
+        numpy_version = numpy.__version__
+    except Exception:
+        numpy_version = None
+    return {
+        "timestamp": _dt.datetime.now(_dt.timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": numpy_version,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "fast_extension": fast._fast is not None,
+    }
+
+
+def write_baseline(path: str, results: List[Dict[str, Any]], *, config: Optional[Dict[str, Any]] = None) -> dict:
+    doc = {"meta": environment_meta(), "config": config or {}, "results": results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2, sort_keys=True)
+    return doc
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _pct(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    if old is None or new is None or old == 0:
+        return None
+    return (new - old) / old * 100.0
+
+
+def compare_baselines(old: dict, new: dict) -> List[Dict[str, Any]]:
+    """
+    Per-case % change of ticks/sec, peak RSS and each phase between two baselines.
+    Cases present in only one of them are reported with status "added"/"removed".
+    """
+    old_rows = {r["case"]: r for r in old.get("results", []) if r.get("status") == "ok"}
+    new_rows = {r["case"]: r for r in new.get("results", []) if r.get("status") == "ok"}
+    out: List[Dict[str, Any]] = []
+    for name in sorted(set(old_rows) | set(new_rows)):
+        a = old_rows.get(name)
+        b = new_rows.get(name)
+        if a is None or b is None:
+            out.append({"case": name, "status": "added" if a is None else "removed"})
+            continue
+        phases = {
+            p: _pct(a.get("phase_s_per_tick", {}).get(p), b.get("phase_s_per_tick", {}).get(p))
+            for p in sorted(set(a.get("phase_s_per_tick", {})) | set(b.get("phase_s_per_tick", {})))
+        }
+        out.append(
+            {
+                "case": name,
+                "status": "ok",
+                "ticks_per_s_pct": _pct(a.get("ticks_per_s"), b.get("ticks_per_s")),
+                "peak_rss_pct": _pct(a.get("peak_rss_mb"), b.get("peak_rss_mb")),
+                "phase_pct": phases,
+            }
+        )
+    return out
+
+
+def regressions(diff: List[Dict[str, Any]], threshold_pct: float) -> List[Tuple[str, str, float]]:
+    """(case, metric, pct) for throughput drops or RSS growth beyond threshold_pct."""
+    out: List[Tuple[str, str, float]] = []
+    for row in diff:
+        if row.get("status") != "ok":
+            continue
+        tps = row.get("ticks_per_s_pct")
+        if tps is not None and tps < -threshold_pct:
+            out.append((row["case"], "ticks_per_s", tps))
+        rss = row.get("peak_rss_pct")
+        if rss is not None and rss > threshold_pct:
+            out.append((row["case"], "peak_rss", rss))
+    return out
+
+
+# ----------------------------
+# Formatting
+# ----------------------------
+def _fmt_pct(v: Optional[float]) -> str:
+    return "n/a" if v is None else f"{v:+.1f}%"
+
+
+def format_row(row: Dict[str, Any]) -> str:
+    if row.get("status") != "ok":
+        return f"{row['case']}: {row.get('status')}"
+    phases = " ".join(f"{k.split('/', 1)[1]}={v:.3f}s" for k, v in row.get("phase_s_per_tick", {}).items())
+    rss = row.get("peak_rss_mb")
+    rss_s = "n/a" if rss is None else f"{rss:.1f}MB"
+    return f"{row['case']}: {row['ticks_per_s']:.3f} ticks/s peak_rss={rss_s} {phases}"
+
+
+def format_diff(diff: List[Dict[str, Any]]) -> str:
+    lines = ["BENCH DIFF (new vs old):"]
+    for row in diff:
+        if row.get("status") != "ok":
+            lines.append(f"{row['case']}: {row['status']}")
+            continue
+        phases = " ".join(f"{k.split('/', 1)[1]}={_fmt_pct(v)}" for k, v in row["phase_pct"].items())
+        lines.append(
+            f"{row['case']}: ticks/s={_fmt_pct(row['ticks_per_s_pct'])} "
+            f"peak_rss={_fmt_pct(row['peak_rss_pct'])} {phases}"
+        )
+    return "\n".join(lines)
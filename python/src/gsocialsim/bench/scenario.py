@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+"""
+Synthetic scenarios for the scaling benchmarks.
+
+A scenario is fully determined by its parameters and seed: agents get seeded
+beliefs on a handful of topics, each agent follows `follow_degree` random
+others, and every tick a SyntheticDataSource emits `stimuli_per_tick` stimuli
+authored by random agents (so they reach that agent's followers) plus an
+optional share of follower-less outlet stimuli (broadcast to everyone).
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List
+
+import numpy as np
+
+from gsocialsim.agents.agent import Agent
+from gsocialsim.kernel.world_kernel import WorldKernel
+from gsocialsim.stimuli.data_source import DataSource
+from gsocialsim.stimuli.stimulus import Stimulus
+from gsocialsim.types import AgentId
+
+# Kernel flag sets benchmarked by default; values are WorldKernel keyword arguments.
+MODES: Dict[str, Dict[str, Any]] = {
+    "serial": {"enable_batch_all": False},
+    "parallel": {"enable_batch_all": False, "enable_parallel": True},
+    "batch_all": {"enable_batch_all": True},
+    "vectorized": {"enable_vectorized_perception": True},
+    "sharded": {"enable_sharding": True},
+}
+DEFAULT_MODES = ("serial", "parallel", "batch_all")
+
+
+@dataclass
+class BenchScenario:
+    n_agents: int = 1000
+    follow_degree: int = 10
+    stimuli_per_tick: int = 50
+    # Share of each tick's stimuli published by follower-less outlets (seen by every agent).
+    broadcast_fraction: float = 0.0
+    n_topics: int = 4
+    seed: int = 7
+    life_cycle: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @property
+    def topics(self) -> List[str]:
+        return [f"T_Bench{i}" for i in range(self.n_topics)]
+
+
+def agent_id(i: int) -> AgentId:
+    return AgentId(f"B{i}")
+
+
+class SyntheticDataSource(DataSource):
+    """Deterministic per-tick stimuli; the draw for tick t depends only on (seed, t)."""
+
+    def __init__(self, scenario: BenchScenario):
+        self.scenario = scenario
+        self._topics = scenario.topics
+
+    def get_stimuli(self, tick: int) -> List[Stimulus]:
+        sc = self.scenario
+        n = int(sc.stimuli_per_tick)
+        if n <= 0:
+            return []
+        rng = np.random.default_rng((sc.seed, int(tick)))
+        authors = rng.integers(0, sc.n_agents, size=n).tolist()
+        stances = np.round(rng.uniform(-1.0, 1.0, size=n), 3).tolist()
+        topics = rng.integers(0, len(self._topics), size=n).tolist()
+        broadcast = (rng.random(n) < sc.broadcast_fraction).tolist()
+        out: List[Stimulus] = []
+        for i in range(n):
+            source = f"OUTLET{i % 3}" if broadcast[i] else str(agent_id(authors[i]))
+            out.append(
+                Stimulus(
+                    id=f"BS{tick}_{i}",
+                    source=source,
+                    tick=tick,
+                    content_text="bench",
+                    metadata={"topic": self._topics[topics[i]], "stance": stances[i]},
+                )
+            )
+        return out
+
+
+def build_kernel(scenario: BenchScenario, **kernel_kwargs: Any) -> WorldKernel:
+    """Populate a WorldKernel with the scenario's agents, follow graph and data source."""
+    sc = scenario
+    kernel_kwargs.setdefault("enable_debug_logging", False)
+    k = WorldKernel(seed=sc.seed, **kernel_kwargs)
+    k.physical_world.enable_life_cycle = bool(sc.life_cycle)
+    k.physical_world.population_csv_path = None
+
+    rng = np.random.default_rng(sc.seed)
+    topics = sc.topics
+    stances = rng.uniform(-1.0, 1.0, size=(sc.n_agents, len(topics)))
+    confidences = rng.uniform(0.1, 0.9, size=(sc.n_agents, len(topics)))
+    for i in range(sc.n_agents):
+        a = Agent(id=agent_id(i), seed=sc.seed * 1_000_003 + i)
+        for j, topic in enumerate(topics):
+            a.beliefs.update(topic, float(stances[i, j]), float(confidences[i, j]), 0.0, 0.0)
+        k.agents.add_agent(a)
+
+    degree = max(0, min(int(sc.follow_degree), sc.n_agents - 1))
+    if degree:
+        graph = k.network.graph
+        trust = np.round(rng.uniform(0.3, 0.9, size=(sc.n_agents, degree)), 3)
+        for i in range(sc.n_agents):
+            # Offsets in [1, n) never pick the follower itself; duplicates are dropped.
+            offsets = np.unique(rng.integers(1, sc.n_agents, size=degree))
+            follower = agent_id(i)
+            for d, off in enumerate(offsets.tolist()):
+                graph.add_edge(follower=follower, followed=agent_id((i + off) % sc.n_agents), trust=float(trust[i, d]))
+
+    k.stimulus_engine.register_data_source(SyntheticDataSource(sc))
+    return k
@@ -1,3 +1,10 @@
-from gsocialsim.fast.perception import HAS_FAST, compute_belief_delta, compute_belief_deltas
+from gsocialsim.fast.perception import (
+    BACKEND,
+    HAS_BATCH,
+    HAS_FAST,
+    compute_belief_delta,
+    compute_belief_deltas,
+    set_backend,
+)
 
-__all__ = ["HAS_FAST", "compute_belief_delta", "compute_belief_deltas"]
+__all__ = ["BACKEND", "HAS_BATCH", "HAS_FAST", "compute_belief_delta", "compute_belief_deltas", "set_backend"]
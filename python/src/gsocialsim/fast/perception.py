@@ -10,6 +10,170 @@ try:
 except Exception:
     _fast = None
 
+HAS_NUMPY = False
+try:
+    import numpy as _np
+
+    HAS_NUMPY = True
+except Exception:
+    _np = None
+
+# Batched compute_belief_deltas is available (compiled extension or NumPy fallback).
+HAS_BATCH = HAS_FAST or HAS_NUMPY
+BACKEND = "cpp" if HAS_FAST else ("numpy" if HAS_NUMPY else "python")
+
+
+def set_backend(name: str) -> str:
+    """
+    Force the belief-delta backend: "cpp", "numpy" or "python" (scalar, no batching).
+    Used by benchmarks to compare paths; returns the previous backend name.
+    """
+    global HAS_FAST, HAS_BATCH, BACKEND
+    previous = BACKEND
+    if name == "cpp" and _fast is None:
+        raise RuntimeError("fast perception module not available")
+    if name == "numpy" and _np is None:
+        raise RuntimeError("numpy not available")
+    if name not in ("cpp", "numpy", "python"):
+        raise ValueError(f"unknown backend: {name}")
+    HAS_FAST = name == "cpp"
+    HAS_BATCH = name in ("cpp", "numpy")
+    BACKEND = name
+    return previous
+
+
+def _clamp01(v: float) -> float:
+    return max(0.0, min(1.0, v))
+
+
+def _py_belief_delta(
+    stance_signal: float,
+    current_stance: float,
+    has_belief: bool,
+    trust: float,
+    credibility: float,
+    primal_activation: float,
+    identity_threat: float,
+    is_self_source: bool,
+    identity_rigidity: float,
+    is_physical: bool,
+) -> Tuple[float, float]:
+    # Scalar mirror of compute_delta() in perception.cpp (double precision).
+    trust = _clamp01(trust)
+    multiplier = 10.0 if is_physical else 1.0
+    trust_effect = min(1.0, trust + 0.15) if is_physical else trust
+    credibility_mult = 0.5 + _clamp01(credibility)
+    primal_mult = 1.0 + 0.25 * _clamp01(primal_activation)
+    if is_self_source:
+        multiplier *= 1.2
+    is_threatening = identity_threat > 0.5
+
+    if not has_belief:
+        stance_delta = stance_signal * trust_effect * multiplier
+        confidence_delta = (0.1 * trust_effect * multiplier) + (0.03 * trust_effect if is_self_source else 0.0)
+        return stance_delta, confidence_delta
+
+    stance_difference = stance_signal - current_stance
+    is_confirming = (stance_difference > 0.0 and current_stance > 0.0) or (
+        stance_difference < 0.0 and current_stance < 0.0
+    )
+    is_opposed = abs(stance_difference) > 1.0
+
+    base_influence = 0.10
+    stance_change = stance_difference * base_influence * trust_effect * multiplier * credibility_mult * primal_mult
+    confidence_change = 0.02 * trust_effect * multiplier * credibility_mult * primal_mult
+
+    if is_confirming:
+        stance_change *= 1.1
+        confidence_change += 0.04 * trust_effect * multiplier
+    if is_self_source:
+        confidence_change += 0.03 * trust_effect
+
+    if is_threatening and is_opposed:
+        stance_change = -stance_difference * base_influence * trust_effect * multiplier * 0.6
+        confidence_change += 0.05 * trust_effect * multiplier
+    elif is_opposed:
+        openness = _clamp01(1.0 - identity_rigidity)
+        persuasive = trust_effect * credibility_mult
+        if persuasive >= 0.7:
+            confidence_change -= 0.01 * (0.3 + 0.7 * openness)
+    return stance_change, confidence_change
+
+
+def _numpy_belief_deltas(
+    stance_signal,
+    current_stance,
+    has_belief,
+    trust,
+    credibility,
+    primal_activation,
+    identity_threat,
+    is_self_source,
+    identity_rigidity,
+    is_physical,
+):
+    """
+    Vectorized mirror of compute_delta() in perception.cpp.
+
+    Runs in float32 like the extension; every branch is evaluated for all rows and
+    selected with masks, in the same order the C++ code applies them.
+    """
+    np = _np
+    f32 = np.float32
+
+    def col(values, dtype=f32):
+        return np.ascontiguousarray(values, dtype=dtype).reshape(-1)
+
+    s = col(stance_signal)
+    cs = col(current_stance)
+    hb = col(has_belief, np.bool_)
+    tr = np.clip(col(trust), f32(0.0), f32(1.0))
+    cr = np.clip(col(credibility), f32(0.0), f32(1.0))
+    pa = np.clip(col(primal_activation), f32(0.0), f32(1.0))
+    threat = col(identity_threat)
+    ss = col(is_self_source, np.bool_)
+    rigidity = col(identity_rigidity)
+    phys = col(is_physical, np.bool_)
+
+    multiplier = np.where(phys, f32(10.0), f32(1.0))
+    multiplier = np.where(ss, multiplier * f32(1.2), multiplier)
+    trust_effect = np.where(phys, np.minimum(f32(1.0), tr + f32(0.15)), tr)
+    credibility_mult = f32(0.5) + cr
+    primal_mult = f32(1.0) + f32(0.25) * pa
+    self_bonus = np.where(ss, f32(0.03) * trust_effect, f32(0.0))
+
+    # Existing belief
+    diff = s - cs
+    confirming = ((diff > 0) & (cs > 0)) | ((diff < 0) & (cs < 0))
+    opposed = np.abs(diff) > f32(1.0)
+    threatening = threat > f32(0.5)
+
+    base = f32(0.10)
+    te_m = trust_effect * multiplier
+    stance_change = diff * base * te_m * credibility_mult * primal_mult
+    confidence_change = f32(0.02) * te_m * credibility_mult * primal_mult
+    stance_change = np.where(confirming, stance_change * f32(1.1), stance_change)
+    confidence_change = np.where(confirming, confidence_change + f32(0.04) * te_m, confidence_change)
+    confidence_change = confidence_change + self_bonus
+
+    backfire = threatening & opposed
+    stance_change = np.where(backfire, -diff * base * te_m * f32(0.6), stance_change)
+    confidence_change = np.where(backfire, confidence_change + f32(0.05) * te_m, confidence_change)
+
+    openness = np.clip(f32(1.0) - rigidity, f32(0.0), f32(1.0))
+    persuaded = opposed & ~threatening & (trust_effect * credibility_mult >= f32(0.7))
+    confidence_change = np.where(
+        persuaded, confidence_change - f32(0.01) * (f32(0.3) + f32(0.7) * openness), confidence_change
+    )
+
+    # New belief
+    new_stance = s * te_m
+    new_confidence = f32(0.1) * te_m + self_bonus
+
+    stance_delta = np.where(hb, stance_change, new_stance).astype(f32, copy=False)
+    confidence_delta = np.where(hb, confidence_change, new_confidence).astype(f32, copy=False)
+    return stance_delta, confidence_delta
+
 
 def compute_belief_delta(
     stance_signal: float,
@@ -23,27 +187,21 @@ def compute_belief_delta(
     identity_rigidity: float,
     is_physical: bool,
 ) -> Tuple[float, float]:
+    args = (
+        float(stance_signal),
+        float(current_stance),
+        bool(has_belief),
+        float(trust),
+        float(credibility),
+        float(primal_activation),
+        float(identity_threat),
+        bool(is_self_source),
+        float(identity_rigidity),
+        bool(is_physical),
+    )
     if HAS_FAST:
-        return _fast.compute_belief_delta(
-            float(stance_signal),
-            float(current_stance),
-            bool(has_belief),
-            float(trust),
-            float(credibility),
-            float(primal_activation),
-            float(identity_threat),
-            bool(is_self_source),
-            float(identity_rigidity),
-            bool(is_physical),
-        )
-    # Fallback uses Python implementation (imported lazily to avoid cycles).
-    from gsocialsim.agents.belief_update_engine import BeliefUpdateEngine, BeliefDelta
-
-    engine = BeliefUpdateEngine()
-    # Build a small shim to reuse existing logic is too heavy here; fallback is not expected.
-    delta = BeliefDelta(topic_id="T__shim", stance_delta=0.0, confidence_delta=0.0)
-    # Maintain API, but callers should avoid fallback in hot path.
-    return (delta.stance_delta, delta.confidence_delta)
+        return _fast.compute_belief_delta(*args)
+    return _py_belief_delta(*args)
 
 
 def compute_belief_deltas(
@@ -58,9 +216,11 @@ def compute_belief_deltas(
     identity_rigidity: Iterable[float],
     is_physical: Iterable[bool],
 ) -> Tuple[List[float], List[float]]:
-    if not HAS_FAST:
-        raise RuntimeError("fast perception module not available")
-    return _fast.compute_belief_deltas(
+    """
+    Batched belief deltas (float32 arrays). Uses the compiled extension when built,
+    otherwise the NumPy implementation of the same formula.
+    """
+    args = (
         stance_signal,
         current_stance,
         has_belief,
@@ -72,3 +232,9 @@ def compute_belief_deltas(
         identity_rigidity,
         is_physical,
     )
+    if HAS_FAST:
+        return _fast.compute_belief_deltas(*args)
+    if BACKEND == "numpy":
+        return _numpy_belief_deltas(*args)
+    rows = [_py_belief_delta(*row) for row in zip(*args)]
+    return [r[0] for r in rows], [r[1] for r in rows]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from gsocialsim.kernel.world_kernel import WorldKernel
+
+
+@dataclass
+class ActiveAgentIndex:
+    """
+    Per tick-of-day list of agents whose schedule gives them non-zero minutes.
+
+    Agents without a schedule yet are listed at every tick (their first budget reset
+    creates the schedule, which invalidates the index). Lists keep population order.
+
+    The index is keyed on (population version, GeoWorld schedule version, life-cycle
+    flag, clock shape) and rebuilt lazily by the kernel when any of those change.
+
+    When the physical world exposes an availability table, the index also keeps,
+    per tick-of-day, the table rows and reflect factors of the scheduled active
+    agents so a budget reset is one column gather plus one vector expression.
+    """
+    key: Tuple
+    by_tick: List[List[str]]
+    # Agents given a non-zero budget at the last reset (so leavers can be zeroed).
+    budgeted: Set[str] = field(default_factory=set)
+    # True until the first reset after a rebuild zeroes every inactive agent once.
+    needs_full_reset: bool = True
+    # Table-backed reset data (None when built without an availability table).
+    scheduled_ids: Optional[List[List[str]]] = None
+    scheduled_rows: Optional[List[Any]] = None      # int64 arrays into the availability table
+    scheduled_reflect: Optional[List[Any]] = None   # float64 arrays, clamped reflect_propensity
+    unscheduled_ids: Optional[List[List[str]]] = None
+    # Time-ledger slots for scheduled_ids, resolved lazily per ledger instance.
+    _ledger: Any = field(default=None, repr=False, compare=False)
+    _ledger_slots: Dict[int, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def active_at(self, tick_of_day: int) -> List[str]:
+        return self.by_tick[tick_of_day % len(self.by_tick)]
+
+    @property
+    def has_table(self) -> bool:
+        return self.scheduled_rows is not None
+
+    def ledger_slots(self, tick_of_day: int, ledger) -> Any:
+        """Slots of scheduled_ids[tick_of_day] in ledger (cached; slots are stable per ledger)."""
+        if ledger is not self._ledger:
+            self._ledger = ledger
+            self._ledger_slots = {}
+        slots = self._ledger_slots.get(tick_of_day)
+        if slots is None:
+            slots = ledger.slots(self.scheduled_ids[tick_of_day])
+            self._ledger_slots[tick_of_day] = slots
+        return slots
+
+
+def index_key(kernel: "WorldKernel") -> Tuple:
+    world = kernel.physical_world
+    return (
+        getattr(kernel.agents, "version", None),
+        getattr(world, "schedule_version", None),
+        bool(getattr(world, "enable_life_cycle", False)),
+        int(kernel.clock.ticks_per_day),
+        int(kernel.clock.seconds_per_tick),
+    )
+
+
+def reflect_factor(agent) -> float:
+    try:
+        prefs = getattr(agent, "activity", None)
+        reflect = float(getattr(prefs, "reflect_propensity", 0.0)) if prefs else 0.0
+    except Exception:
+        reflect = 0.0
+    return max(0.0, min(1.0, reflect))
+
+
+def build_active_index(kernel: "WorldKernel") -> ActiveAgentIndex:
+    index = _build_from_table(kernel)
+    if index is not None:
+        return index
+
+    ticks_per_day = max(1, int(kernel.clock.ticks_per_day))
+    minutes_per_tick = float(kernel.clock.seconds_per_tick) / 60.0
+    world = kernel.physical_world
+    by_tick: List[List[str]] = [[] for _ in range(ticks_per_day)]
+    scheduled_minutes = getattr(world, "scheduled_minutes", None)
+    for agent_id in kernel.agents.keys():
+        for tod in range(ticks_per_day):
+            minutes = None
+            if callable(scheduled_minutes):
+                try:
+                    minutes = scheduled_minutes(agent_id, tod, minutes_per_tick)
+                except Exception:
+                    minutes = None
+            if minutes is None or minutes > 0.0:
+                by_tick[tod].append(agent_id)
+    return ActiveAgentIndex(key=index_key(kernel), by_tick=by_tick)
+
+
+def _build_from_table(kernel: "WorldKernel") -> Optional[ActiveAgentIndex]:
+    world = kernel.physical_world
+    availability_row = getattr(world, "availability_row", None)
+    availability_table = getattr(world, "availability_table", None)
+    if not callable(availability_row) or not callable(availability_table):
+        return None
+    try:
+        import numpy as np
+    except Exception:
+        return None
+
+    ticks_per_day = max(1, int(kernel.clock.ticks_per_day))
+    minutes_per_tick = float(kernel.clock.seconds_per_tick) / 60.0
+    agent_ids = list(kernel.agents.keys())
+    try:
+        rows = np.fromiter((availability_row(a) for a in agent_ids), dtype=np.int64, count=len(agent_ids))
+        table = availability_table(minutes_per_tick)
+    except Exception:
+        return None
+    scheduled = rows >= 0
+    if scheduled.any() and table.shape[1] != ticks_per_day:
+        return None
+
+    agents = kernel.agents
+    reflect = np.fromiter((reflect_factor(agents.get(a)) for a in agent_ids), dtype=np.float64, count=len(agent_ids))
+    ids = np.empty(len(agent_ids), dtype=object)
+    ids[:] = agent_ids
+
+    # [agents x ticks] activity mask; agents without a schedule are active everywhere.
+    active = np.ones((len(agent_ids), ticks_per_day), dtype=bool)
+    if scheduled.any():
+        active[scheduled] = table[rows[scheduled]] > 0.0
+    unscheduled_ids = ids[~scheduled].tolist()
+
+    by_tick: List[List[str]] = []
+    scheduled_ids: List[List[str]] = []
+    scheduled_rows: List[Any] = []
+    scheduled_reflect: List[Any] = []
+    for tod in range(ticks_per_day):
+        column = active[:, tod]
+        by_tick.append(ids[column].tolist())
+        pos = np.flatnonzero(column & scheduled)
+        scheduled_ids.append(ids[pos].tolist())
+        scheduled_rows.append(rows[pos])
+        scheduled_reflect.append(reflect[pos])
+    return ActiveAgentIndex(
+        key=index_key(kernel),
+        by_tick=by_tick,
+        scheduled_ids=scheduled_ids,
+        scheduled_rows=scheduled_rows,
+        scheduled_reflect=scheduled_reflect,
+        unscheduled_ids=[unscheduled_ids for _ in range(ticks_per_day)],
+    )
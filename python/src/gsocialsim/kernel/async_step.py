@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+"""
+Async stepping for embedding a WorldKernel in an asyncio service.
+
+step_async() runs the kernel's synchronous step() in a worker thread and
+yields a TickSnapshot after every `yield_every` ticks, so the event loop stays
+responsive for the whole run. The worker steps one tick at a time through
+WorldKernel.step(), i.e. with the full INGEST -> ACT -> PERCEIVE -> CONSOLIDATE
+contract; the loop only ever observes the kernel between ticks.
+
+Cancellation is cooperative and lands on the next tick boundary:
+  - setting `cancel` (anything with is_set(), e.g. asyncio.Event or
+    threading.Event) is checked by the worker before each tick; the ticks
+    already run are reported in one last snapshot;
+  - leaving the `async for` early stops at the current yield;
+  - cancelling the consuming task tells the worker to stop after its current
+    tick and waits for it before CancelledError propagates, so the kernel is
+    never left mid-tick.
+
+A worker thread (not a process) is used because the kernel's state lives in
+this process; the caller must not step the same kernel concurrently.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
+
+if TYPE_CHECKING:
+    from gsocialsim.kernel.world_kernel import WorldKernel
+
+
+@dataclass(frozen=True)
+class TickSnapshot:
+    """Cheap summary of the kernel between ticks."""
+
+    t: int  # next tick to run (clock.t)
+    day: int
+    tick_of_day: int
+    ticks_done: int  # ticks completed by this step_async() call
+    active_agents: int
+    interactions: int
+    crossings: int
+    elapsed_s: float
+
+
+def take_snapshot(kernel: "WorldKernel", ticks_done: int = 0, elapsed_s: float = 0.0) -> TickSnapshot:
+    clock = kernel.clock
+    analytics = kernel.analytics
+    try:
+        active = len(kernel.active_agent_ids())
+    except Exception:
+        active = 0
+    return TickSnapshot(
+        t=clock.t,
+        day=clock.day,
+        tick_of_day=clock.tick_of_day,
+        ticks_done=ticks_done,
+        active_agents=active,
+        interactions=len(getattr(analytics, "interactions", ()) or ()),
+        crossings=len(getattr(analytics, "crossings", ()) or ()),
+        elapsed_s=elapsed_s,
+    )
+
+
+async def step_async(
+    kernel: "WorldKernel",
+    num_ticks: int = 1,
+    *,
+    yield_every: int = 1,
+    cancel: Optional[Any] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[TickSnapshot]:
+    if num_ticks <= 0:
+        return
+    yield_every = max(1, int(yield_every))
+    loop = asyncio.get_running_loop()
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gsocialsim-step")
+    start = time.perf_counter()
+    # Set when the consuming task is cancelled.
+    stop = threading.Event()
+
+    def stopping() -> bool:
+        return stop.is_set() or (cancel is not None and cancel.is_set())
+
+    def run_chunk(n: int, done_before: int) -> TickSnapshot:
+        ran = 0
+        while ran < n and not stopping():
+            kernel.step(1)
+            ran += 1
+        return take_snapshot(kernel, done_before + ran, time.perf_counter() - start)
+
+    done = 0
+    try:
+        while done < num_ticks and not stopping():
+            n = min(yield_every, num_ticks - done)
+            future = loop.run_in_executor(executor, run_chunk, n, done)
+            try:
+                snapshot = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Let the current tick finish so the kernel stops on a tick boundary.
+                stop.set()
+                await asyncio.wait({future})
+                raise
+            if snapshot.ticks_done == done:
+                break  # cancelled before the chunk ran a tick
+            done = snapshot.ticks_done
+            yield snapshot
+    finally:
+        if own_executor:
+            executor.shutdown(wait=False)
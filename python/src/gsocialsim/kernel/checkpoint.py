@@ -0,0 +1,639 @@
+from __future__ import annotations
+
+"""
+Binary checkpoint / restore for a WorldKernel between ticks.
+
+A checkpoint is a single uncompressed .npz archive. Regular state is written as
+flat columns (one array per field, rows in population order) so save and load
+are bulk array copies:
+
+  agent/*      ids, scalar fields of every agent component, rng states,
+               identity vectors/sets/maps, beliefs (COO), bandit stats (COO)
+  gsr/*        relationship vectors (one row per pair), topic reality
+  net/*        node table, edge list in insertion order, per-edge trust
+  geo/*        life-cycle schedules [agents x ticks_per_day], homes/work,
+               population sampler cells
+  strings      one shared string table; every id/topic/key column indexes it
+
+Irregular leftovers (working memory impressions, daily buffers, pending
+stimuli and data sources, kernel config and clock) go into one pickled
+`meta` blob stored as a uint8 array. Analytics are not checkpointed; a
+restored kernel starts with fresh analytics.
+"""
+
+import dataclasses
+import pickle
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from gsocialsim.agents.agent import Agent
+from gsocialsim.agents.belief_state import TopicBelief
+from gsocialsim.physical.geo_world import GeoLocation, LifePhase, LifeProfile, Schedule
+from gsocialsim.policy.bandit_learner import RewardVector
+from gsocialsim.social.global_social_reality import TopicReality
+from gsocialsim.social.relationship_vector import RelationshipVector
+
+if TYPE_CHECKING:
+    from gsocialsim.kernel.world_kernel import WorldKernel
+
+
+FORMAT_VERSION = 2
+
+# Agent sub-objects whose public scalar attributes are stored as columns.
+_AGENT_COMPONENTS: Dict[str, Callable[[Agent], Any]] = {
+    "agent": lambda a: a,
+    "identity": lambda a: a.identity,
+    "emotion": lambda a: a.emotion,
+    "budgets": lambda a: a.budgets,
+    "personality": lambda a: a.personality,
+    "activity": lambda a: a.activity,
+    "policy": lambda a: a.policy,
+    "belief_update": lambda a: a.belief_update_engine,
+}
+
+_PHASES = list(LifePhase)
+
+
+# ----------------------------
+# Column helpers
+# ----------------------------
+class _Strings:
+    """Shared string table; columns store indices into it (-1 = None)."""
+
+    def __init__(self, values: Optional[Sequence[str]] = None) -> None:
+        self.values: List[str] = list(values or [])
+        self.index: Dict[str, int] = {v: i for i, v in enumerate(self.values)}
+
+    def __call__(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        value = str(value)
+        i = self.index.get(value)
+        if i is None:
+            i = len(self.values)
+            self.values.append(value)
+            self.index[value] = i
+        return i
+
+    def column(self, values: Iterable[Optional[str]]) -> np.ndarray:
+        return np.asarray([self(v) for v in values], dtype=np.int32)
+
+    def get(self, i: int) -> Optional[str]:
+        return None if i < 0 else self.values[i]
+
+    def array(self) -> np.ndarray:
+        if not self.values:
+            return np.zeros(0, dtype="<U1")
+        return np.asarray(self.values, dtype=str)
+
+
+def _is_scalar(v: Any) -> bool:
+    return isinstance(v, (bool, int, float)) and not isinstance(v, type)
+
+
+def _scalar_names(obj: Any) -> List[str]:
+    if dataclasses.is_dataclass(obj):
+        names = [f.name for f in dataclasses.fields(obj)]
+    else:
+        names = list(vars(obj).keys())
+    return [n for n in names if not n.startswith("_") and _is_scalar(getattr(obj, n, None))]
+
+
+def _pack_scalars(out: Dict[str, np.ndarray], prefix: str, objs: Sequence[Any]) -> None:
+    if not objs:
+        return
+    for name in _scalar_names(objs[0]):
+        values = [getattr(o, name) for o in objs]
+        out[f"{prefix}/{name}"] = _scalar_column(values)
+
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def _scalar_column(values: List[Any]) -> np.ndarray:
+    """
+    float64 for floats/bools; ints are kept exact (seeds and counters may exceed
+    2**53): int64 when they fit, decimal strings otherwise.
+    """
+    if values and all(type(v) is int for v in values):
+        if all(_INT64_MIN <= v <= _INT64_MAX for v in values):
+            return np.asarray(values, dtype=np.int64)
+        return np.asarray([str(v) for v in values], dtype=str)
+    return np.asarray([float(v) for v in values], dtype=np.float64)
+
+
+def _unpack_scalars(arrays, prefix: str, objs: Sequence[Any]) -> None:
+    if not objs:
+        return
+    for name in _scalar_names(objs[0]):
+        key = f"{prefix}/{name}"
+        if key not in arrays:
+            continue
+        kind = type(getattr(objs[0], name))
+        for o, v in zip(objs, arrays[key].tolist()):
+            setattr(o, name, kind(v))
+
+
+def _pack_map(
+    out: Dict[str, np.ndarray],
+    prefix: str,
+    maps: Sequence[Dict[str, Any]],
+    strings: _Strings,
+    *,
+    str_values: bool = False,
+) -> None:
+    """Row-grouped COO for a list of small dicts (float or string values)."""
+    rows: List[int] = []
+    keys: List[int] = []
+    vals: list = []
+    for row, m in enumerate(maps):
+        for k, v in (m or {}).items():
+            rows.append(row)
+            keys.append(strings(k))
+            vals.append(strings(v) if str_values else float(v))
+    out[f"{prefix}/row"] = np.asarray(rows, dtype=np.int64)
+    out[f"{prefix}/key"] = np.asarray(keys, dtype=np.int32)
+    out[f"{prefix}/val"] = np.asarray(vals, dtype=np.int32 if str_values else np.float64)
+
+
+def _unpack_map(arrays, prefix: str, n: int, strings: _Strings, *, str_values: bool = False) -> List[Dict[str, Any]]:
+    maps: List[Dict[str, Any]] = [{} for _ in range(n)]
+    rows = arrays[f"{prefix}/row"].tolist()
+    keys = arrays[f"{prefix}/key"].tolist()
+    vals = arrays[f"{prefix}/val"].tolist()
+    for r, k, v in zip(rows, keys, vals):
+        maps[r][strings.get(k)] = strings.get(v) if str_values else v
+    return maps
+
+
+def _pack_ragged(out: Dict[str, np.ndarray], prefix: str, lists: Sequence[Sequence[float]]) -> None:
+    lengths = np.asarray([len(x) for x in lists], dtype=np.int64)
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = [float(v) for x in lists for v in x]
+    out[f"{prefix}/offsets"] = offsets
+    out[f"{prefix}/values"] = np.asarray(flat, dtype=np.float64)
+
+
+def _unpack_ragged(arrays, prefix: str) -> List[List[float]]:
+    offsets = arrays[f"{prefix}/offsets"].tolist()
+    values = arrays[f"{prefix}/values"].tolist()
+    return [values[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def _is_counter_state(state: Any) -> bool:
+    return isinstance(state, tuple) and len(state) == 5 and state[0] == "agent_rng"
+
+
+# ----------------------------
+# Save
+# ----------------------------
+def save_checkpoint(kernel: "WorldKernel", path: str) -> None:
+    """
+    Write kernel state to `path` (.npz). Call between ticks (after step() returns).
+    """
+    strings = _Strings()
+    out: Dict[str, np.ndarray] = {}
+    meta: Dict[str, Any] = {"format_version": FORMAT_VERSION}
+
+    agents = list(kernel.agents.values())
+    out["agent/id"] = strings.column(a.id for a in agents)
+    for prefix, getter in _AGENT_COMPONENTS.items():
+        _pack_scalars(out, prefix, [getter(a) for a in agents])
+
+    _save_agent_rng(out, meta, agents)
+    _save_identity(out, agents, strings)
+    _save_beliefs(out, kernel, agents, strings)
+    _save_bandit(out, agents, strings)
+    meta["working_memory"] = [
+        (list(a.recent_impressions.items()), a.daily_digest, list(a.daily_actions))
+        for a in agents
+    ]
+
+    _save_gsr(out, meta, kernel.gsr, strings)
+    _save_network(out, kernel.network.graph, strings)
+    _save_geo(out, meta, kernel.physical_world, strings)
+
+    meta["kernel_config"] = {
+        f.name: getattr(kernel, f.name)
+        for f in dataclasses.fields(kernel)
+        if f.init and isinstance(getattr(kernel, f.name), (bool, int, float, str))
+    }
+    meta["kernel_rng"] = kernel.rng.getstate()
+    meta["clock"] = dataclasses.asdict(kernel.clock)
+
+    ctx = kernel.world_context
+    engine = kernel.stimulus_engine
+    sources = []
+    skipped_sources = 0
+    for source in getattr(engine, "_data_sources", []):
+        try:
+            sources.append(pickle.dumps(source, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            skipped_sources += 1
+    meta["stimuli"] = {
+        "store": list(getattr(engine, "_stimuli_store", {}).values()),
+        "sources": sources,
+        "skipped_sources": skipped_sources,
+        "stimuli_by_tick": dict(ctx.stimuli_by_tick),
+        "posted_by_tick": dict(ctx.posted_by_tick),
+        "deferred_belief_deltas": list(ctx.deferred_belief_deltas),
+        "time_remaining_by_agent": dict(ctx.time_remaining_by_agent),
+    }
+
+    out["strings"] = strings.array()
+    out["meta"] = np.frombuffer(pickle.dumps(meta, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8)
+    with open(path, "wb") as f:
+        np.savez(f, **out)
+
+
+def _save_agent_rng(out: Dict[str, np.ndarray], meta: Dict[str, Any], agents: List[Agent]) -> None:
+    states = [a.rng.getstate() for a in agents]
+    if states and all(_is_counter_state(s) for s in states):
+        out["agent/rng_key"] = np.asarray([s[1] for s in states], dtype=np.uint64)
+        out["agent/rng_tick"] = np.asarray([s[2] for s in states], dtype=np.int64)
+        out["agent/rng_n"] = np.asarray([s[3] for s in states], dtype=np.int64)
+        out["agent/rng_gauss"] = np.asarray(
+            [np.nan if s[4] is None else float(s[4]) for s in states], dtype=np.float64
+        )
+    else:
+        meta["agent_rng_states"] = states
+
+
+def _save_identity(out: Dict[str, np.ndarray], agents: List[Agent], strings: _Strings) -> None:
+    ids = [a.identity for a in agents]
+    _pack_ragged(out, "identity/vector", [list(i.identity_vector or []) for i in ids])
+    _pack_map(out, "identity/ingroup", [{k: 1.0 for k in i.ingroup_labels} for i in ids], strings)
+    _pack_map(out, "identity/taboo", [{k: 1.0 for k in i.taboo_boundaries} for i in ids], strings)
+    _pack_map(out, "identity/political_dimensions", [i.political_dimensions for i in ids], strings)
+    _pack_map(out, "identity/group_affiliations", [i.group_affiliations for i in ids], strings)
+    _pack_map(out, "identity/demographics", [i.demographics for i in ids], strings, str_values=True)
+
+
+def _save_beliefs(out: Dict[str, np.ndarray], kernel: "WorldKernel", agents: List[Agent], strings: _Strings) -> None:
+    tensor = getattr(kernel.agents, "belief_tensor", None)
+    if tensor is not None and agents and all(a.beliefs.tensor is tensor for a in agents):
+        rows = np.asarray([a.beliefs.row for a in agents], dtype=np.int64)
+        # Per agent in topic creation order, so load() restores the iteration order.
+        row_cols = [tensor.row_cols[row] for row in rows.tolist()]
+        r = np.repeat(np.arange(len(agents), dtype=np.int64), [len(cols) for cols in row_cols])
+        c = np.fromiter((col for cols in row_cols for col in cols), dtype=np.int64, count=r.size)
+        topic_col = strings.column(tensor.topic_ids)
+        out["belief/row"] = r.astype(np.int64)
+        out["belief/topic"] = topic_col[c] if c.size else np.zeros(0, dtype=np.int32)
+        for name in ("stance", "confidence", "salience", "knowledge"):
+            out[f"belief/{name}"] = getattr(tensor, name)[rows[r], c].astype(np.float64)
+        return
+
+    rows: List[int] = []
+    topics: List[int] = []
+    cols: Dict[str, List[float]] = {"stance": [], "confidence": [], "salience": [], "knowledge": []}
+    for i, agent in enumerate(agents):
+        for topic, b in agent.beliefs.topics.items():
+            rows.append(i)
+            topics.append(strings(topic))
+            for name, col in cols.items():
+                col.append(float(getattr(b, name)))
+    out["belief/row"] = np.asarray(rows, dtype=np.int64)
+    out["belief/topic"] = np.asarray(topics, dtype=np.int32)
+    for name, col in cols.items():
+        out[f"belief/{name}"] = np.asarray(col, dtype=np.float64)
+
+
+def _save_bandit(out: Dict[str, np.ndarray], agents: List[Agent], strings: _Strings) -> None:
+    rows: List[int] = []
+    keys: List[int] = []
+    counts: List[int] = []
+    has_reward: List[bool] = []
+    status: List[float] = []
+    affiliation: List[float] = []
+    for i, agent in enumerate(agents):
+        policy = agent.policy
+        action_counts = getattr(policy, "action_counts", {}) or {}
+        action_rewards = getattr(policy, "action_rewards", {}) or {}
+        for key in list(action_counts.keys()) + [k for k in action_rewards.keys() if k not in action_counts]:
+            rows.append(i)
+            keys.append(strings(key))
+            counts.append(int(action_counts[key]) if key in action_counts else -1)
+            reward = action_rewards.get(key)
+            has_reward.append(reward is not None)
+            status.append(float(getattr(reward, "status", 0.0)))
+            affiliation.append(float(getattr(reward, "affiliation", 0.0)))
+    out["bandit/row"] = np.asarray(rows, dtype=np.int64)
+    out["bandit/key"] = np.asarray(keys, dtype=np.int32)
+    out["bandit/count"] = np.asarray(counts, dtype=np.int64)
+    out["bandit/has_reward"] = np.asarray(has_reward, dtype=np.bool_)
+    out["bandit/status"] = np.asarray(status, dtype=np.float64)
+    out["bandit/affiliation"] = np.asarray(affiliation, dtype=np.float64)
+
+
+def _save_gsr(out: Dict[str, np.ndarray], meta: Dict[str, Any], gsr, strings: _Strings) -> None:
+    relations = list(getattr(gsr, "_relations", {}).items())
+    out["gsr/rel_u"] = strings.column(k[0] for k, _ in relations)
+    out["gsr/rel_v"] = strings.column(k[1] for k, _ in relations)
+    _pack_scalars(out, "gsr/rel", [v for _, v in relations])
+    _pack_map(out, "gsr/rel_alignment", [v.topic_alignment for _, v in relations], strings)
+
+    topics = list(gsr.topics.items())
+    out["gsr/topic"] = strings.column(k for k, _ in topics)
+    _pack_scalars(out, "gsr/topic", [v for _, v in topics])
+    meta["gsr"] = {"default_truth": gsr.default_truth, "default_volatility": gsr.default_volatility}
+
+
+def _save_network(out: Dict[str, np.ndarray], graph, strings: _Strings) -> None:
+    out["net/nodes"] = strings.column(graph.node_ids)
+    src = np.array(graph._edge_src, dtype=np.int64)
+    dst = np.array(graph._edge_dst, dtype=np.int64)
+    ids = graph.node_ids
+    trust = graph._edge_trust
+    out["net/src"] = src
+    out["net/dst"] = dst
+    out["net/trust"] = np.asarray(
+        [trust.get((ids[s], ids[d]), 0.5) for s, d in zip(src.tolist(), dst.tolist())], dtype=np.float64
+    )
+
+
+def _save_geo(out: Dict[str, np.ndarray], meta: Dict[str, Any], geo, strings: _Strings) -> None:
+    meta["geo"] = {
+        "enable_life_cycle": geo.enable_life_cycle,
+        "h3_resolution": geo.h3_resolution,
+        "bbox": geo.bbox,
+        "agent_scale": geo.agent_scale,
+        "population_csv_path": geo.population_csv_path,
+        "life_profile": dataclasses.asdict(geo.life_profile),
+    }
+
+    schedules = list(geo.schedules.items())
+    width = 0
+    for _, sched in schedules:
+        keys = list(sched.daily_phase.keys()) + list(sched.daily_plan.keys())
+        if keys:
+            width = max(width, max(keys) + 1)
+    phase = np.full((len(schedules), width), -1, dtype=np.int8)
+    plan = np.full((len(schedules), width), -1, dtype=np.int32)
+    for i, (_, sched) in enumerate(schedules):
+        for t, p in sched.daily_phase.items():
+            phase[i, t] = _PHASES.index(p)
+        for t, cell in sched.daily_plan.items():
+            plan[i, t] = strings(cell)
+    out["geo/sched_agent"] = strings.column(k for k, _ in schedules)
+    out["geo/sched_phase"] = phase
+    out["geo/sched_plan"] = plan
+
+    for name in ("agent_home", "agent_work"):
+        items = list(getattr(geo, name).items())
+        out[f"geo/{name}/agent"] = strings.column(k for k, _ in items)
+        out[f"geo/{name}/cell"] = strings.column(v for _, v in items)
+
+    factors = list(geo.agent_social_factors.items())
+    out["geo/social/agent"] = strings.column(k for k, _ in factors)
+    out["geo/social/val"] = np.asarray([float(v) for _, v in factors], dtype=np.float64)
+
+    homes = list(geo.agent_home_geo.items())
+    out["geo/home_geo/agent"] = strings.column(k for k, _ in homes)
+    out["geo/home_geo/lat"] = np.asarray([float(v.lat) for _, v in homes], dtype=np.float64)
+    out["geo/home_geo/lon"] = np.asarray([float(v.lon) for _, v in homes], dtype=np.float64)
+    for name in ("cell_id", "country", "admin1", "admin2"):
+        out[f"geo/home_geo/{name}"] = strings.column(getattr(v, name) for _, v in homes)
+
+    pop = geo.population
+    cells = list(pop.cell_weights.items())
+    out["geo/pop/cell"] = strings.column(k for k, _ in cells)
+    out["geo/pop/weight"] = np.asarray([float(w) for _, w in cells], dtype=np.float64)
+    _pack_map(out, "geo/pop/meta", [pop.cell_meta.get(k, {}) for k, _ in cells], strings, str_values=True)
+    meta["geo"]["population"] = {
+        "min_population": pop.min_population,
+        "max_population": pop.max_population,
+    }
+
+
+# ----------------------------
+# Load
+# ----------------------------
+def load_checkpoint(path: str, **overrides: Any) -> "WorldKernel":
+    """
+    Build a new WorldKernel from a checkpoint written by save_checkpoint().
+
+    `overrides` replace saved constructor settings (e.g. enable_timing=True).
+    Data sources that could not be pickled at save time must be registered again.
+    """
+    from gsocialsim.kernel.world_kernel import WorldKernel
+
+    with np.load(path, allow_pickle=False) as npz:
+        arrays = {k: npz[k] for k in npz.files}
+    meta = pickle.loads(arrays["meta"].tobytes())
+    version = meta.get("format_version")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint format version: {version!r}")
+    strings = _Strings(arrays["strings"].tolist())
+
+    config = dict(meta["kernel_config"])
+    config.update(overrides)
+    kernel = WorldKernel(**config)
+    kernel.rng.setstate(meta["kernel_rng"])
+    for name, value in meta["clock"].items():
+        setattr(kernel.clock, name, value)
+
+    _load_geo(arrays, meta, kernel.physical_world, strings)
+    _load_network(arrays, kernel.network.graph, strings)
+    _load_gsr(arrays, meta, kernel.gsr, strings)
+
+    ids = [strings.get(i) for i in arrays["agent/id"].tolist()]
+    seeds = arrays["agent/seed"].tolist() if "agent/seed" in arrays else [0] * len(ids)
+    agents = [Agent(id=aid, seed=int(seed)) for aid, seed in zip(ids, seeds)]
+    for prefix, getter in _AGENT_COMPONENTS.items():
+        _unpack_scalars(arrays, prefix, [getter(a) for a in agents])
+    for agent in agents:
+        agent.budgets._rng = agent.daily_rng
+    _load_agent_rng(arrays, meta, agents)
+    _load_identity(arrays, agents, strings)
+    _load_bandit(arrays, agents, strings)
+    for agent, (recent, digest, actions) in zip(agents, meta["working_memory"]):
+        agent.recent_impressions.update(recent)
+        agent.daily_digest = digest
+        agent.daily_actions.extend(actions)
+    for agent in agents:
+        kernel.agents.add_agent(agent)
+    _load_beliefs(arrays, kernel, agents, strings)
+
+    stim = meta["stimuli"]
+    engine = kernel.stimulus_engine
+    engine._stimuli_store = {s.id: s for s in stim["store"]}
+    engine.clear_content_cache()
+    for blob in stim["sources"]:
+        engine.register_data_source(pickle.loads(blob))
+    ctx = kernel.world_context
+    ctx.stimuli_by_tick.update(stim["stimuli_by_tick"])
+    ctx.posted_by_tick.update(stim["posted_by_tick"])
+    ctx.deferred_belief_deltas.extend(stim["deferred_belief_deltas"])
+    ctx.time_remaining_by_agent.update(stim["time_remaining_by_agent"])
+
+    # State above already reflects start(); don't re-seed trust or schedules.
+    kernel._started = True
+    return kernel
+
+
+def _load_agent_rng(arrays, meta: Dict[str, Any], agents: List[Agent]) -> None:
+    if "agent/rng_key" in arrays:
+        columns = zip(
+            arrays["agent/rng_key"].tolist(),
+            arrays["agent/rng_tick"].tolist(),
+            arrays["agent/rng_n"].tolist(),
+            arrays["agent/rng_gauss"].tolist(),
+        )
+        for agent, (key, tick, n, g) in zip(agents, columns):
+            agent.rng.setstate(("agent_rng", key, tick, n, None if g != g else g))
+    else:
+        for agent, state in zip(agents, meta.get("agent_rng_states", [])):
+            agent.rng.setstate(state)
+
+
+def _load_identity(arrays, agents: List[Agent], strings: _Strings) -> None:
+    n = len(agents)
+    vectors = _unpack_ragged(arrays, "identity/vector")
+    ingroup = _unpack_map(arrays, "identity/ingroup", n, strings)
+    taboo = _unpack_map(arrays, "identity/taboo", n, strings)
+    dims = _unpack_map(arrays, "identity/political_dimensions", n, strings)
+    groups = _unpack_map(arrays, "identity/group_affiliations", n, strings)
+    demographics = _unpack_map(arrays, "identity/demographics", n, strings, str_values=True)
+    for i, agent in enumerate(agents):
+        ident = agent.identity
+        ident.identity_vector = vectors[i]
+        ident.ingroup_labels = set(ingroup[i])
+        ident.taboo_boundaries = set(taboo[i])
+        ident.political_dimensions = dims[i]
+        ident.group_affiliations = groups[i]
+        ident.demographics = demographics[i]
+
+
+def _load_beliefs(arrays, kernel: "WorldKernel", agents: List[Agent], strings: _Strings) -> None:
+    rows = arrays["belief/row"]
+    topic_idx = arrays["belief/topic"]
+    tensor = getattr(kernel.agents, "belief_tensor", None)
+    if tensor is not None and agents:
+        agent_rows = np.asarray([a.beliefs.row for a in agents], dtype=np.int64)
+        uniq, inverse = np.unique(topic_idx, return_inverse=True)
+        cols = np.asarray([tensor.intern(strings.get(int(i))) for i in uniq.tolist()], dtype=np.int64)
+        r = agent_rows[rows]
+        c = cols[inverse] if cols.size else np.zeros(0, dtype=np.int64)
+        for name in ("stance", "confidence", "salience", "knowledge"):
+            getattr(tensor, name)[r, c] = arrays[f"belief/{name}"]
+        for row, col in zip(r.tolist(), c.tolist()):
+            tensor.mark_present(row, col)
+        return
+
+    cols = [arrays[f"belief/{name}"].tolist() for name in ("stance", "confidence", "salience", "knowledge")]
+    for k, (row, t) in enumerate(zip(rows.tolist(), topic_idx.tolist())):
+        topic = strings.get(t)
+        agents[row].beliefs.topics[topic] = TopicBelief(
+            topic=topic, stance=cols[0][k], confidence=cols[1][k], salience=cols[2][k], knowledge=cols[3][k]
+        )
+
+
+def _load_bandit(arrays, agents: List[Agent], strings: _Strings) -> None:
+    columns = zip(
+        arrays["bandit/row"].tolist(),
+        arrays["bandit/key"].tolist(),
+        arrays["bandit/count"].tolist(),
+        arrays["bandit/has_reward"].tolist(),
+        arrays["bandit/status"].tolist(),
+        arrays["bandit/affiliation"].tolist(),
+    )
+    for row, key, count, has_reward, status, affiliation in columns:
+        policy = agents[row].policy
+        k = strings.get(key)
+        if count >= 0:
+            policy.action_counts[k] = count
+        if has_reward:
+            policy.action_rewards[k] = RewardVector(status=status, affiliation=affiliation)
+
+
+def _load_gsr(arrays, meta: Dict[str, Any], gsr, strings: _Strings) -> None:
+    gsr.default_truth = meta["gsr"]["default_truth"]
+    gsr.default_volatility = meta["gsr"]["default_volatility"]
+
+    us = arrays["gsr/rel_u"].tolist()
+    vs = arrays["gsr/rel_v"].tolist()
+    rels = [RelationshipVector() for _ in us]
+    _unpack_scalars(arrays, "gsr/rel", rels)
+    alignment = _unpack_map(arrays, "gsr/rel_alignment", len(rels), strings)
+    relations = {}
+    for u, v, rel, align in zip(us, vs, rels, alignment):
+        rel.topic_alignment = align
+        relations[(strings.get(u), strings.get(v))] = rel
+    gsr._relations = relations
+
+    topic_ids = arrays["gsr/topic"].tolist()
+    topics = [TopicReality() for _ in topic_ids]
+    _unpack_scalars(arrays, "gsr/topic", topics)
+    gsr.topics = {strings.get(t): tr for t, tr in zip(topic_ids, topics)}
+
+
+def _load_network(arrays, graph, strings: _Strings) -> None:
+    nodes = [strings.get(i) for i in arrays["net/nodes"].tolist()]
+    src = arrays["net/src"].tolist()
+    dst = arrays["net/dst"].tolist()
+    trust = arrays["net/trust"].tolist()
+    # Replaying add_edge in insertion order restores node interning and edge order.
+    for s, d, tr in zip(src, dst, trust):
+        graph.add_edge(nodes[s], nodes[d], trust=tr)
+
+
+def _load_geo(arrays, meta: Dict[str, Any], geo, strings: _Strings) -> None:
+    cfg = meta["geo"]
+    geo.enable_life_cycle = cfg["enable_life_cycle"]
+    geo.set_resolution(cfg["h3_resolution"])
+    geo.set_bbox(cfg["bbox"])
+    geo.agent_scale = cfg["agent_scale"]
+    geo.population_csv_path = cfg["population_csv_path"]
+    geo.life_profile = LifeProfile(**cfg["life_profile"])
+
+    sched_agents = arrays["geo/sched_agent"].tolist()
+    phases = arrays["geo/sched_phase"].tolist()
+    plans = arrays["geo/sched_plan"].tolist()
+    schedules: Dict[str, Schedule] = {}
+    for aid, phase_row, plan_row in zip(sched_agents, phases, plans):
+        sched = Schedule()
+        for t, p in enumerate(phase_row):
+            if p >= 0:
+                sched.daily_phase[t] = _PHASES[p]
+        for t, cell in enumerate(plan_row):
+            if cell >= 0:
+                sched.daily_plan[t] = strings.get(cell)
+        schedules[strings.get(aid)] = sched
+    geo.schedules = schedules
+
+    for name in ("agent_home", "agent_work"):
+        agents = arrays[f"geo/{name}/agent"].tolist()
+        cells = arrays[f"geo/{name}/cell"].tolist()
+        setattr(geo, name, {strings.get(a): strings.get(c) for a, c in zip(agents, cells)})
+
+    geo.agent_social_factors = {
+        strings.get(a): v
+        for a, v in zip(arrays["geo/social/agent"].tolist(), arrays["geo/social/val"].tolist())
+    }
+
+    home = {name: arrays[f"geo/home_geo/{name}"].tolist() for name in ("agent", "lat", "lon", "cell_id", "country", "admin1", "admin2")}
+    geo.agent_home_geo = {
+        strings.get(home["agent"][i]): GeoLocation(
+            cell_id=strings.get(home["cell_id"][i]),
+            lat=home["lat"][i],
+            lon=home["lon"][i],
+            country=strings.get(home["country"][i]),
+            admin1=strings.get(home["admin1"][i]),
+            admin2=strings.get(home["admin2"][i]),
+        )
+        for i in range(len(home["agent"]))
+    }
+    geo.invalidate_availability()
+
+    pop = geo.population
+    pop.min_population = cfg["population"]["min_population"]
+    pop.max_population = cfg["population"]["max_population"]
+    cells = [strings.get(c) for c in arrays["geo/pop/cell"].tolist()]
+    pop.cell_weights = dict(zip(cells, arrays["geo/pop/weight"].tolist()))
+    cell_meta = _unpack_map(arrays, "geo/pop/meta", len(cells), strings, str_values=True)
+    pop.cell_meta = {c: m for c, m in zip(cells, cell_meta) if m}
+    pop._build_sampler()
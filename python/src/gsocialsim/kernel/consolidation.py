@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+"""
+Batched belief-delta application for CONSOLIDATE(t).
+
+Queued (agent_id, BeliefDelta) tuples are flattened into columnar buffers
+(group index, stance delta, confidence delta), where a group is one
+(agent, topic) cell. Deltas are summed per group with a scatter-add, applied
+once with clamping, and sign crossings are found as one vectorized mask over
+the groups. Attribution only runs for the rows that crossed.
+
+Semantics vs. applying deltas one at a time:
+  - clamping happens once on the net per-tick change of a cell, not after each
+    delta (e.g. +0.5 then -0.5 on a stance of 0.8 now leaves it at 0.8);
+  - a cell crosses at most once per tick, judged on its stance before and after
+    the whole tick's deltas.
+
+Cells bound to a BeliefTensor are gathered/scattered with fancy indexing; cells
+in standalone dict stores are read and written per TopicBelief.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+import numpy as np
+
+from gsocialsim.agents.belief_state import TopicBelief
+
+if TYPE_CHECKING:
+    from gsocialsim.kernel.world_kernel import WorldKernel
+
+
+def apply_belief_deltas(kernel: "WorldKernel", t: int, queued: List[Tuple[str, Any]]) -> None:
+    if not queued:
+        return
+    agents = kernel.agents
+    analytics = kernel.analytics
+
+    # ---- Columnar buffers (one row per valid delta) ----
+    group_of: Dict[Tuple[str, str], int] = {}
+    group_agent: List[Any] = []
+    group_agent_id: List[str] = []
+    group_topic: List[str] = []
+    row_group: List[int] = []
+    row_stance: List[float] = []
+    row_conf: List[float] = []
+    applied: List[Tuple[str, Any]] = []
+    for agent_id, delta in queued:
+        agent = agents.get(agent_id)
+        if not agent:
+            continue
+        try:
+            topic = delta.topic_id
+            sd = float(delta.stance_delta)
+            cd = float(delta.confidence_delta)
+        except Exception:
+            continue
+        key = (agent_id, topic)
+        g = group_of.get(key)
+        if g is None:
+            g = len(group_agent)
+            group_of[key] = g
+            group_agent.append(agent)
+            group_agent_id.append(agent_id)
+            group_topic.append(topic)
+        row_group.append(g)
+        row_stance.append(sd)
+        row_conf.append(cd)
+        applied.append((agent_id, delta))
+    if not row_group:
+        return
+
+    # ---- Grouped scatter-add ----
+    n_groups = len(group_agent)
+    groups = np.asarray(row_group, dtype=np.int64)
+    net_stance = np.bincount(groups, weights=np.asarray(row_stance, dtype=np.float64), minlength=n_groups)
+    net_conf = np.bincount(groups, weights=np.asarray(row_conf, dtype=np.float64), minlength=n_groups)
+
+    old_stance = np.zeros(n_groups, dtype=np.float64)
+    new_stance = np.zeros(n_groups, dtype=np.float64)
+
+    # ---- Partition cells by storage ----
+    by_tensor: Dict[int, Tuple[Any, List[int]]] = {}
+    dict_groups: List[int] = []
+    for g, agent in enumerate(group_agent):
+        tensor = getattr(agent.beliefs, "tensor", None)
+        if tensor is not None:
+            by_tensor.setdefault(id(tensor), (tensor, []))[1].append(g)
+        else:
+            dict_groups.append(g)
+
+    for tensor, members in by_tensor.values():
+        idx = np.asarray(members, dtype=np.int64)
+        rows = np.fromiter((group_agent[g].beliefs.row for g in members), dtype=np.int64, count=len(members))
+        # ensure() creates missing beliefs zero-initialized (and may grow the arrays).
+        cols = np.fromiter(
+            (tensor.ensure(int(r), group_topic[g]) for r, g in zip(rows.tolist(), members)),
+            dtype=np.int64,
+            count=len(members),
+        )
+        s0 = tensor.stance[rows, cols].astype(np.float64)
+        c0 = tensor.confidence[rows, cols].astype(np.float64)
+        tensor.stance[rows, cols] = np.clip(s0 + net_stance[idx], -1.0, 1.0)
+        tensor.confidence[rows, cols] = np.clip(c0 + net_conf[idx], 0.0, 1.0)
+        old_stance[idx] = s0
+        new_stance[idx] = tensor.stance[rows, cols]
+
+    if dict_groups:
+        cells: List[TopicBelief] = []
+        for g in dict_groups:
+            topics = group_agent[g].beliefs.topics
+            topic = group_topic[g]
+            belief = topics.get(topic)
+            if belief is None:
+                belief = TopicBelief(topic=topic)
+                topics[topic] = belief
+            cells.append(belief)
+        idx = np.asarray(dict_groups, dtype=np.int64)
+        s0 = np.fromiter((b.stance for b in cells), dtype=np.float64, count=len(cells))
+        c0 = np.fromiter((b.confidence for b in cells), dtype=np.float64, count=len(cells))
+        s1 = np.clip(s0 + net_stance[idx], -1.0, 1.0)
+        c1 = np.clip(c0 + net_conf[idx], 0.0, 1.0)
+        for belief, s, c in zip(cells, s1.tolist(), c1.tolist()):
+            belief.stance = s
+            belief.confidence = c
+        old_stance[idx] = s0
+        new_stance[idx] = s1
+
+    # Applied delta log (canonical); only produces output in debug mode.
+    if getattr(analytics, "enable_debug_logging", False):
+        for agent_id, delta in applied:
+            try:
+                analytics.log_belief_update(timestamp=t, agent_id=agent_id, delta=delta)
+            except Exception:
+                pass
+
+    # ---- Crossing detection ----
+    detector = analytics.crossing_detector
+    check_many = getattr(detector, "check_many", None)
+    if callable(check_many):
+        crossed = np.flatnonzero(check_many(old_stance, new_stance))
+    else:
+        crossed = [g for g in range(n_groups) if detector.check(float(old_stance[g]), float(new_stance[g]))]
+    if len(crossed) == 0:
+        return
+
+    from gsocialsim.analytics.attribution import BeliefCrossingEvent
+
+    for g in np.asarray(crossed).tolist():
+        try:
+            attribution = analytics.attribution_engine.assign_credit(
+                agent_id=group_agent_id[g],
+                topic=group_topic[g],
+                history=analytics.exposure_history,
+            )
+            analytics.log_belief_crossing(
+                BeliefCrossingEvent(
+                    timestamp=t,
+                    agent_id=group_agent_id[g],
+                    topic=group_topic[g],
+                    old_stance=float(old_stance[g]),
+                    new_stance=float(new_stance[g]),
+                    attribution=attribution,
+                )
+            )
+        except Exception:
+            pass
@@ -5,11 +5,10 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import TYPE_CHECKING, Optional, Set
 import itertools
-import random
 
 from gsocialsim.agents.budget_state import BudgetKind
-from gsocialsim.stimuli.content_item import ContentItem
 from gsocialsim.agents.impression import Impression, IntakeMode
+from gsocialsim.kernel.stimulus_ingestion import stimulus_topic_id
 from gsocialsim.types import TopicId
 
 if TYPE_CHECKING:
@@ -34,64 +33,6 @@ class EventPhase(IntEnum):
     DAY_BOUNDARY = 90
 
 
-def _stimulus_topic_id(stimulus: "Stimulus") -> TopicId:
-    raw = getattr(stimulus, "metadata", None) or {}
-    t = raw.get("topic")
-
-    if t is None:
-        return TopicId("T_Original")
-
-    if isinstance(t, str):
-        t = t.strip()
-        return TopicId(t if t else "T_Original")
-
-    return TopicId(str(t))
-
-
-def _stimulus_stance(stimulus: "Stimulus") -> float:
-    raw = getattr(stimulus, "stance_hint", None)
-    if raw is None:
-        raw = getattr(stimulus, "metadata", None) or {}
-        raw = raw.get("stance")
-    try:
-        v = float(raw) if raw is not None else 0.0
-    except Exception:
-        v = 0.0
-    if raw is None:
-        # Deterministic small bias per stimulus when stance is unspecified
-        topic = _stimulus_topic_id(stimulus)
-        seed = hash(f"{stimulus.id}:{topic}") & 0xFFFFFFFF
-        rng = random.Random(seed)
-        v = rng.uniform(-0.35, 0.35)
-    return max(-1.0, min(1.0, v))
-
-
-def _stimulus_identity_threat(stimulus: "Stimulus") -> Optional[float]:
-    raw = getattr(stimulus, "metadata", None) or {}
-    for key in ("identity_threat", "threat"):
-        if key in raw:
-            try:
-                v = float(raw.get(key))
-                return max(0.0, min(1.0, v))
-            except Exception:
-                return None
-    return None
-
-
-def _stimulus_political_salience(stimulus: "Stimulus") -> Optional[float]:
-    raw_val = getattr(stimulus, "political_salience", None)
-    if raw_val is None:
-        raw = getattr(stimulus, "metadata", None) or {}
-        raw_val = raw.get("political_salience")
-    try:
-        v = float(raw_val) if raw_val is not None else None
-    except Exception:
-        v = None
-    if v is None:
-        return None
-    return max(0.0, min(1.0, v))
-
-
 def _get_followers(context: "WorldContext", author_id: str) -> Set[str]:
     try:
         return set(context.network.graph.get_followers(author_id))
@@ -228,30 +169,17 @@ class StimulusPerceptionEvent(Event):
         if not stimulus:
             return
 
-        topic = _stimulus_topic_id(stimulus)
+        engine = context.stimulus_engine
+        temp_content = engine.content_for(stimulus)
+        topic = temp_content.topic
         try:
-            pol = _stimulus_political_salience(stimulus)
+            pol = engine.political_salience(stimulus.id)
             if pol is not None and context.gsr is not None:
                 current = float(getattr(context.gsr.ensure_topic(topic), "political_salience", 0.0))
                 context.gsr.set_political_salience(topic, max(current, pol))
         except Exception:
             pass
 
-        temp_content = ContentItem(
-            id=stimulus.id,
-            author_id=stimulus.source,
-            topic=topic,
-            stance=_stimulus_stance(stimulus),
-            content_text=getattr(stimulus, "content_text", None),
-            identity_threat=_stimulus_identity_threat(stimulus),
-            primal_triggers=list(getattr(stimulus, "primal_triggers", []) or []),
-            primal_intensity=getattr(stimulus, "primal_intensity", None),
-            media_type=getattr(stimulus, "media_type", None),
-            outlet_id=getattr(stimulus, "outlet_id", None),
-            community_id=getattr(stimulus, "community_id", None),
-            provenance={"stimulus_id": stimulus.id, "source": stimulus.source},
-        )
-
         recipients = _select_stimulus_recipients(context, stimulus, topic)
         for agent_id in recipients:
             agent = context.agents.get(agent_id)
@@ -311,13 +239,13 @@ class InteractionPerceptionEvent(Event):
         elif self.interaction.verb == InteractionVerb.LIKE:
             stimulus = context.stimulus_engine.get_stimulus(self.interaction.target_stimulus_id)
             if stimulus:
-                topic = _stimulus_topic_id(stimulus)
+                topic = stimulus_topic_id(stimulus)
                 reward.affiliation = 0.2
 
         elif self.interaction.verb == InteractionVerb.FORWARD:
             stimulus = context.stimulus_engine.get_stimulus(self.interaction.target_stimulus_id)
             if stimulus:
-                topic = _stimulus_topic_id(stimulus)
+                topic = stimulus_topic_id(stimulus)
                 reward.status = 0.3
 
         if topic and author:
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+"""
+Lazy per-agent feeds over shared content segments.
+
+During PERCEIVE every agent's feed is the tick's broadcast content, followed by
+the content of each followed author that posted, followed by the agent's own
+posts. Those pieces are the same lists for every viewer, so a FeedView keeps
+references to them (segments) plus cumulative offsets instead of copying the
+items into a fresh list per agent.
+
+FeedView is a read-only Sequence: len(), indexing, slicing and iteration walk
+the segments in order. random.Random.sample would still copy a view into a list
+(it does list(population) for small samples), so sample_feed() samples indices
+instead and looks up only the picked items. It draws the same indices, so it
+returns exactly what sampling the concatenated list would.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import chain
+from typing import Iterable, Iterator, List, TypeVar
+import random
+
+T = TypeVar("T")
+
+
+class FeedView(Sequence):
+    __slots__ = ("_segments", "_offsets", "_len")
+
+    def __init__(self, segments: Iterable[List[T]] = ()) -> None:
+        self._segments: List[List[T]] = []
+        self._offsets: List[int] = []
+        n = 0
+        for seg in segments:
+            if not seg:
+                continue
+            self._segments.append(seg)
+            self._offsets.append(n)
+            n += len(seg)
+        self._len = n
+
+    @property
+    def segments(self) -> List[List[T]]:
+        return self._segments
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __bool__(self) -> bool:
+        return self._len > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        i = int(index)
+        if i < 0:
+            i += self._len
+        if i < 0 or i >= self._len:
+            raise IndexError("feed index out of range")
+        s = bisect_right(self._offsets, i) - 1
+        return self._segments[s][i - self._offsets[s]]
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._segments)
+
+    def __repr__(self) -> str:
+        return f"FeedView(len={self._len}, segments={len(self._segments)})"
+
+
+def sample_feed(feed: FeedView, k: int, rng: random.Random) -> List[T]:
+    """rng.sample(feed, k), drawn by index without concatenating the segments."""
+    return [feed[i] for i in rng.sample(range(len(feed)), k)]
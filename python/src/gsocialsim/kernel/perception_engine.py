@@ -0,0 +1,533 @@
+from __future__ import annotations
+
+"""
+Population-wide vectorized perception for PERCEIVE_BATCH(t).
+
+The agent-centric batch path walks every agent, builds a Python feed list and
+calls Agent.plan_perception item by item. This engine instead builds a single
+(agent, content) pair table for the tick and runs the planning stages as NumPy
+array operations over the whole population:
+
+  1) feed construction      -> pair_agent / pair_content index arrays
+  2) max_perceptions sample -> random sort keys, top-k per agent segment
+  3) exposure/consume rolls -> one uniform draw per pair and stage
+  4) attention cost         -> per-content cost gathered per pair
+  5) time-budget gating     -> segmented cumulative cost vs per-agent budget
+  6) belief deltas          -> fast.compute_belief_deltas over consumed pairs
+
+Random draws in 2) and 3) come from each agent's counter-based stream
+(agents/agent_rng.py), keyed by purpose, tick and the pair's position in the
+agent's feed, so they do not depend on agent order or shard layout.
+
+Only exposed pairs that survive gating are materialized as PerceptionPlans and
+applied through Agent.apply_perception_plan, so analytics, trust updates and
+belief-delta queuing keep their existing semantics.
+
+Gating model:
+  Items are admitted in feed order while their cumulative cost (exposure, plus
+  consumption when the consume roll succeeds) fits the agent's remaining
+  minutes. The first item that overflows is downgraded to exposure-only when
+  its exposure cost still fits; everything after it is dropped.
+"""
+
+import copy
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from gsocialsim.agents.agent import PerceptionPlan
+from gsocialsim.agents.agent_rng import agent_key, derive_keys, uniform_at
+from gsocialsim.agents.attention_system import AttentionSystem
+from gsocialsim.agents.belief_update_engine import BeliefDelta
+from gsocialsim.fast import perception as fast
+from gsocialsim.social.politics import DEFAULT_POLITICAL_TOPICS, effective_lean
+from gsocialsim.stimuli.content_item import ContentItem
+
+if TYPE_CHECKING:
+    from gsocialsim.kernel.world_kernel import WorldKernel
+
+
+@dataclass
+class PairTable:
+    """Flat (agent, content) pair table for one tick, grouped by agent."""
+    agent_idx: np.ndarray     # int64 [pairs]
+    content_idx: np.ndarray   # int64 [pairs]
+    starts: np.ndarray        # int64 [agents-with-feed] segment start offsets
+
+    def __len__(self) -> int:
+        return int(self.agent_idx.shape[0])
+
+
+def _segment_starts(agent_idx: np.ndarray) -> np.ndarray:
+    if agent_idx.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    change = np.empty(agent_idx.shape[0], dtype=bool)
+    change[0] = True
+    np.not_equal(agent_idx[1:], agent_idx[:-1], out=change[1:])
+    return np.flatnonzero(change)
+
+
+def _segmented_cumsum(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Inclusive cumulative sum that restarts at every segment start."""
+    if values.size == 0:
+        return values.copy()
+    cs = np.cumsum(values)
+    offsets = cs[starts] - values[starts]
+    lengths = np.diff(np.append(starts, values.shape[0]))
+    return cs - np.repeat(offsets, lengths)
+
+
+def _segment_rank(starts: np.ndarray, n: int) -> np.ndarray:
+    """Position of each pair within its agent segment."""
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    lengths = np.diff(np.append(starts, n))
+    return np.arange(n, dtype=np.int64) - np.repeat(starts, lengths)
+
+
+def _pair_uniform(rng_keys: np.ndarray, purpose: str, pairs: "PairTable", rank: np.ndarray, t: int) -> np.ndarray:
+    """
+    One counter-based uniform per pair: draw `rank` (position in the agent's feed)
+    of tick t on the agent's `purpose` stream. Independent of agent order and sharding.
+    """
+    keys = derive_keys(rng_keys, purpose)
+    return uniform_at(keys[pairs.agent_idx], t, rank)
+
+
+class VectorizedPerceptionEngine:
+    """
+    Batched perception over the whole population for a single tick.
+
+    Assumes agents share the default AttentionSystem model (impressions are
+    evaluated once per content item and copied per exposed viewer).
+    """
+
+    def __init__(self, kernel: "WorldKernel") -> None:
+        self.kernel = kernel
+        self.attention = AttentionSystem()
+
+    # -------------------------
+    # Public entry point
+    # -------------------------
+
+    def run(self, t: int, content_items: List[ContentItem]) -> None:
+        if not content_items:
+            return
+        kernel = self.kernel
+        perf = kernel.perf
+        detailed = perf.enabled and perf.level == "detailed"
+
+        agent_ids = list(kernel.active_agent_ids())
+        if not agent_ids:
+            return
+        agent_index = {aid: i for i, aid in enumerate(agent_ids)}
+
+        with perf.time("vector/content_arrays") if detailed else _NULL:
+            cache = kernel.world_context.impression_template_cache()
+            templates = [self.attention.template(c, cache=cache) for c in content_items]
+            consumed_prob = np.asarray([float(imp.consumed_prob) for imp in templates], dtype=np.float64)
+            attention_cost = np.asarray(
+                [float(getattr(imp, "attention_cost_minutes", 0.0)) for imp in templates], dtype=np.float64
+            )
+
+        with perf.time("vector/agent_arrays") if detailed else _NULL:
+            budget = self._agent_budgets(agent_ids)
+            read_pref = self._read_propensities(agent_ids)
+            rng_keys = self._agent_rng_keys(agent_ids)
+
+        with perf.time("vector/pair_table") if detailed else _NULL:
+            pairs = self._build_pairs(agent_ids, agent_index, content_items, budget)
+        if len(pairs) == 0:
+            return
+
+        max_items = int(kernel.max_perceptions_per_tick) if kernel.max_perceptions_per_tick else 0
+        if max_items > 0:
+            with perf.time("vector/sample") if detailed else _NULL:
+                pairs = self._sample_pairs(pairs, max_items, rng_keys, t)
+
+        with perf.time("vector/rolls") if detailed else _NULL:
+            n = len(pairs)
+            rank = _segment_rank(pairs.starts, n)
+            exposed = _pair_uniform(rng_keys, "perceive/expose", pairs, rank, t) < read_pref[pairs.agent_idx]
+            consumed = exposed & (
+                _pair_uniform(rng_keys, "perceive/consume", pairs, rank, t) < consumed_prob[pairs.content_idx]
+            )
+
+            cost = attention_cost[pairs.content_idx]
+            exposure_cost = np.clip(0.15 * cost, 0.05, 0.5)
+            extra_cost = np.maximum(0.0, cost - exposure_cost)
+
+        with perf.time("vector/gating") if detailed else _NULL:
+            exposed, consumed = self._gate(pairs, exposed, consumed, exposure_cost, extra_cost, budget)
+
+        sel = np.flatnonzero(exposed)
+        if sel.size == 0:
+            return
+
+        with perf.time("vector/impressions") if detailed else _NULL:
+            plans = self._build_plans(
+                agent_ids, content_items, templates, pairs, sel, consumed, exposure_cost, extra_cost, cost
+            )
+
+        with perf.time("vector/belief_deltas") if detailed else _NULL:
+            self._attach_belief_deltas(plans)
+
+        with perf.time("vector/apply") if detailed else _NULL:
+            ctx = kernel.world_context
+            agents = kernel.agents
+            for plan in plans:
+                agent = agents.get(plan.agent_id)
+                if agent is not None:
+                    agent.apply_perception_plan(plan, ctx)
+
+    # -------------------------
+    # Stage helpers
+    # -------------------------
+
+    def _agent_budgets(self, agent_ids: List[str]) -> np.ndarray:
+        # No budget set means "unbounded" (same as WorldContext.spend_time).
+        return self.kernel.world_context.time_remaining_by_agent.remaining_many(agent_ids, default=np.inf)
+
+    def _agent_rng_keys(self, agent_ids: List[str]) -> np.ndarray:
+        agents = self.kernel.agents
+        out = np.empty(len(agent_ids), dtype=np.uint64)
+        for i, aid in enumerate(agent_ids):
+            agent = agents[aid]
+            key = getattr(agent.rng, "key", None)
+            out[i] = agent_key(agent.seed, aid) if key is None else key
+        return out
+
+    def _read_propensities(self, agent_ids: List[str]) -> np.ndarray:
+        agents = self.kernel.agents
+        out = np.empty(len(agent_ids), dtype=np.float64)
+        for i, aid in enumerate(agent_ids):
+            prefs = getattr(agents[aid], "activity", None)
+            try:
+                out[i] = float(getattr(prefs, "read_propensity", 0.5)) if prefs else 0.5
+            except Exception:
+                out[i] = 0.5
+        return out
+
+    def _build_pairs(
+        self,
+        agent_ids: List[str],
+        agent_index: Dict[str, int],
+        content_items: List[ContentItem],
+        budget: np.ndarray,
+    ) -> PairTable:
+        """
+        Pair table in feed order (broadcast, followed authors, own posts) per agent.
+
+        Followed-author pairs come from the graph's cached follower (CSC) views of
+        the authors that posted this tick, so no per-agent following lists are built.
+        """
+        graph = self.kernel.network.graph
+
+        by_author: Dict[str, List[int]] = {}
+        for j, content in enumerate(content_items):
+            by_author.setdefault(str(getattr(content, "author_id", "")), []).append(j)
+        author_arrays = {a: np.asarray(idx, dtype=np.int64) for a, idx in by_author.items()}
+
+        broadcast: List[int] = []
+        for author, idx in by_author.items():
+            try:
+                has_followers = graph.follower_count(author) > 0
+            except Exception:
+                has_followers = False
+            if not has_followers:
+                broadcast.extend(idx)
+
+        active = budget > 0.0
+        agent_parts: List[np.ndarray] = []
+        content_parts: List[np.ndarray] = []
+        rank_parts: List[np.ndarray] = []
+
+        def add(viewers: np.ndarray, items: np.ndarray, first_rank: int) -> None:
+            agent_parts.append(np.repeat(viewers, items.shape[0]))
+            content_parts.append(np.tile(items, viewers.shape[0]))
+            rank_parts.append(np.tile(first_rank + np.arange(items.shape[0], dtype=np.int64), viewers.shape[0]))
+
+        rank = 0
+        if broadcast:
+            viewers = np.flatnonzero(active)
+            if viewers.size:
+                add(viewers, np.asarray(broadcast, dtype=np.int64), rank)
+            rank += len(broadcast)
+
+        node_ids = getattr(graph, "node_ids", [])
+        node_to_agent = np.full(len(node_ids), -1, dtype=np.int64)
+        for i, aid in enumerate(agent_ids):
+            ni = graph.node_index(aid)
+            if ni >= 0:
+                node_to_agent[ni] = i
+        for author, items in author_arrays.items():
+            followers = graph.followers_view(author)
+            if followers.size:
+                viewers = node_to_agent[followers]
+                viewers = viewers[viewers >= 0]
+                viewers = viewers[active[viewers]]
+                if viewers.size:
+                    add(viewers, items, rank)
+            rank += items.shape[0]
+
+        # Ensure self-authored posts are visible to the author.
+        for author, items in author_arrays.items():
+            i = agent_index.get(author)
+            if i is None or not active[i]:
+                continue
+            add(np.asarray([i], dtype=np.int64), items, rank)
+            rank += items.shape[0]
+
+        if not agent_parts:
+            empty = np.zeros(0, dtype=np.int64)
+            return PairTable(agent_idx=empty, content_idx=empty, starts=empty)
+
+        agent_idx = np.concatenate(agent_parts)
+        content_idx = np.concatenate(content_parts)
+        order = np.lexsort((np.concatenate(rank_parts), agent_idx))
+        agent_idx = agent_idx[order]
+        content_idx = content_idx[order]
+        return PairTable(agent_idx=agent_idx, content_idx=content_idx, starts=_segment_starts(agent_idx))
+
+    def _sample_pairs(self, pairs: PairTable, max_items: int, rng_keys: np.ndarray, t: int) -> PairTable:
+        n = len(pairs)
+        lengths = np.diff(np.append(pairs.starts, n))
+        over = np.repeat(lengths > max_items, lengths)
+        if not over.any():
+            return pairs
+        # Oversized feeds get a random order (like random.sample); others keep feed order.
+        rank = _segment_rank(pairs.starts, n)
+        key = np.where(over, _pair_uniform(rng_keys, "perceive/sample", pairs, rank, t), rank.astype(np.float64))
+        order = np.lexsort((key, pairs.agent_idx))
+        agent_idx = pairs.agent_idx[order]
+        content_idx = pairs.content_idx[order]
+        keep = _segment_rank(pairs.starts, n) < max_items
+        agent_idx = agent_idx[keep]
+        content_idx = content_idx[keep]
+        return PairTable(agent_idx=agent_idx, content_idx=content_idx, starts=_segment_starts(agent_idx))
+
+    def _gate(
+        self,
+        pairs: PairTable,
+        exposed: np.ndarray,
+        consumed: np.ndarray,
+        exposure_cost: np.ndarray,
+        extra_cost: np.ndarray,
+        budget: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        full = np.where(exposed, exposure_cost + np.where(consumed, extra_cost, 0.0), 0.0)
+        cum = _segmented_cumsum(full, pairs.starts)
+        prev = cum - full
+        limit = budget[pairs.agent_idx]
+
+        over = cum > limit
+        overflow_seen = _segmented_cumsum(over.astype(np.int64), pairs.starts)
+        admitted = overflow_seen == 0
+        first_over = over & (overflow_seen == 1)
+        downgrade = first_over & exposed & (prev + exposure_cost <= limit) & (prev < limit)
+
+        return (exposed & (admitted | downgrade)), (consumed & admitted)
+
+    def _build_plans(
+        self,
+        agent_ids: List[str],
+        content_items: List[ContentItem],
+        templates: list,
+        pairs: PairTable,
+        sel: np.ndarray,
+        consumed: np.ndarray,
+        exposure_cost: np.ndarray,
+        extra_cost: np.ndarray,
+        cost: np.ndarray,
+    ) -> List[PerceptionPlan]:
+        kernel = self.kernel
+        agents = kernel.agents
+        gsr = kernel.gsr
+
+        pol_salience: Dict[str, float] = {}
+        lean_cache: Dict[Tuple[int, str], Tuple[float, float]] = {}
+
+        plans: List[PerceptionPlan] = []
+        a_idx = pairs.agent_idx[sel].tolist()
+        c_idx = pairs.content_idx[sel].tolist()
+        consumed_sel = consumed[sel].tolist()
+        exp_sel = exposure_cost[sel].tolist()
+        extra_sel = extra_cost[sel].tolist()
+        cost_sel = cost[sel].tolist()
+        priors = self._gather_priors(agent_ids, content_items, pairs.agent_idx[sel], pairs.content_idx[sel])
+
+        for k in range(len(a_idx)):
+            i = a_idx[k]
+            j = c_idx[k]
+            agent_id = agent_ids[i]
+            agent = agents[agent_id]
+            content = content_items[j]
+
+            impression = copy.copy(templates[j])
+            if content.author_id == agent_id:
+                impression.is_self_source = True
+
+            # Political identity threat (viewer-specific overlay on the shared template)
+            topic = impression.topic
+            sal = pol_salience.get(topic)
+            if sal is None:
+                try:
+                    sal = float(getattr(gsr.ensure_topic(topic), "political_salience", 0.0))
+                except Exception:
+                    sal = 0.0
+                pol_salience[topic] = sal
+            if sal > 0.0:
+                lp = lean_cache.get((i, topic))
+                if lp is None:
+                    lp = self._lean_and_partisanship(agent, topic)
+                    lean_cache[(i, topic)] = lp
+                lean_eff, part = lp
+                pol_threat = sal * max(0.0, -float(impression.stance_signal) * lean_eff) * part
+                if pol_threat > 0.0:
+                    impression.identity_threat = max(float(impression.identity_threat), pol_threat)
+
+            if priors is not None:
+                has_belief = priors[0][k]
+                old_stance = priors[1][k] if has_belief else 0.0
+            else:
+                prior = agent.beliefs.get(content.topic)
+                has_belief = prior is not None
+                old_stance = prior.stance if prior else 0.0
+            plans.append(
+                PerceptionPlan(
+                    agent_id=agent_id,
+                    content=content,
+                    impression=impression,
+                    is_physical=False,
+                    stimulus_id=None,
+                    exposed=True,
+                    consumed_roll=bool(consumed_sel[k]),
+                    has_belief=has_belief,
+                    attention_cost=cost_sel[k],
+                    exposure_cost=exp_sel[k],
+                    consumption_extra_cost=extra_sel[k] if consumed_sel[k] else 0.0,
+                    belief_delta=None,
+                    old_stance=old_stance,
+                )
+            )
+        return plans
+
+    def _gather_priors(
+        self,
+        agent_ids: List[str],
+        content_items: List[ContentItem],
+        a_idx: np.ndarray,
+        c_idx: np.ndarray,
+    ) -> Optional[Tuple[List[bool], List[float]]]:
+        """
+        Gather (has_belief, stance) for selected pairs straight from the population
+        BeliefTensor. Returns None when beliefs are not tensor-backed.
+        """
+        tensor = getattr(self.kernel.agents, "belief_tensor", None)
+        if tensor is None:
+            return None
+        agents = self.kernel.agents
+        rows = np.empty(len(agent_ids), dtype=np.int64)
+        for i, aid in enumerate(agent_ids):
+            beliefs = agents[aid].beliefs
+            if beliefs.tensor is not tensor:
+                return None
+            rows[i] = beliefs.row
+        cols = np.asarray(
+            [tensor.topic_index.get(c.topic, -1) for c in content_items], dtype=np.int64
+        )
+        r = rows[a_idx]
+        c = cols[c_idx]
+        known = c >= 0
+        c_safe = np.where(known, c, 0)
+        has = known & tensor.present[r, c_safe]
+        stance = np.where(has, tensor.stance[r, c_safe], 0.0).astype(np.float64)
+        return has.tolist(), stance.tolist()
+
+    @staticmethod
+    def _lean_and_partisanship(agent, topic: str) -> Tuple[float, float]:
+        try:
+            seed = DEFAULT_POLITICAL_TOPICS.get(topic)
+            lean = float(getattr(agent.identity, "political_lean", 0.0))
+            dims = getattr(agent.identity, "political_dimensions", None)
+            lean_eff = effective_lean(lean, dims, seed) if seed is not None else lean
+            part = max(0.0, min(1.0, float(getattr(agent.identity, "partisanship", 0.0))))
+        except Exception:
+            return 0.0, 0.0
+        return lean_eff, part
+
+    def _attach_belief_deltas(self, plans: List[PerceptionPlan]) -> None:
+        consumed = [p for p in plans if p.consumed_roll]
+        if not consumed:
+            return
+        kernel = self.kernel
+        agents = kernel.agents
+        gsr = kernel.gsr
+
+        if not fast.HAS_BATCH:
+            for plan in consumed:
+                agent = agents[plan.agent_id]
+                plan.belief_delta = agent.belief_update_engine.update(
+                    viewer=agent,
+                    content_author_id=plan.content.author_id,
+                    impression=plan.impression,
+                    gsr=gsr,
+                )
+            return
+
+        m = len(consumed)
+        stance_signal = np.empty(m, dtype=np.float32)
+        current_stance = np.empty(m, dtype=np.float32)
+        has_belief = np.empty(m, dtype=np.bool_)
+        trust = np.empty(m, dtype=np.float32)
+        credibility = np.empty(m, dtype=np.float32)
+        primal_activation = np.empty(m, dtype=np.float32)
+        identity_threat = np.empty(m, dtype=np.float32)
+        is_self_source = np.empty(m, dtype=np.bool_)
+        identity_rigidity = np.empty(m, dtype=np.float32)
+        is_physical = np.zeros(m, dtype=np.bool_)
+
+        for k, plan in enumerate(consumed):
+            imp = plan.impression
+            agent = agents[plan.agent_id]
+            stance_signal[k] = float(imp.stance_signal)
+            current_stance[k] = float(plan.old_stance)
+            has_belief[k] = bool(plan.has_belief)
+            rel = gsr.get_relationship(plan.agent_id, plan.content.author_id)
+            trust[k] = float(getattr(rel, "trust", 0.0))
+            credibility[k] = float(imp.credibility_signal)
+            primal_activation[k] = float(imp.primal_activation)
+            identity_threat[k] = float(imp.identity_threat)
+            is_self_source[k] = bool(getattr(imp, "is_self_source", False))
+            identity_rigidity[k] = float(getattr(agent.identity, "identity_rigidity", 0.5))
+
+        sd, cd = fast.compute_belief_deltas(
+            stance_signal,
+            current_stance,
+            has_belief,
+            trust,
+            credibility,
+            primal_activation,
+            identity_threat,
+            is_self_source,
+            identity_rigidity,
+            is_physical,
+        )
+        for k, plan in enumerate(consumed):
+            plan.belief_delta = BeliefDelta(
+                topic_id=plan.content.topic,
+                stance_delta=float(sd[k]),
+                confidence_delta=float(cd[k]),
+            )
+
+
+class _NullContext:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullContext()
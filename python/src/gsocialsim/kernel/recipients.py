@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+"""
+Cached recipient lists for the per-content delivery path.
+
+_eligible_recipients_for_author() used to rebuild and sort a set for every
+delivered item: the author's followers (plus the author), or, for authors
+without followers, the whole population. RecipientIndex keeps
+
+  - the sorted population (the broadcast recipient list), and
+  - a sorted recipient list per author, built on first use from the cached
+    follower (CSC) view of the follow graph,
+
+and is rebuilt when the population version or the graph topology version
+changes. Lists are shared between callers and must not be mutated.
+
+sample_recipients() draws max_recipients_per_content by index over a range,
+which picks exactly the items random.Random.sample would pick from the list
+without copying it.
+"""
+
+import random
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from gsocialsim.kernel.world_kernel import WorldKernel
+
+
+def index_key(kernel: "WorldKernel") -> Tuple[int, int]:
+    return (
+        int(getattr(kernel.agents, "version", 0)),
+        int(getattr(kernel.network.graph, "version", 0)),
+    )
+
+
+class RecipientIndex:
+    def __init__(self, kernel: "WorldKernel") -> None:
+        self.key = index_key(kernel)
+        self._kernel = kernel
+        self._population: List[str] = sorted(kernel.agents.keys())
+        self._by_author: Dict[str, List[str]] = {}
+
+    @property
+    def population(self) -> List[str]:
+        """All agent ids, sorted (broadcast recipients)."""
+        return self._population
+
+    def recipients(self, author_id: str) -> List[str]:
+        cached = self._by_author.get(author_id)
+        if cached is not None:
+            return cached
+        out = self._followers_of(author_id)
+        self._by_author[author_id] = out
+        return out
+
+    def _followers_of(self, author_id: str) -> List[str]:
+        kernel = self._kernel
+        graph = kernel.network.graph
+        try:
+            view = graph.followers_view(author_id)
+            node_ids = graph.node_ids
+            followers = {node_ids[j] for j in view.tolist()}
+        except Exception:
+            try:
+                followers = set(graph.get_followers(author_id))
+            except Exception:
+                followers = set()
+        if not followers:
+            return self._population
+        if author_id in kernel.agents:
+            followers.add(author_id)
+        return sorted(followers)
+
+
+def sample_recipients(recipients: Sequence[str], k: int, rng: random.Random) -> List[str]:
+    """rng.sample(recipients, k), drawn by index without copying recipients."""
+    return [recipients[i] for i in rng.sample(range(len(recipients)), k)]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+"""
+Fork-based sharded execution for WorldKernel phases.
+
+Each sharded phase forks one child process per shard. A child inherits a
+copy-on-write snapshot of the kernel as it was at the phase barrier, runs the
+shard function over its slice of agent ids and pipes the pickled result back.
+Children never write to the parent's state: the kernel merges shard results at
+the barrier in canonical agent order, which is what keeps a seeded run
+identical for any worker count.
+
+Forking per phase (instead of keeping a persistent pool) means workers never
+need to be re-synchronized with parent state between phases.
+
+run_forked() is also what WorldKernel.fork() uses to run scenario branches.
+"""
+
+import gc
+import os
+import pickle
+import sys
+import traceback
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def fork_available() -> bool:
+    return hasattr(os, "fork")
+
+
+def partition(items: Sequence[T], n_shards: int) -> List[List[T]]:
+    """Split items into at most n_shards contiguous, non-empty blocks."""
+    items = list(items)
+    n = max(1, min(int(n_shards), len(items)))
+    if not items:
+        return []
+    size, extra = divmod(len(items), n)
+    out: List[List[T]] = []
+    start = 0
+    for i in range(n):
+        end = start + size + (1 if i < extra else 0)
+        out.append(items[start:end])
+        start = end
+    return out
+
+
+def run_forked(
+    fn: Callable[[T], Any],
+    tasks: Sequence[T],
+    *,
+    on_child: Optional[Callable[[], None]] = None,
+    max_parallel: int = 0,
+) -> List[Any]:
+    """
+    Run fn(task) in one forked child per task and return results in task order.
+
+    on_child runs in each child before fn (e.g. to silence logging that the parent
+    will repeat when it merges). At most max_parallel children run at once
+    (0 = all). Raises RuntimeError if any child fails.
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return []
+    wave = len(tasks) if max_parallel <= 0 else int(max_parallel)
+    results: List[Any] = []
+    errors: List[str] = []
+    for start in range(0, len(tasks), wave):
+        _run_wave(fn, tasks[start : start + wave], on_child, results, errors)
+    if errors:
+        raise RuntimeError("forked worker failed:\n" + "\n".join(errors))
+    return results
+
+
+def _run_wave(
+    fn: Callable[[T], Any],
+    tasks: List[T],
+    on_child: Optional[Callable[[], None]],
+    results: List[Any],
+    errors: List[str],
+) -> None:
+    # Buffered output would otherwise be flushed once per child.
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+
+    # Move existing objects out of the collector's reach so a child's GC passes do
+    # not write to (and un-share) pages holding the parent's object graph.
+    gc.freeze()
+    children = []
+    try:
+        for task in tasks:
+            r, w = os.pipe()
+            pid = os.fork()
+            if pid == 0:  # child
+                status = 0
+                try:
+                    os.close(r)
+                    if on_child is not None:
+                        on_child()
+                    payload = pickle.dumps(("ok", fn(task)), protocol=pickle.HIGHEST_PROTOCOL)
+                except BaseException:
+                    status = 1
+                    payload = pickle.dumps(("error", traceback.format_exc()))
+                try:
+                    with os.fdopen(w, "wb") as f:
+                        f.write(payload)
+                finally:
+                    os._exit(status)
+            os.close(w)
+            children.append((pid, r))
+    finally:
+        gc.unfreeze()
+
+    for pid, r in children:
+        with os.fdopen(r, "rb") as f:
+            data = f.read()
+        os.waitpid(pid, 0)
+        try:
+            kind, value = pickle.loads(data)
+        except Exception:
+            kind, value = "error", f"worker {pid} exited without a result"
+        if kind == "ok":
+            results.append(value)
+        else:
+            errors.append(str(value))
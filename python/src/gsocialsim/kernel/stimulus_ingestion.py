@@ -1,11 +1,98 @@
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional
+import random
+
+from gsocialsim.stimuli.content_item import ContentItem
 from gsocialsim.stimuli.data_source import DataSource
 from gsocialsim.stimuli.stimulus import Stimulus
+from gsocialsim.types import TopicId
+
+
+def stimulus_topic_id(stimulus: Stimulus) -> TopicId:
+    raw = getattr(stimulus, "metadata", None) or {}
+    t = raw.get("topic")
+
+    if t is None:
+        return TopicId("T_Original")
+
+    if isinstance(t, str):
+        t = t.strip()
+        return TopicId(t if t else "T_Original")
+
+    return TopicId(str(t))
+
+
+def stimulus_stance(stimulus: Stimulus) -> float:
+    raw = getattr(stimulus, "stance_hint", None)
+    if raw is None:
+        raw = getattr(stimulus, "metadata", None) or {}
+        raw = raw.get("stance")
+    try:
+        v = float(raw) if raw is not None else 0.0
+    except Exception:
+        v = 0.0
+    if raw is None:
+        # Deterministic small bias per stimulus when stance is unspecified
+        topic = stimulus_topic_id(stimulus)
+        seed = hash(f"{stimulus.id}:{topic}") & 0xFFFFFFFF
+        rng = random.Random(seed)
+        v = rng.uniform(-0.35, 0.35)
+    return max(-1.0, min(1.0, v))
+
+
+def stimulus_identity_threat(stimulus: Stimulus) -> Optional[float]:
+    raw = getattr(stimulus, "metadata", None) or {}
+    for key in ("identity_threat", "threat"):
+        if key in raw:
+            try:
+                v = float(raw.get(key))
+                return max(0.0, min(1.0, v))
+            except Exception:
+                return None
+    return None
+
+
+def stimulus_political_salience(stimulus: Stimulus) -> Optional[float]:
+    raw_val = getattr(stimulus, "political_salience", None)
+    if raw_val is None:
+        raw = getattr(stimulus, "metadata", None) or {}
+        raw_val = raw.get("political_salience")
+    try:
+        v = float(raw_val) if raw_val is not None else None
+    except Exception:
+        v = None
+    if v is None:
+        return None
+    return max(0.0, min(1.0, v))
+
+
+def stimulus_to_content(stimulus: Stimulus) -> ContentItem:
+    """Parse a stimulus (fields + metadata fallbacks) into the ContentItem agents perceive."""
+    source = getattr(stimulus, "source", "unknown")
+    return ContentItem(
+        id=stimulus.id,
+        author_id=source,
+        topic=stimulus_topic_id(stimulus),
+        stance=stimulus_stance(stimulus),
+        content_text=getattr(stimulus, "content_text", None),
+        identity_threat=stimulus_identity_threat(stimulus),
+        primal_triggers=list(getattr(stimulus, "primal_triggers", []) or []),
+        primal_intensity=getattr(stimulus, "primal_intensity", None),
+        media_type=getattr(stimulus, "media_type", None),
+        outlet_id=getattr(stimulus, "outlet_id", None),
+        community_id=getattr(stimulus, "community_id", None),
+        provenance={"stimulus_id": stimulus.id, "source": source},
+    )
+
 
 class StimulusIngestionEngine:
     def __init__(self):
         self._data_sources: List[DataSource] = []
         self._stimuli_store: Dict[str, Stimulus] = {}
+        # Interned ContentItem per stimulus id: converted once, shared by every consumer
+        # of the stimulus's tick, evicted when that tick's buffers are cleared.
+        self._content_store: Dict[str, ContentItem] = {}
+        # Clamped political salience per stimulus id (only stimuli that carry one).
+        self._political_salience: Dict[str, float] = {}
 
     def register_data_source(self, source: DataSource):
         self._data_sources.append(source)
@@ -13,6 +100,33 @@ class StimulusIngestionEngine:
     def get_stimulus(self, stimulus_id: str) -> Stimulus | None:
         return self._stimuli_store.get(stimulus_id)
 
+    def content_for(self, stimulus: Stimulus) -> ContentItem:
+        """The shared ContentItem for a stimulus (converted on first request)."""
+        content = self._content_store.get(stimulus.id)
+        if content is None:
+            content = stimulus_to_content(stimulus)
+            self._content_store[stimulus.id] = content
+            pol = stimulus_political_salience(stimulus)
+            if pol is not None:
+                self._political_salience[stimulus.id] = pol
+        return content
+
+    def political_salience(self, stimulus_id: str) -> Optional[float]:
+        return self._political_salience.get(stimulus_id)
+
+    def clear_content_cache(self) -> None:
+        self._content_store.clear()
+        self._political_salience.clear()
+
+    def evict_content(self, stimulus_ids: Iterable[str]) -> None:
+        """
+        Drop the cached content for stimuli whose tick is done. A later
+        content_for() (e.g. a scheduled StimulusPerceptionEvent) re-derives it.
+        """
+        for stimulus_id in stimulus_ids:
+            self._content_store.pop(stimulus_id, None)
+            self._political_salience.pop(stimulus_id, None)
+
     def tick(self, current_tick: int) -> List[Stimulus]:
         """ Polls all data sources and adds new stimuli to the world. """
         newly_added = []
@@ -20,5 +134,9 @@ class StimulusIngestionEngine:
             new_stimuli = source.get_stimuli(current_tick)
             for stimulus in new_stimuli:
                 self._stimuli_store[stimulus.id] = stimulus
+                # A re-sent id replaces the stimulus, so its content is re-derived.
+                self._content_store.pop(stimulus.id, None)
+                self._political_salience.pop(stimulus.id, None)
+                self.content_for(stimulus)
                 newly_added.append(stimulus)
         return newly_added
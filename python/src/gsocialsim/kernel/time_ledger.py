@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+"""
+Array-backed per-tick time budgets.
+
+Each agent id is interned to a stable slot on first use; minutes remaining live
+in a float64 array indexed by slot, next to a mask of slots that currently have
+a budget. float64 keeps spends exact with respect to the old Dict[str, float]
+(a float32 slot rejects spending exactly the remaining budget, e.g. 0.7 of 0.7). Bulk operations (set_slots, set_many, spend_many, remaining_many) work
+on whole slot arrays; the MutableMapping interface keeps the old
+Dict[str, float] surface (`ledger[aid]`, `.get`, `in`, `.update`, `dict(ledger)`)
+working for existing callers.
+
+A slot without a budget behaves like a missing dict key: spending against it is
+allowed (same as WorldContext.spend_time did for direct unit tests).
+"""
+
+from collections.abc import MutableMapping
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+SlotsLike = Union[Sequence[str], np.ndarray]
+
+
+class TimeLedger(MutableMapping):
+    def __init__(self, initial: Optional[Dict[str, float]] = None, capacity: int = 64) -> None:
+        self._slots: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._minutes = np.zeros(max(1, int(capacity)), dtype=np.float64)
+        self._has_budget = np.zeros(max(1, int(capacity)), dtype=bool)
+        if initial:
+            self.update(initial)
+
+    # ----------------------------
+    # Slots
+    # ----------------------------
+    def _grow(self, needed: int) -> None:
+        size = len(self._minutes)
+        if needed <= size:
+            return
+        while size < needed:
+            size *= 2
+        minutes = np.zeros(size, dtype=np.float64)
+        minutes[: len(self._minutes)] = self._minutes
+        has_budget = np.zeros(size, dtype=bool)
+        has_budget[: len(self._has_budget)] = self._has_budget
+        self._minutes = minutes
+        self._has_budget = has_budget
+
+    def slot(self, agent_id: str) -> int:
+        """Stable slot for agent_id (interned on first use)."""
+        s = self._slots.get(agent_id)
+        if s is None:
+            s = len(self._ids)
+            self._grow(s + 1)
+            self._ids.append(agent_id)
+            self._slots[agent_id] = s
+        return s
+
+    def slots(self, agent_ids: Iterable[str]) -> np.ndarray:
+        """int64 slots for agent_ids (interning new ids). Cache the result for hot paths."""
+        slot = self.slot
+        return np.fromiter((slot(aid) for aid in agent_ids), dtype=np.int64)
+
+    def _as_slots(self, agents: SlotsLike) -> np.ndarray:
+        if isinstance(agents, np.ndarray) and agents.dtype.kind in "iu":
+            return agents
+        return self.slots(agents)
+
+    # ----------------------------
+    # Bulk API
+    # ----------------------------
+    def set_slots(self, slots: np.ndarray, minutes) -> None:
+        """Vectorized set: minutes may be a scalar or an array aligned with slots."""
+        self._minutes[slots] = np.maximum(minutes, 0.0)
+        self._has_budget[slots] = True
+
+    def set_many(self, agents: SlotsLike, minutes) -> None:
+        self.set_slots(self._as_slots(agents), minutes)
+
+    def remaining_many(self, agents: SlotsLike, default: float = np.inf) -> np.ndarray:
+        """float64 minutes remaining; `default` where no budget is set."""
+        slots = self._as_slots(agents)
+        return np.where(self._has_budget[slots], self._minutes[slots], default)
+
+    def spend_many(self, agents: SlotsLike, minutes) -> np.ndarray:
+        """
+        Try to spend minutes for each agent; returns a bool mask of successful spends.
+        Spends are applied in order, so repeated agents see earlier deductions.
+        """
+        slots = self._as_slots(agents)
+        amt = np.maximum(np.broadcast_to(np.asarray(minutes, dtype=np.float64), slots.shape), 0.0)
+        if len(np.unique(slots)) != len(slots):
+            return np.fromiter(
+                (self._spend_slot(int(s), float(a)) for s, a in zip(slots, amt)), dtype=bool, count=len(slots)
+            )
+        budgeted = self._has_budget[slots]
+        remaining = self._minutes[slots]
+        ok = ~budgeted | (remaining >= amt)
+        charged = ok & budgeted
+        self._minutes[slots[charged]] = remaining[charged] - amt[charged]
+        return ok
+
+    # ----------------------------
+    # Scalar API
+    # ----------------------------
+    def _spend_slot(self, s: int, amt: float) -> bool:
+        if not self._has_budget[s]:
+            return True
+        remaining = self._minutes.item(s)
+        if remaining < amt:
+            return False
+        self._minutes[s] = remaining - amt
+        return True
+
+    def spend(self, agent_id: str, minutes: float) -> bool:
+        amt = max(0.0, float(minutes))
+        s = self._slots.get(agent_id)
+        if s is None:
+            return True
+        return self._spend_slot(s, amt)
+
+    # ----------------------------
+    # Mapping compatibility shim
+    # ----------------------------
+    def get(self, agent_id: str, default=None):
+        s = self._slots.get(agent_id)
+        if s is None or not self._has_budget[s]:
+            return default
+        return self._minutes.item(s)
+
+    def __getitem__(self, agent_id: str) -> float:
+        s = self._slots.get(agent_id)
+        if s is None or not self._has_budget[s]:
+            raise KeyError(agent_id)
+        return self._minutes.item(s)
+
+    def __setitem__(self, agent_id: str, minutes: float) -> None:
+        s = self.slot(agent_id)
+        self._minutes[s] = max(0.0, float(minutes))
+        self._has_budget[s] = True
+
+    def __delitem__(self, agent_id: str) -> None:
+        s = self._slots.get(agent_id)
+        if s is None or not self._has_budget[s]:
+            raise KeyError(agent_id)
+        self._has_budget[s] = False
+        self._minutes[s] = 0.0
+
+    def __contains__(self, agent_id) -> bool:
+        s = self._slots.get(agent_id)
+        return s is not None and bool(self._has_budget[s])
+
+    def __iter__(self) -> Iterator[str]:
+        ids = self._ids
+        return iter([ids[s] for s in np.flatnonzero(self._has_budget[: len(ids)]).tolist()])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._has_budget[: len(self._ids)]))
+
+    def clear(self) -> None:
+        self._has_budget[:] = False
+        self._minutes[:] = 0.0
+
+    def __repr__(self) -> str:
+        return f"TimeLedger({dict(self)!r})"
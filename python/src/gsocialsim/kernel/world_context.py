@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
+from gsocialsim.kernel.time_ledger import TimeLedger
 from gsocialsim.social.global_social_reality import GlobalSocialReality
 
 
@@ -52,8 +53,12 @@ class WorldContext:
     # Belief deferral queue: list[(agent_id, belief_delta)]
     deferred_belief_deltas: List[Tuple[str, Any]] = field(default_factory=list)
 
-    # Per-tick time budgets (minutes remaining)
-    time_remaining_by_agent: Dict[str, float] = field(default_factory=dict)
+    # Per-tick time budgets (minutes remaining); float32 ledger with a dict-like API
+    time_remaining_by_agent: TimeLedger = field(default_factory=TimeLedger)
+
+    # Per-tick Impression templates shared by all viewers (AttentionSystem.template)
+    impression_templates: Dict[Any, Any] = field(default_factory=dict)
+    impression_templates_tick: Optional[int] = None
 
     def begin_phase(self, tick: int, phase: str) -> None:
         self.current_tick = tick
@@ -65,8 +70,28 @@ class WorldContext:
         Prevent unbounded growth for long runs.
         Keeps only current tick buffers if you call this each tick.
         """
-        self.stimuli_by_tick.pop(tick, None)
+        stimuli = self.stimuli_by_tick.pop(tick, None)
+        if stimuli and self.stimulus_engine is not None:
+            try:
+                self.stimulus_engine.evict_content(s.id for s in stimuli)
+            except Exception:
+                pass
         self.posted_by_tick.pop(tick, None)
+        self.impression_templates = {}
+        self.impression_templates_tick = None
+
+    def impression_template_cache(self) -> Dict[Any, Any]:
+        """
+        This tick's Impression template cache. Entries from an earlier tick are
+        dropped on first use in a new tick, so perception outside the kernel's
+        step loop (event handlers, direct Agent.perceive) stays bounded too.
+        """
+        clock = self.clock
+        tick = getattr(clock, "t", self.current_tick) if clock is not None else self.current_tick
+        if tick != self.impression_templates_tick:
+            self.impression_templates = {}
+            self.impression_templates_tick = tick
+        return self.impression_templates
 
     def queue_belief_delta(self, agent_id: str, delta: Any) -> None:
         self.deferred_belief_deltas.append((agent_id, delta))
@@ -80,15 +105,16 @@ class WorldContext:
     # Time budget helpers
     # ----------------------------
     def set_time_budget(self, agent_id: str, minutes: float) -> None:
-        self.time_remaining_by_agent[agent_id] = max(0.0, float(minutes))
+        self.time_remaining_by_agent[agent_id] = minutes
+
+    def set_time_budgets(self, agents, minutes) -> None:
+        """Vectorized set_time_budget; agents are ids or ledger slots, minutes a scalar or array."""
+        self.time_remaining_by_agent.set_many(agents, minutes)
 
     def spend_time(self, agent_id: str, minutes: float) -> bool:
-        amt = max(0.0, float(minutes))
-        if agent_id not in self.time_remaining_by_agent:
-            # If no budget was set (e.g., direct unit tests), allow spending.
-            return True
-        remaining = float(self.time_remaining_by_agent.get(agent_id, 0.0))
-        if remaining < amt:
-            return False
-        self.time_remaining_by_agent[agent_id] = remaining - amt
-        return True
+        # If no budget was set (e.g., direct unit tests), spending is allowed.
+        return self.time_remaining_by_agent.spend(agent_id, minutes)
+
+    def spend_many(self, agents, minutes):
+        """Batch spend_time; returns a bool array of successful spends."""
+        return self.time_remaining_by_agent.spend_many(agents, minutes)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+import os
 import random
+from itertools import islice
 from concurrent.futures import ThreadPoolExecutor
 
 from gsocialsim.agents.agent import Agent
@@ -11,12 +13,14 @@ from gsocialsim.evolution.evolutionary_system import EvolutionarySystem
 from gsocialsim.kernel.sim_clock import SimClock
 from gsocialsim.kernel.event_scheduler import EventScheduler
 from gsocialsim.kernel.world_context import WorldContext
+from gsocialsim.kernel.consolidation import apply_belief_deltas
+from gsocialsim.kernel.feed import FeedView, sample_feed
+from gsocialsim.kernel.recipients import RecipientIndex, index_key as recipient_index_key, sample_recipients
+from gsocialsim.kernel.sharding import fork_available, partition, run_forked
 from gsocialsim.kernel.stimulus_ingestion import StimulusIngestionEngine
 from gsocialsim.networks.network_layer import NetworkLayer
 from gsocialsim.physical.physical_world import PhysicalWorld
 from gsocialsim.social.global_social_reality import GlobalSocialReality
-from gsocialsim.agents.belief_update_engine import BeliefDelta
-from gsocialsim.fast import perception as fast
 from gsocialsim.util.perf import PerfTracker
 
 from gsocialsim.stimuli.content_item import ContentItem
@@ -26,13 +30,66 @@ from gsocialsim.stimuli.stimulus import Stimulus
 @dataclass
 class AgentPopulation:
     agents: Dict[str, Agent] = field(default_factory=dict)
+    # Optional population-level belief storage (see agents/belief_tensor.py)
+    belief_tensor: Optional[object] = None
+    # Bumped on every membership change so per-population indexes can be invalidated.
+    version: int = 0
+    # Clock that agent rng streams key their draws on (set by the kernel).
+    clock: Optional[object] = None
+
+    def bind_clock(self, clock) -> None:
+        """Key every current (and future) agent's rng stream on clock.t."""
+        self.clock = clock
+        for agent in self.agents.values():
+            self._bind_rng(agent)
+
+    def _bind_rng(self, agent: Agent) -> None:
+        for rng in (agent.rng, getattr(agent, "daily_rng", None)):
+            bind = getattr(rng, "bind_clock", None)
+            if callable(bind):
+                bind(self.clock)
+
+    def enable_belief_tensor(self, tensor=None) -> None:
+        """Bind every current (and future) agent's BeliefStore to one shared BeliefTensor."""
+        if self.belief_tensor is not None:
+            return
+        if tensor is None:
+            from gsocialsim.agents.belief_tensor import BeliefTensor
+
+            tensor = BeliefTensor(agent_capacity=max(1024, len(self.agents)))
+        self.belief_tensor = tensor
+        for agent in self.agents.values():
+            self._bind_beliefs(agent)
+
+    def _bind_beliefs(self, agent: Agent) -> None:
+        tensor = self.belief_tensor
+        if tensor is None or agent.beliefs.tensor is tensor:
+            return
+        agent.beliefs.unbind()
+        agent.beliefs.bind(tensor, tensor.allocate_row(agent.id))
+
+    def _release_beliefs(self, agent: Agent) -> None:
+        tensor = self.belief_tensor
+        if tensor is None or agent.beliefs.tensor is not tensor:
+            return
+        row = agent.beliefs.row
+        agent.beliefs.unbind()
+        tensor.release_row(row)
 
     def add_agent(self, agent: Agent) -> None:
+        previous = self.agents.get(agent.id)
+        if previous is not None and previous is not agent:
+            self._release_beliefs(previous)
         self.agents[agent.id] = agent
+        self._bind_beliefs(agent)
+        self._bind_rng(agent)
+        self.version += 1
 
     def replace(self, exited_agent_id: str, newborn_agent: Agent) -> None:
         if exited_agent_id in self.agents:
+            self._release_beliefs(self.agents[exited_agent_id])
             del self.agents[exited_agent_id]
+            self.version += 1
         self.add_agent(newborn_agent)
 
     def get(self, agent_id: str, default=None):
@@ -76,6 +133,14 @@ class WorldKernel:
     rng: random.Random = field(init=False)
     enable_timing: bool = False
     timing_level: str = "basic"
+    # Profiler modes (see util/perf.py): nested span tree, time every Nth call, span trace
+    timing_hierarchical: bool = False
+    timing_sample_every: int = 1
+    timing_trace: bool = False
+    # Per-phase memory deltas in perf.report(): "" (off), "rss" or "tracemalloc";
+    # timing_memory_top > 0 also lists top allocation sites (tracemalloc only)
+    timing_memory: str = ""
+    timing_memory_top: int = 0
     enable_debug_logging: bool = True
     enable_parallel: bool = False
     parallel_workers: int = 0
@@ -83,6 +148,15 @@ class WorldKernel:
     max_perceptions_per_tick: int = 0
     enable_batch_perception: bool = False
     enable_batch_all: bool = True
+    enable_vectorized_perception: bool = False
+    enable_belief_tensor: bool = False
+    # Sharded mode: ACT/PERCEIVE run in forked worker processes (0 workers = cpu count)
+    enable_sharding: bool = False
+    shard_workers: int = 0
+    # Only visit agents whose schedule gives them time this tick-of-day (kernel/active_set.py)
+    enable_active_set: bool = True
+    # Jump over runs of ticks with an empty active set (e.g. night) in one step
+    enable_fast_forward: bool = True
     perf: PerfTracker = field(default_factory=PerfTracker)
 
     agents: AgentPopulation = field(default_factory=AgentPopulation)
@@ -101,6 +175,10 @@ class WorldKernel:
     world_context: WorldContext = field(init=False)
 
     _started: bool = field(default=False, init=False, repr=False)
+    _perception_engine: Optional[object] = field(default=None, init=False, repr=False)
+    _active_index: Optional[object] = field(default=None, init=False, repr=False)
+    _recipient_index: Optional[object] = field(default=None, init=False, repr=False)
+    _tick_active_ids: Optional[Tuple[int, List[str]]] = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.rng = random.Random(self.seed)
@@ -109,6 +187,16 @@ class WorldKernel:
         except Exception:
             pass
         self.perf.set_enabled(self.enable_timing, level=self.timing_level)
+        self.perf.configure(
+            hierarchical=self.timing_hierarchical,
+            sample_every=self.timing_sample_every,
+            trace=self.timing_trace,
+            memory=self.timing_memory,
+            memory_top=self.timing_memory_top,
+        )
+        if self.enable_belief_tensor:
+            self.agents.enable_belief_tensor()
+        self.agents.bind_clock(self.clock)
         self.world_context = WorldContext(
             kernel=self,
             analytics=self.analytics,
@@ -181,6 +269,9 @@ class WorldKernel:
 
         Strict contract loop:
           INGEST(t) -> ACT_BATCH(t) -> PERCEIVE_BATCH(t) -> CONSOLIDATE(t)
+
+        Runs of ticks in which no agent is active are fast-forwarded as a block
+        (see _idle_span / _fast_forward).
         """
         if num_ticks <= 0:
             return
@@ -188,10 +279,18 @@ class WorldKernel:
             self.start()
 
         executor = None
-        if self.enable_parallel and (self.parallel_workers or 0) > 1:
+        if self.enable_parallel and (self.parallel_workers or 0) > 1 and not self._sharding_active():
             executor = ThreadPoolExecutor(max_workers=self.parallel_workers)
         try:
-            for _ in range(num_ticks):
+            remaining = int(num_ticks)
+            while remaining > 0:
+                idle = self._idle_span(remaining)
+                if idle > 0:
+                    with self.perf.time("tick/fast_forward", count=idle):
+                        self._fast_forward(idle)
+                    remaining -= idle
+                    continue
+                remaining -= 1
                 with self.perf.time("tick"):
                     t = self.clock.t
 
@@ -229,6 +328,136 @@ class WorldKernel:
             if executor is not None:
                 executor.shutdown(wait=True)
 
+    def step_async(self, num_ticks: int = 1, *, yield_every: int = 1, cancel: Optional[Any] = None):
+        """
+        Async iterator over TickSnapshots while num_ticks run in a worker thread
+        (see kernel/async_step.py):
+
+            async for snap in kernel.step_async(96, yield_every=4):
+                ...
+
+        Each snapshot is taken after `yield_every` ticks; stopping (via `cancel`,
+        breaking out, or task cancellation) always happens between ticks.
+        """
+        from gsocialsim.kernel.async_step import step_async
+
+        return step_async(self, num_ticks, yield_every=yield_every, cancel=cancel)
+
+    # -------------------------
+    # Idle fast-forward
+    # -------------------------
+
+    def _idle_span(self, max_ticks: int) -> int:
+        """
+        Number of upcoming ticks (<= max_ticks) in which the active set is empty,
+        ending at the first day boundary. 0 when fast-forward does not apply: it
+        needs the active-agent index, and a perception path that only visits
+        active agents (the per-content delivery path reaches inactive followers).
+        """
+        if not self.enable_fast_forward:
+            return 0
+        if not (
+            self.enable_vectorized_perception
+            or self._sharding_active()
+            or self.enable_batch_all
+            or self.enable_batch_perception
+            or (self.max_perceptions_per_tick and self.max_perceptions_per_tick > 0)
+        ):
+            return 0
+        index = self._active_agent_index()
+        if index is None:
+            return 0
+        clock = self.clock
+        ticks_per_day = int(getattr(clock, "ticks_per_day", 0) or 0)
+        n = 0
+        while n < max_ticks:
+            if index.active_at(clock.tick_of_day + n):
+                break
+            n += 1
+            if ticks_per_day > 0 and (clock.t + n) % ticks_per_day == 0:
+                break
+        return n
+
+    def _fast_forward(self, n: int) -> None:
+        """
+        Advance n idle ticks at once. Equivalent to running them one by one:
+        budgets of agents that just left the active set are zeroed, each tick's
+        stimuli are ingested and converted (political salience and, in sharded
+        mode, topic creation happen as they would in PERCEIVE), nobody acts or
+        perceives, and CONSOLIDATE runs once for the last tick, which is the only
+        one that can end a day.
+        """
+        t0 = self.clock.t
+        self._reset_tick_budgets(t0)
+        ensure_topics = not self.enable_vectorized_perception and self._sharding_active()
+        for t in range(t0, t0 + n):
+            self.world_context.begin_phase(t, "INGEST")
+            for stimulus in self.stimulus_engine.tick(t) or []:
+                content = self._stimulus_to_content(stimulus)
+                if ensure_topics:
+                    try:
+                        self.gsr.ensure_topic(content.topic)
+                    except Exception:
+                        pass
+        last = t0 + n - 1
+        self.clock.advance(n - 1)
+        self.world_context.begin_phase(last, "CONSOLIDATE")
+        self._consolidate(last)
+        self.world_context.clear_tick_buffers(last)
+        self.clock.advance(1)
+
+    # -------------------------
+    # Checkpointing
+    # -------------------------
+
+    def save_checkpoint(self, path: str) -> None:
+        """
+        Write a binary snapshot of the kernel (see kernel/checkpoint.py).
+        Call between ticks; the next step() of a restored kernel continues at clock.t.
+        """
+        from gsocialsim.kernel.checkpoint import save_checkpoint
+
+        save_checkpoint(self, path)
+
+    @classmethod
+    def load_checkpoint(cls, path: str, **overrides) -> "WorldKernel":
+        """
+        Restore a kernel written by save_checkpoint(). Keyword overrides replace saved
+        constructor settings (e.g. enable_timing=True).
+        """
+        from gsocialsim.kernel.checkpoint import load_checkpoint
+
+        return load_checkpoint(path, **overrides)
+
+    # -------------------------
+    # Scenario branching
+    # -------------------------
+
+    def fork(
+        self,
+        scenarios: Sequence[Any],
+        run: Callable[["WorldKernel", Any], Any],
+        *,
+        max_parallel: int = 0,
+    ) -> List[Any]:
+        """
+        Branch the current state once per scenario and return run(branch, scenario)
+        for each, in scenario order.
+
+        Each branch is a forked child process holding a copy-on-write view of this
+        kernel: agent, graph and GSR pages are shared until the branch mutates them.
+        `run` typically injects an intervention and calls branch.step(...); its return
+        value must be picklable. This kernel is left untouched. At most max_parallel
+        branches run at once (0 = all). Without os.fork, branches are deep copies run
+        one after another.
+        """
+        scenarios = list(scenarios)
+        if not fork_available():
+            import copy
+
+            return [run(copy.deepcopy(self), scenario) for scenario in scenarios]
+        return run_forked(lambda scenario: run(self, scenario), scenarios, max_parallel=max_parallel)
+
     # -------------------------
     # Phase implementations
     # -------------------------
@@ -247,10 +476,12 @@ class WorldKernel:
         Reaction lag is enforced because this runs before PERCEIVE_BATCH(t).
         Agents act based on prior tick perceptions and internal state.
         """
-        posted: List[ContentItem] = []
+        if self._sharding_active():
+            self._act_sharded(t)
+            return
 
         detailed = self.perf.enabled and self.perf.level == "detailed"
-        agents = list(self.agents.values())
+        agents = [self.agents[agent_id] for agent_id in self.active_agent_ids()]
         plans: list = []
         if executor is not None:
             if detailed:
@@ -266,6 +497,13 @@ class WorldKernel:
                 else:
                     plans.append(agent.plan_action(t, self.world_context))
 
+        self._apply_action_plans(t, agents, plans)
+
+    def _apply_action_plans(self, t: int, agents: List[Agent], plans: list) -> None:
+        """
+        Apply planned actions in population order and publish created content for tick t.
+        """
+        posted: List[ContentItem] = []
         for agent, plan in zip(agents, plans):
             interaction = agent.apply_planned_action(plan, self.world_context)
 
@@ -290,6 +528,12 @@ class WorldKernel:
           - exogenous stimuli ingested in INGEST(t)
           - posts published in ACT_BATCH(t)
         """
+        if self.enable_vectorized_perception:
+            self._perceive_batch_vectorized(t)
+            return
+        if self._sharding_active():
+            self._perceive_sharded(t)
+            return
         if self.enable_batch_all or self.enable_batch_perception or (self.max_perceptions_per_tick and self.max_perceptions_per_tick > 0):
             self._perceive_batch_agentcentric(t)
             return
@@ -313,60 +557,12 @@ class WorldKernel:
         Apply queued belief deltas (the ONLY place canonical belief vectors may change).
 
         Also performs belief crossing detection here, since stance transitions only exist here
-        under the contract.
+        under the contract. Deltas are applied in one batch per tick (see kernel/consolidation.py):
+        net change per (agent, topic), clamped once, crossings judged on the net change.
         """
         queued = self.world_context.pop_all_belief_deltas()
-        for agent_id, delta in queued:
-            agent = self.agents.get(agent_id)
-            if not agent:
-                continue
-
-            # Capture pre-stance for crossing detection
-            topic = getattr(delta, "topic_id", getattr(delta, "topic", None))
-            old_stance = None
-            if topic is not None:
-                b0 = agent.beliefs.get(topic)
-                old_stance = b0.stance if b0 else 0.0
-
-            try:
-                agent.beliefs.apply_delta(delta)
-            except Exception:
-                continue
-
-            # Applied delta log (canonical)
-            try:
-                self.analytics.log_belief_update(timestamp=t, agent_id=agent_id, delta=delta)
-            except Exception:
-                pass
-
-            # Crossing detection (now legal because belief actually changed)
-            try:
-                if topic is not None:
-                    b1 = agent.beliefs.get(topic)
-                    new_stance = b1.stance if b1 else (old_stance if old_stance is not None else 0.0)
-
-                    if old_stance is None:
-                        old_stance = 0.0
-
-                    if self.analytics.crossing_detector.check(old_stance, new_stance):
-                        attribution = self.analytics.attribution_engine.assign_credit(
-                            agent_id=agent_id,
-                            topic=topic,
-                            history=self.analytics.exposure_history,
-                        )
-                        from gsocialsim.analytics.attribution import BeliefCrossingEvent
-
-                        crossing_event = BeliefCrossingEvent(
-                            timestamp=t,
-                            agent_id=agent_id,
-                            topic=topic,
-                            old_stance=old_stance,
-                            new_stance=new_stance,
-                            attribution=attribution,
-                        )
-                        self.analytics.log_belief_crossing(crossing_event)
-            except Exception:
-                pass
+        with self.perf.time("consolidate/apply_deltas"):
+            apply_belief_deltas(self, t, queued)
 
         # End-of-day boundary (96 ticks/day with contract clock)
         if getattr(self.clock, "ticks_per_day", 0) > 0 and (t + 1) % self.clock.ticks_per_day == 0:
@@ -377,53 +573,35 @@ class WorldKernel:
                     pass
 
     def _stimulus_to_content(self, stimulus: Stimulus) -> ContentItem:
-        meta = getattr(stimulus, "metadata", None) or {}
-        raw_topic = meta.get("topic")
-        if isinstance(raw_topic, str) and raw_topic.strip():
-            topic = raw_topic.strip()
-        else:
-            topic = "T_Original"
-
-        stance = 0.0
-        raw_stance = getattr(stimulus, "stance_hint", None)
-        if raw_stance is None:
-            raw_stance = meta.get("stance")
-        try:
-            stance = float(raw_stance) if raw_stance is not None else 0.0
-        except Exception:
-            stance = 0.0
-        if raw_stance is None:
-            seed = hash(f"{stimulus.id}:{topic}") & 0xFFFFFFFF
-            rng = random.Random(seed)
-            stance = rng.uniform(-0.35, 0.35)
-        stance = max(-1.0, min(1.0, stance))
+        """
+        Interned ContentItem for a stimulus (see StimulusIngestionEngine.content_for),
+        raising the topic's political salience if the stimulus carries one.
+        """
+        engine = self.stimulus_engine
+        content = engine.content_for(stimulus)
+        pol = engine.political_salience(stimulus.id)
+        if pol is not None:
+            try:
+                current = float(getattr(self.gsr.ensure_topic(content.topic), "political_salience", 0.0))
+                if pol > current:
+                    self.gsr.set_political_salience(content.topic, pol)
+            except Exception:
+                pass
+        return content
 
-        # Update per-topic political salience if provided
-        try:
-            pol = getattr(stimulus, "political_salience", None)
-            if pol is None:
-                pol = meta.get("political_salience")
-            if pol is not None:
-                pol_val = max(0.0, min(1.0, float(pol)))
-                current = float(getattr(self.gsr.ensure_topic(topic), "political_salience", 0.0))
-                self.gsr.set_political_salience(topic, max(current, pol_val))
-        except Exception:
-            pass
+    def _perceive_batch_vectorized(self, t: int) -> None:
+        """
+        Population-wide batch perception (see kernel/perception_engine.py).
+        """
+        if self._perception_engine is None:
+            from gsocialsim.kernel.perception_engine import VectorizedPerceptionEngine
 
-        return ContentItem(
-            id=stimulus.id,
-            author_id=getattr(stimulus, "source", "unknown"),
-            topic=topic,
-            stance=stance,
-            content_text=getattr(stimulus, "content_text", None),
-            identity_threat=getattr(stimulus, "identity_threat", None),
-            primal_triggers=list(getattr(stimulus, "primal_triggers", []) or []),
-            primal_intensity=getattr(stimulus, "primal_intensity", None),
-            media_type=getattr(stimulus, "media_type", None),
-            outlet_id=getattr(stimulus, "outlet_id", None),
-            community_id=getattr(stimulus, "community_id", None),
-            provenance={"stimulus_id": stimulus.id, "source": getattr(stimulus, "source", "unknown")},
-        )
+            self._perception_engine = VectorizedPerceptionEngine(self)
+        content_items: List[ContentItem] = []
+        for stimulus in self.world_context.stimuli_by_tick.get(t, []):
+            content_items.append(self._stimulus_to_content(stimulus))
+        content_items.extend(self.world_context.posted_by_tick.get(t, []))
+        self._perception_engine.run(t, content_items)
 
     def _perceive_batch_agentcentric(self, t: int) -> None:
         """
@@ -448,189 +626,256 @@ class WorldKernel:
         if not content_items:
             return
 
-        # Precompute author followers and content by author
-        author_contents: Dict[str, List[ContentItem]] = {}
-        broadcast_contents: List[ContentItem] = []
+        # Precompute content by author and, from the cached follower index,
+        # the followed-author content each agent sees this tick.
         if detailed:
             with self.perf.time("batch/index_authors"):
-                for content in content_items:
-                    author = str(getattr(content, "author_id", ""))
-                    author_contents.setdefault(author, []).append(content)
-
-                for author, items in author_contents.items():
-                    try:
-                        followers = set(self.network.graph.get_followers(author))
-                    except Exception:
-                        followers = set()
-                    if not followers:
-                        broadcast_contents.extend(items)
+                author_contents, broadcast_contents = self._index_authors(content_items)
+            with self.perf.time("batch/followed_content"):
+                followed_contents = self._followed_contents(author_contents)
         else:
-            for content in content_items:
-                author = str(getattr(content, "author_id", ""))
-                author_contents.setdefault(author, []).append(content)
-
-            for author, items in author_contents.items():
-                try:
-                    followers = set(self.network.graph.get_followers(author))
-                except Exception:
-                    followers = set()
-                if not followers:
-                    broadcast_contents.extend(items)
-
-        # Precompute following sets per agent
-        following_map: Dict[str, List[str]] = {}
-        if detailed:
-            with self.perf.time("batch/following_map"):
-                try:
-                    for agent_id in self.agents.keys():
-                        following_map[agent_id] = list(self.network.graph.get_following(agent_id))
-                except Exception:
-                    for agent_id in self.agents.keys():
-                        following_map[agent_id] = []
-        else:
-            try:
-                for agent_id in self.agents.keys():
-                    following_map[agent_id] = list(self.network.graph.get_following(agent_id))
-            except Exception:
-                for agent_id in self.agents.keys():
-                    following_map[agent_id] = []
+            author_contents, broadcast_contents = self._index_authors(content_items)
+            followed_contents = self._followed_contents(author_contents)
 
         max_items = int(self.max_perceptions_per_tick) if self.max_perceptions_per_tick else 0
 
         if detailed:
             with self.perf.time("batch/agent_loop"):
-                for agent_id, agent in self.agents.items():
+                for agent_id in self.active_agent_ids():
+                    agent = self.agents[agent_id]
                     remaining = self.world_context.time_remaining_by_agent.get(agent_id)
                     if remaining is not None and remaining <= 0.0:
                         continue
 
                     with self.perf.time("batch/agent_feed"):
-                        feed: List[ContentItem] = []
-                        feed.extend(broadcast_contents)
-
-                        for author in following_map.get(agent_id, []):
-                            items = author_contents.get(author)
-                            if items:
-                                feed.extend(items)
-
-                        # Ensure self-authored posts are visible to the author.
-                        own_items = author_contents.get(agent_id)
-                        if own_items:
-                            feed.extend(own_items)
-
+                        feed = self._agent_feed(
+                            agent_id, agent, author_contents, broadcast_contents, followed_contents, max_items
+                        )
                         if not feed:
                             continue
 
-                        if max_items > 0 and len(feed) > max_items:
-                            feed = agent.rng.sample(feed, max_items)
-
+                    # Same per-item plan/apply as the untimed loop, so profiling
+                    # never changes results.
                     with self.perf.time("batch/agent_perceive"):
-                        plans = []
-                        idx_map = []
-                        stance_signal = []
-                        current_stance = []
-                        has_belief = []
-                        trust = []
-                        credibility = []
-                        primal_activation = []
-                        identity_threat = []
-                        is_self_source = []
-                        identity_rigidity = []
-                        is_physical = []
-
-                        use_fast = fast.HAS_FAST
-                        remaining_local = self.world_context.time_remaining_by_agent.get(agent_id)
-                        if remaining_local is None:
-                            remaining_local = 0.0
-                        for content in feed:
-                            if remaining_local <= 0.0:
-                                break
-                            plan = agent.plan_perception(content, self.world_context, compute_delta=not use_fast)
-                            plans.append(plan)
-                            if not plan.exposed:
-                                continue
-                            # Exposure cost always consumes time
-                            if plan.exposure_cost > remaining_local:
-                                break
-                            remaining_local -= plan.exposure_cost
-
-                            # If there's no time for consumption, downgrade to exposure-only
-                            if plan.consumed_roll and plan.consumption_extra_cost > remaining_local:
-                                plan.consumed_roll = False
-                                plan.belief_delta = None
-                                continue
-                            if plan.consumed_roll:
-                                remaining_local -= plan.consumption_extra_cost
-
-                            if use_fast and plan.consumed_roll:
-                                idx_map.append(len(plans) - 1)
-                                stance_signal.append(float(plan.impression.stance_signal))
-                                current_stance.append(float(plan.old_stance))
-                                has_belief.append(bool(plan.has_belief))
-                                rel = self.gsr.get_relationship(agent.id, content.author_id)
-                                trust.append(float(getattr(rel, "trust", 0.0)))
-                                credibility.append(float(getattr(plan.impression, "credibility_signal", 0.5)))
-                                primal_activation.append(float(getattr(plan.impression, "primal_activation", 0.0)))
-                                identity_threat.append(float(getattr(plan.impression, "identity_threat", 0.0)))
-                                is_self_source.append(bool(getattr(plan.impression, "is_self_source", False)))
-                                identity_rigidity.append(float(getattr(agent.identity, "identity_rigidity", 0.5)))
-                                is_physical.append(bool(plan.is_physical))
-
-                        if use_fast and idx_map:
-                            import numpy as np
-
-                            sd, cd = fast.compute_belief_deltas(
-                                np.asarray(stance_signal, dtype=np.float32),
-                                np.asarray(current_stance, dtype=np.float32),
-                                np.asarray(has_belief, dtype=np.bool_),
-                                np.asarray(trust, dtype=np.float32),
-                                np.asarray(credibility, dtype=np.float32),
-                                np.asarray(primal_activation, dtype=np.float32),
-                                np.asarray(identity_threat, dtype=np.float32),
-                                np.asarray(is_self_source, dtype=np.bool_),
-                                np.asarray(identity_rigidity, dtype=np.float32),
-                                np.asarray(is_physical, dtype=np.bool_),
-                            )
-                            for j, idx in enumerate(idx_map):
-                                plan = plans[idx]
-                                plan.belief_delta = BeliefDelta(
-                                    topic_id=plan.content.topic,
-                                    stance_delta=float(sd[j]),
-                                    confidence_delta=float(cd[j]),
-                                )
-
-                        for plan in plans:
-                            agent.apply_perception_plan(plan, self.world_context)
+                        self._perceive_agent_feed(agent_id, agent, feed)
         else:
-            for agent_id, agent in self.agents.items():
+            for agent_id in self.active_agent_ids():
+                agent = self.agents[agent_id]
                 remaining = self.world_context.time_remaining_by_agent.get(agent_id)
                 if remaining is not None and remaining <= 0.0:
                     continue
+                feed = self._agent_feed(agent_id, agent, author_contents, broadcast_contents, followed_contents, max_items)
+                if feed:
+                    self._perceive_agent_feed(agent_id, agent, feed)
 
-                feed: List[ContentItem] = []
-                feed.extend(broadcast_contents)
+    def _index_authors(self, content_items: List[ContentItem]) -> Tuple[Dict[str, List[ContentItem]], List[ContentItem]]:
+        """
+        Group tick content by author; content from authors without followers is broadcast.
+        """
+        author_contents: Dict[str, List[ContentItem]] = {}
+        broadcast_contents: List[ContentItem] = []
+        for content in content_items:
+            author = str(getattr(content, "author_id", ""))
+            author_contents.setdefault(author, []).append(content)
 
-                for author in following_map.get(agent_id, []):
-                    items = author_contents.get(author)
-                    if items:
-                        feed.extend(items)
+        graph = self.network.graph
+        for author, items in author_contents.items():
+            try:
+                has_followers = graph.follower_count(author) > 0
+            except Exception:
+                has_followers = False
+            if not has_followers:
+                broadcast_contents.extend(items)
+        return author_contents, broadcast_contents
 
-                # Ensure self-authored posts are visible to the author.
-                own_items = author_contents.get(agent_id)
-                if own_items:
-                    feed.extend(own_items)
+    def _followed_contents(self, author_contents: Dict[str, List[ContentItem]]) -> Dict[str, List[List[ContentItem]]]:
+        """
+        Followed-author content segments per agent for this tick.
 
-                if not feed:
-                    continue
+        Walks the cached follower (CSC) views of the authors that actually posted,
+        instead of every agent's following set. Each viewer gets references to the
+        authors' shared content lists (in tick author order), not copies.
+        """
+        graph = self.network.graph
+        try:
+            node_ids = graph.node_ids
+        except Exception:
+            return {}
+        out: Dict[str, List[List[ContentItem]]] = {}
+        for author, items in author_contents.items():
+            followers = graph.followers_view(author)
+            if followers.size == 0:
+                continue
+            for j in followers.tolist():
+                viewer = node_ids[j]
+                segments = out.get(viewer)
+                if segments is None:
+                    out[viewer] = [items]
+                else:
+                    segments.append(items)
+        return out
+
+    def _agent_feed(
+        self,
+        agent_id: str,
+        agent: Agent,
+        author_contents: Dict[str, List[ContentItem]],
+        broadcast_contents: List[ContentItem],
+        followed_contents: Dict[str, List[List[ContentItem]]],
+        max_items: int,
+    ) -> Sequence[ContentItem]:
+        """
+        One agent's feed for the tick (broadcast + followed authors + own posts) as a
+        FeedView over the shared segments, sampled down to max_items with the
+        agent's rng (see feed.sample_feed).
+        """
+        segments: List[List[ContentItem]] = [broadcast_contents]
+        followed = followed_contents.get(agent_id)
+        if followed:
+            segments.extend(followed)
+        # Ensure self-authored posts are visible to the author.
+        own_items = author_contents.get(agent_id)
+        if own_items:
+            segments.append(own_items)
+        feed = FeedView(segments)
+
+        if max_items > 0 and len(feed) > max_items:
+            return sample_feed(feed, max_items, agent.rng)
+        return feed
+
+    def _perceive_agent_feed(self, agent_id: str, agent: Agent, feed: List[ContentItem]) -> list:
+        """
+        Plan and apply perceptions over a feed until the agent runs out of time.
+        Returns the applied plans (in order) so shard workers can hand them back.
+        """
+        applied = []
+        for content in feed:
+            remaining = self.world_context.time_remaining_by_agent.get(agent_id)
+            if remaining is not None and remaining <= 0.0:
+                break
+            plan = agent.plan_perception(content, self.world_context)
+            agent.apply_perception_plan(plan, self.world_context)
+            applied.append(plan)
+        return applied
 
-                if max_items > 0 and len(feed) > max_items:
-                    feed = agent.rng.sample(feed, max_items)
+    # -------------------------
+    # Sharded execution
+    # -------------------------
 
-                for content in feed:
-                    remaining = self.world_context.time_remaining_by_agent.get(agent_id)
-                    if remaining is not None and remaining <= 0.0:
-                        break
-                    plan = agent.plan_perception(content, self.world_context)
+    def _sharding_active(self) -> bool:
+        return bool(self.enable_sharding) and fork_available()
+
+    def _shard_count(self) -> int:
+        n = int(self.shard_workers or 0)
+        if n <= 0:
+            n = os.cpu_count() or 1
+        return max(1, n)
+
+    def _silence_shard_worker(self) -> None:
+        # The parent repeats every analytics call when it merges shard results.
+        try:
+            setattr(self.analytics, "enable_debug_logging", False)
+        except Exception:
+            pass
+
+    def _act_sharded(self, t: int) -> None:
+        """
+        ACT_BATCH(t) with plan_action run in forked shard workers.
+
+        Workers return (agent_id, PlannedAction, rng state); plans are applied here in
+        population order, exactly as the in-process batch would apply them.
+        """
+        agents = [self.agents[agent_id] for agent_id in self.active_agent_ids()]
+        ctx = self.world_context
+
+        def work(shard: List[str]) -> list:
+            out = []
+            for agent_id in shard:
+                agent = self.agents[agent_id]
+                out.append((agent_id, agent.plan_action(t, ctx), agent.rng.getstate()))
+            return out
+
+        with self.perf.time("shard/act_workers"):
+            results = run_forked(work, partition([a.id for a in agents], self._shard_count()), on_child=self._silence_shard_worker)
+
+        planned = {agent_id: (plan, state) for shard in results for agent_id, plan, state in shard}
+        plans = []
+        for agent in agents:
+            plan, state = planned[agent.id]
+            agent.rng.setstate(state)
+            plans.append(plan)
+        self._apply_action_plans(t, agents, plans)
+
+    def _perceive_sharded(self, t: int) -> None:
+        """
+        PERCEIVE_BATCH(t) with feeds planned in forked shard workers.
+
+        Perception only reads per-agent state (beliefs, rng, viewer->author trust) plus
+        tick-level shared state, so each worker runs the agent-centric feed loop on its
+        own copy and returns the applied PerceptionPlans, plus the default relationships
+        it created while reading trust. The parent creates the same relationships and
+        replays the plans in population order, which reproduces the in-process result
+        for any worker count.
+        """
+        content_items: List[ContentItem] = []
+        for stimulus in self.world_context.stimuli_by_tick.get(t, []):
+            content_items.append(self._stimulus_to_content(stimulus))
+        content_items.extend(self.world_context.posted_by_tick.get(t, []))
+        if not content_items:
+            return
+
+        # Topics are created lazily during planning; create them here so the parent
+        # GSR ends up the same as with in-process perception.
+        for content in content_items:
+            try:
+                self.gsr.ensure_topic(content.topic)
+            except Exception:
+                pass
+
+        author_contents, broadcast_contents = self._index_authors(content_items)
+        followed_contents = self._followed_contents(author_contents)
+        max_items = int(self.max_perceptions_per_tick) if self.max_perceptions_per_tick else 0
+        remaining_by_agent = self.world_context.time_remaining_by_agent
+
+        active: List[str] = []
+        for agent_id in self.active_agent_ids():
+            remaining = remaining_by_agent.get(agent_id)
+            if remaining is None or remaining > 0.0:
+                active.append(agent_id)
+        if not active:
+            return
+
+        def work(shard: List[str]) -> tuple:
+            relations = getattr(self.gsr, "_relations", {})
+            known = len(relations)
+            out = []
+            for agent_id in shard:
+                agent = self.agents[agent_id]
+                feed = self._agent_feed(agent_id, agent, author_contents, broadcast_contents, followed_contents, max_items)
+                if not feed:
+                    continue
+                plans = self._perceive_agent_feed(agent_id, agent, feed)
+                out.append((agent_id, plans, agent.rng.getstate()))
+            # Relationships read while planning are created lazily (dicts keep insertion order).
+            created = list(islice(relations, known, None))
+            return out, created
+
+        with self.perf.time("shard/perceive_workers"):
+            results = run_forked(work, partition(active, self._shard_count()), on_child=self._silence_shard_worker)
+
+        with self.perf.time("shard/perceive_merge"):
+            for _, created in results:
+                for u, v in created:
+                    self.gsr.get_relationship(u, v)
+            perceived = {agent_id: (plans, state) for shard, _ in results for agent_id, plans, state in shard}
+            for agent_id in active:
+                entry = perceived.get(agent_id)
+                if entry is None:
+                    continue
+                agent = self.agents[agent_id]
+                plans, state = entry
+                agent.rng.setstate(state)
+                for plan in plans:
                     agent.apply_perception_plan(plan, self.world_context)
 
     # -------------------------
@@ -644,7 +889,7 @@ class WorldKernel:
         if self.max_recipients_per_content and len(recipients) > self.max_recipients_per_content:
             seed = hash(f"{stimulus.id}:{t}") & 0xFFFFFFFF
             rng = random.Random(seed)
-            recipients = rng.sample(recipients, self.max_recipients_per_content)
+            recipients = sample_recipients(recipients, self.max_recipients_per_content, rng)
         detailed = self.perf.enabled and self.perf.level == "detailed"
         agents = [self.agents.get(agent_id) for agent_id in recipients]
         agents = [a for a in agents if a is not None]
@@ -695,7 +940,7 @@ class WorldKernel:
         if self.max_recipients_per_content and len(recipients) > self.max_recipients_per_content:
             seed = hash(f"{content.id}:{t}") & 0xFFFFFFFF
             rng = random.Random(seed)
-            recipients = rng.sample(recipients, self.max_recipients_per_content)
+            recipients = sample_recipients(recipients, self.max_recipients_per_content, rng)
         detailed = self.perf.enabled and self.perf.level == "detailed"
         agents = [self.agents.get(agent_id) for agent_id in recipients]
         agents = [a for a in agents if a is not None]
@@ -723,22 +968,20 @@ class WorldKernel:
                 else:
                     agent.perceive(content, self.world_context)
 
-    def _eligible_recipients_for_author(self, author_id: str) -> List[str]:
+    def _eligible_recipients_for_author(self, author_id: str) -> Sequence[str]:
         """
         Minimal realism:
           - If follow graph exists: author followers
           - Else: broadcast to all agents
-        """
-        try:
-            followers = set(self.network.graph.get_followers(author_id))
-            if followers:
-                if author_id in self.agents.keys():
-                    followers.add(author_id)
-                return sorted(followers)
-        except Exception:
-            pass
 
-        return sorted(self.agents.keys())
+        Served from a cached RecipientIndex (kernel/recipients.py); the returned
+        list is shared and must not be mutated.
+        """
+        index = self._recipient_index
+        if index is None or index.key != recipient_index_key(self):
+            index = RecipientIndex(self)
+            self._recipient_index = index
+        return index.recipients(str(author_id))
 
     @staticmethod
     def _mark_perceived(agent: Agent, t: int) -> None:
@@ -754,33 +997,113 @@ class WorldKernel:
     def _reset_tick_budgets(self, t: int) -> None:
         """
         Time budgets reset at start of each tick.
+
+        With an active-agent index, only agents scheduled to have time are reset;
+        agents that just left the set (e.g. fell asleep) are zeroed. Scheduled agents
+        are written to the time ledger with one slot-indexed array store.
         """
         minutes_per_tick = float(getattr(self.clock, "seconds_per_tick", 900)) / 60.0
-        for agent in self.agents.values():
+        index = self._active_agent_index()
+        if index is None:
+            self._tick_active_ids = None
+            for agent in self.agents.values():
+                self._reset_agent_budget(agent, minutes_per_tick)
+            return
+
+        active_ids = index.active_at(self.clock.tick_of_day)
+        active = set(active_ids)
+        if index.needs_full_reset:
+            leaving = [agent_id for agent_id in self.agents.keys() if agent_id not in active]
+            index.needs_full_reset = False
+        else:
+            leaving = [agent_id for agent_id in index.budgeted if agent_id not in active]
+        if leaving:
+            self.world_context.set_time_budgets(leaving, 0.0)
+        if index.has_table:
+            self._reset_budgets_from_table(index, minutes_per_tick)
+        else:
+            for agent_id in active_ids:
+                self._reset_agent_budget(self.agents[agent_id], minutes_per_tick)
+        index.budgeted = active
+        self._tick_active_ids = (t, active_ids)
+
+    def _reset_budgets_from_table(self, index, minutes_per_tick: float) -> None:
+        """
+        Vectorized reset for scheduled agents: gather this tick's column of the
+        GeoWorld availability table and subtract reflective time in one expression
+        (same arithmetic as _reset_agent_budget). Agents still without a schedule
+        take the per-agent path, which creates their schedule.
+        """
+        tod = self.clock.tick_of_day % len(index.by_tick)
+        ids = index.scheduled_ids[tod]
+        if ids:
+            available = self.physical_world.available_minutes_at(
+                index.scheduled_rows[tod], tod, minutes_per_tick
+            ).astype("float64")
+            budgets = available - available * 0.2 * index.scheduled_reflect[tod]
+            ledger = self.world_context.time_remaining_by_agent
+            ledger.set_slots(index.ledger_slots(tod, ledger), budgets)
+        for agent_id in index.unscheduled_ids[tod]:
+            self._reset_agent_budget(self.agents[agent_id], minutes_per_tick)
+
+    def _reset_agent_budget(self, agent: Agent, minutes_per_tick: float) -> None:
+        available = minutes_per_tick
+        try:
+            available = self.physical_world.get_available_minutes(
+                agent_id=agent.id,
+                tick_of_day=self.clock.tick_of_day,
+                minutes_per_tick=minutes_per_tick,
+                rng=agent.rng,
+                ticks_per_day=self.clock.ticks_per_day,
+            )
+        except Exception:
             available = minutes_per_tick
-            try:
-                available = self.physical_world.get_available_minutes(
-                    agent_id=agent.id,
-                    tick_of_day=self.clock.tick_of_day,
-                    minutes_per_tick=minutes_per_tick,
-                    rng=agent.rng,
-                    ticks_per_day=self.clock.ticks_per_day,
-                )
-            except Exception:
-                available = minutes_per_tick
 
-            try:
-                self.world_context.set_time_budget(agent.id, available)
-            except Exception:
-                pass
+        try:
+            self.world_context.set_time_budget(agent.id, available)
+        except Exception:
+            pass
 
-            # Reflective time: some agents spend time thinking instead of acting/reading.
-            try:
-                prefs = getattr(agent, "activity", None)
-                reflect = float(getattr(prefs, "reflect_propensity", 0.0)) if prefs else 0.0
-                reflect = max(0.0, min(1.0, reflect))
-                if reflect > 0.0:
-                    reflect_cost = available * 0.2 * reflect
-                    self.world_context.spend_time(agent.id, reflect_cost)
-            except Exception:
-                pass
+        # Reflective time: some agents spend time thinking instead of acting/reading.
+        try:
+            prefs = getattr(agent, "activity", None)
+            reflect = float(getattr(prefs, "reflect_propensity", 0.0)) if prefs else 0.0
+            reflect = max(0.0, min(1.0, reflect))
+            if reflect > 0.0:
+                reflect_cost = available * 0.2 * reflect
+                self.world_context.spend_time(agent.id, reflect_cost)
+        except Exception:
+            pass
+
+    # -------------------------
+    # Active-agent set
+    # -------------------------
+
+    def _active_agent_index(self):
+        """
+        Cached ActiveAgentIndex, or None when every agent is visited every tick
+        (active set disabled or life cycle off).
+        """
+        if not self.enable_active_set or not getattr(self.physical_world, "enable_life_cycle", False):
+            self._active_index = None
+            return None
+        from gsocialsim.kernel.active_set import build_active_index, index_key
+
+        index = self._active_index
+        if index is None or index.key != index_key(self):
+            index = build_active_index(self)
+            self._active_index = index
+        return index
+
+    def active_agent_ids(self) -> List[str]:
+        """
+        Agents to visit in the current tick, in population order. Fixed at the start
+        of the tick by _reset_tick_budgets so all phases see the same set.
+        """
+        cached = self._tick_active_ids
+        if cached is not None and cached[0] == self.clock.t:
+            return cached[1]
+        index = self._active_agent_index()
+        if index is None:
+            return list(self.agents.keys())
+        return index.active_at(self.clock.tick_of_day)
@@ -1,17 +1,42 @@
-from typing import Dict, Set, List, Tuple, Optional
+from array import array
+from typing import Dict, Set, List, Tuple, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 from gsocialsim.types import AgentId
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass
+class FollowIndex:
+    """
+    Integer-indexed snapshot of the follow graph.
+
+    Node i is graph.node_ids[i] (interning order of add_edge). Followers are stored
+    CSC-style (row = followed, indices = followers), each row sorted by follower
+    index, so the layout is deterministic for a given edge insertion order.
+    The arrays are read-only; slices handed out by NetworkGraph are views into them.
+    """
+    version: int
+    n_nodes: int
+    followers_indptr: "np.ndarray"   # int64 [n_nodes + 1]
+    followers_indices: "np.ndarray"  # int32 [edges]
+
+
 @dataclass
 class NetworkGraph:
     """
     A simple directed graph representing follow relationships.
+
+    The dict-of-sets adjacency is the source of truth. A FollowIndex is built
+    lazily from it and cached until the topology version changes (new edge); trust
+    updates do not touch it.
     """
     # Key: AgentId of the follower
     # Value: Set of AgentIds being followed
     _following: Dict[AgentId, Set[AgentId]] = field(default_factory=dict)
-    
+
     # Key: AgentId of the one being followed
     # Value: Set of AgentIds who are followers
     _followers: Dict[AgentId, Set[AgentId]] = field(default_factory=dict)
@@ -20,10 +45,34 @@ class NetworkGraph:
     # Value: trust in [0,1]
     _edge_trust: Dict[Tuple[AgentId, AgentId], float] = field(default_factory=dict)
 
+    # Node interning (append-only, so indices stay valid across rebuilds)
+    _node_ids: List[AgentId] = field(default_factory=list)
+    _node_index: Dict[AgentId, int] = field(default_factory=dict)
+    # Edge list in insertion order (node indices), used to build the index without
+    # walking the dicts.
+    _edge_src: array = field(default_factory=lambda: array("q"))
+    _edge_dst: array = field(default_factory=lambda: array("q"))
+
+    _version: int = 0
+    _index: Optional[FollowIndex] = field(default=None, repr=False, compare=False)
+
+    def _intern(self, agent_id: AgentId) -> int:
+        idx = self._node_index.get(agent_id)
+        if idx is None:
+            idx = len(self._node_ids)
+            self._node_ids.append(agent_id)
+            self._node_index[agent_id] = idx
+        return idx
+
     def add_edge(self, follower: AgentId, followed: AgentId, trust: Optional[float] = None):
         """Adds a directed edge from follower to followed."""
-        self._following.setdefault(follower, set()).add(followed)
-        self._followers.setdefault(followed, set()).add(follower)
+        following = self._following.setdefault(follower, set())
+        if followed not in following:
+            following.add(followed)
+            self._followers.setdefault(followed, set()).add(follower)
+            self._edge_src.append(self._intern(follower))
+            self._edge_dst.append(self._intern(followed))
+            self._version += 1
         if trust is None:
             trust = 0.5
         try:
@@ -31,7 +80,7 @@ class NetworkGraph:
         except Exception:
             trust_val = 0.5
         self._edge_trust[(follower, followed)] = trust_val
-    
+
     def get_followers(self, agent_id: AgentId) -> List[AgentId]:
         return list(self._followers.get(agent_id, []))
 
@@ -53,6 +102,68 @@ class NetworkGraph:
         self._edge_trust[key] = v
         return v
 
+    # ----------------------------
+    # Indexed (CSC) access
+    # ----------------------------
+    @property
+    def version(self) -> int:
+        """Topology version; bumped whenever a new edge is added."""
+        return self._version
+
+    @property
+    def node_ids(self) -> List[AgentId]:
+        return self._node_ids
+
+    def node_index(self, agent_id: AgentId) -> int:
+        """Integer index of agent_id in the FollowIndex, or -1 if it has no edges."""
+        return self._node_index.get(agent_id, -1)
+
+    def follow_index(self) -> FollowIndex:
+        """Returns the cached FollowIndex, rebuilding it if the topology changed."""
+        index = self._index
+        if index is None or index.version != self._version:
+            index = self._build_index()
+            self._index = index
+        return index
+
+    def _build_index(self) -> FollowIndex:
+        import numpy as np
+
+        n = len(self._node_ids)
+        # Copy (not frombuffer): a live buffer export would block later appends.
+        src = np.array(self._edge_src, dtype=np.int64)
+        dst = np.array(self._edge_dst, dtype=np.int64)
+
+        def compress(rows: "np.ndarray", cols: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+            order = np.lexsort((cols, rows))
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+            indices = cols[order].astype(np.int32)
+            indptr.flags.writeable = False
+            indices.flags.writeable = False
+            return indptr, indices
+
+        followers_indptr, followers_indices = compress(dst, src)
+        return FollowIndex(
+            version=self._version,
+            n_nodes=n,
+            followers_indptr=followers_indptr,
+            followers_indices=followers_indices,
+        )
+
+    def followers_view(self, agent_id: AgentId) -> "np.ndarray":
+        """Zero-copy int32 view of the node indices that follow agent_id."""
+        index = self.follow_index()
+        i = self._node_index.get(agent_id, -1)
+        if i < 0 or i >= index.n_nodes:
+            return index.followers_indices[:0]
+        return index.followers_indices[index.followers_indptr[i] : index.followers_indptr[i + 1]]
+
+    def follower_count(self, agent_id: AgentId) -> int:
+        followers = self._followers.get(agent_id)
+        return len(followers) if followers else 0
+
+
 @dataclass
 class NetworkLayer:
     """
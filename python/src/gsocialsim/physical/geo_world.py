@@ -198,6 +198,14 @@ class GeoWorld:
     agent_home_geo: Dict[AgentId, GeoLocation] = field(default_factory=dict)
     agent_social_factors: Dict[AgentId, float] = field(default_factory=dict)
     population: GeoPopulationSampler = field(init=False)
+    # Bumped whenever an agent schedule is created (see schedule_version).
+    _schedule_version: int = field(default=0, init=False, repr=False)
+    # Availability table: float32 minutes per (agent row, tick-of-day), built once per
+    # schedule. Fortran order keeps each tick-of-day column contiguous.
+    _avail_rows: Dict[AgentId, int] = field(default_factory=dict, init=False, repr=False)
+    _avail_table: Optional[object] = field(default=None, init=False, repr=False)
+    _avail_count: int = field(default=0, init=False, repr=False)
+    _avail_minutes_per_tick: float = field(default=15.0, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.population = GeoPopulationSampler(h3_resolution=self.h3_resolution, bbox=self.bbox)
@@ -273,8 +281,14 @@ class GeoWorld:
         self.agent_social_factors[agent_id] = max(0.1, min(1.0, sf))
 
         self.schedules[agent_id] = self._build_schedule(rng, ticks_per_day, agent_id)
+        self._schedule_version += 1
+        self.availability_row(agent_id, ticks_per_day=ticks_per_day)
         return home_loc
 
+    @property
+    def schedule_version(self) -> int:
+        return self._schedule_version
+
     def get_agent_home_location(self, agent_id: AgentId, rng: random.Random) -> GeoLocation:
         loc = self.agent_home_geo.get(agent_id)
         if loc:
@@ -361,7 +375,13 @@ class GeoWorld:
         if not self.enable_life_cycle:
             return float(minutes_per_tick)
 
+        minutes = self.scheduled_minutes(agent_id, tick_of_day, minutes_per_tick)
+        if minutes is not None:
+            return minutes
         phase = self.get_phase(agent_id, tick_of_day, rng, ticks_per_day)
+        return self._minutes_for_phase(agent_id, phase, minutes_per_tick)
+
+    def _minutes_for_phase(self, agent_id: AgentId, phase: LifePhase, minutes_per_tick: float) -> float:
         base = 0.0
         if phase == LifePhase.SLEEP:
             base = 0.0
@@ -373,6 +393,91 @@ class GeoWorld:
         sf = float(self.agent_social_factors.get(agent_id, 0.6))
         return max(0.0, base * sf)
 
+    def scheduled_minutes(self, agent_id: AgentId, tick_of_day: int, minutes_per_tick: float) -> Optional[float]:
+        """
+        Available minutes from an existing schedule, without touching any RNG.
+        Returns None when the agent has no schedule yet (get_available_minutes would create one).
+        """
+        if not self.enable_life_cycle:
+            return float(minutes_per_tick)
+        row = self.availability_row(agent_id)
+        if row < 0:
+            return None
+        table = self.availability_table(minutes_per_tick)
+        tod = int(tick_of_day)
+        if tod < 0 or tod >= table.shape[1]:
+            return self._minutes_for_phase(agent_id, LifePhase.LEISURE, minutes_per_tick)
+        return float(table[row, tod])
+
+    # ----------------------------
+    # Availability table
+    # ----------------------------
+    def _availability_values(self, agent_id: AgentId, width: int, minutes_per_tick: float) -> List[float]:
+        phases = self.schedules[agent_id].daily_phase
+        return [
+            self._minutes_for_phase(agent_id, phases.get(t, LifePhase.LEISURE), minutes_per_tick)
+            for t in range(width)
+        ]
+
+    def availability_row(self, agent_id: AgentId, *, ticks_per_day: Optional[int] = None) -> int:
+        """
+        Row of agent_id in the availability table (-1 without a schedule).
+        Rows are created on first use, e.g. for schedules restored from a checkpoint.
+        """
+        row = self._avail_rows.get(agent_id)
+        if row is not None:
+            return row
+        schedule = self.schedules.get(agent_id)
+        if not schedule:
+            return -1
+        import numpy as np
+
+        table = self._avail_table
+        if table is None:
+            width = ticks_per_day or (max(schedule.daily_phase.keys(), default=0) + 1)
+            table = np.zeros((64, max(1, int(width))), dtype=np.float32, order="F")
+        elif self._avail_count >= table.shape[0]:
+            grown = np.zeros((table.shape[0] * 2, table.shape[1]), dtype=np.float32, order="F")
+            grown[: table.shape[0]] = table
+            table = grown
+        row = self._avail_count
+        table[row, :] = self._availability_values(agent_id, table.shape[1], self._avail_minutes_per_tick)
+        self._avail_table = table
+        self._avail_rows[agent_id] = row
+        self._avail_count += 1
+        return row
+
+    def invalidate_availability(self) -> None:
+        """Drop the availability table (call after replacing schedules or social factors wholesale)."""
+        self._avail_rows = {}
+        self._avail_table = None
+        self._avail_count = 0
+        self._schedule_version += 1
+
+    def availability_table(self, minutes_per_tick: Optional[float] = None):
+        """
+        float32 [rows x ticks_per_day] minutes table (view over the allocated rows).
+
+        Leisure minutes scale with minutes_per_tick; asking for a different value than
+        the table was built with rebuilds every row once.
+        """
+        import numpy as np
+
+        if minutes_per_tick is not None and float(minutes_per_tick) != self._avail_minutes_per_tick:
+            self._avail_minutes_per_tick = float(minutes_per_tick)
+            table = self._avail_table
+            if table is not None:
+                for agent_id, row in self._avail_rows.items():
+                    table[row, :] = self._availability_values(agent_id, table.shape[1], self._avail_minutes_per_tick)
+        if self._avail_table is None:
+            return np.zeros((0, 0), dtype=np.float32, order="F")
+        return self._avail_table[: self._avail_count]
+
+    def available_minutes_at(self, rows, tick_of_day: int, minutes_per_tick: float):
+        """Vectorized minutes for table rows at one tick-of-day (contiguous column read)."""
+        table = self.availability_table(minutes_per_tick)
+        return table[:, int(tick_of_day)][rows]
+
     def get_co_located_agents(self, tick_of_day: int) -> List[List[AgentId]]:
         agents_by_cell: Dict[str, List[AgentId]] = {}
         for agent_id, schedule in self.schedules.items():
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
 from gsocialsim.policy.action_policy import ActionPolicy
@@ -77,11 +77,21 @@ class BanditLearner(ActionPolicy):
             return str(action.original_content.topic)
         return f"{action.verb.value}_{action.target_stimulus_id}"
 
+    def _reactive_ids(self, agent: "Agent") -> List[str]:
+        """The last max_reactive_impressions content ids in working memory, oldest first."""
+        recent = agent.recent_impressions
+        try:
+            return recent.last_ids(self.max_reactive_impressions)
+        except AttributeError:
+            # Plain mapping (e.g. a dict assigned by hand)
+            ids = list(recent.keys())
+            if self.max_reactive_impressions > 0 and len(ids) > self.max_reactive_impressions:
+                ids = ids[-self.max_reactive_impressions :]
+            return ids
+
     def _random_action(self, agent: "Agent", tick: int) -> Optional[Interaction]:
         topics = list(agent.beliefs.topics.items())
-        impressions = list(agent.recent_impressions.keys())
-        if self.max_reactive_impressions > 0 and len(impressions) > self.max_reactive_impressions:
-            impressions = impressions[-self.max_reactive_impressions :]
+        impressions = self._reactive_ids(agent)
         n_topics = len(topics)
         n_impressions = len(impressions)
         total = n_topics + 2 * n_impressions
@@ -118,9 +128,7 @@ class BanditLearner(ActionPolicy):
                 best_kind = InteractionVerb.CREATE
                 best_payload = (topic, belief.stance)
 
-        impressions = list(agent.recent_impressions.keys())
-        if self.max_reactive_impressions > 0 and len(impressions) > self.max_reactive_impressions:
-            impressions = impressions[-self.max_reactive_impressions :]
+        impressions = self._reactive_ids(agent)
         for content_id in impressions:
             for verb in (InteractionVerb.LIKE, InteractionVerb.FORWARD):
                 key = f"{verb.value}_{content_id}"
@@ -180,9 +188,7 @@ class BanditLearner(ActionPolicy):
                 )
 
         # Reactive actions
-        impressions = list(agent.recent_impressions.keys())
-        if self.max_reactive_impressions > 0 and len(impressions) > self.max_reactive_impressions:
-            impressions = impressions[-self.max_reactive_impressions :]
+        impressions = self._reactive_ids(agent)
         for content_id in impressions:
             for verb in (InteractionVerb.LIKE, InteractionVerb.FORWARD):
                 key = f"{verb.value}_{content_id}"
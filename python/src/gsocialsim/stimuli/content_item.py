@@ -7,7 +7,7 @@ from gsocialsim.types import ContentId, ActorId, TopicId
 from gsocialsim.stimuli.stimulus import MediaType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContentItem:
     """
     A representation of a piece of content an agent can perceive.
@@ -23,6 +23,9 @@ class ContentItem:
       - identity_threat: optional precomputed threat signal [0,1]
       - primal_triggers: optional neuromarketing-style triggers
       - primal_intensity: optional intensity [0,1]
+
+    Instances are immutable: a stimulus is converted once at ingestion and the
+    same ContentItem is shared by every recipient (StimulusIngestionEngine).
     """
     id: ContentId
     author_id: ActorId
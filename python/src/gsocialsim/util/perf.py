@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterator
-from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import json
+import os
 import time
+import tracemalloc
+
+_MB = 1024.0 * 1024.0
+MEMORY_MODES = ("rss", "tracemalloc")
 
 
 @dataclass
@@ -12,51 +17,462 @@ class PerfStats:
     count: int = 0
     max: float = 0.0
     min: float = 1.0e30
+    # Calls seen vs calls actually timed (they differ in sampling mode).
+    calls: int = 0
+    sampled: int = 0
 
     def add(self, duration: float, count: int = 1) -> None:
         self.total += duration
         self.count += count
+        self.calls += 1
+        self.sampled += 1
         if duration > self.max:
             self.max = duration
         if duration < self.min:
             self.min = duration
 
+    def skip(self, count: int = 1) -> None:
+        self.count += count
+        self.calls += 1
+
+    @property
+    def estimated_total(self) -> float:
+        """Measured total scaled up to all calls (equal to total without sampling)."""
+        if not self.sampled or self.sampled == self.calls:
+            return self.total
+        return self.total * self.calls / self.sampled
+
+
+@dataclass
+class MemoryStats:
+    """Memory deltas of one span name (bytes; RSS or traced Python heap)."""
+
+    total: int = 0
+    count: int = 0
+    max: int = 0
+    min: int = 0
+    # Allocation site ("file:line") -> [net bytes, net blocks], tracemalloc mode only.
+    sites: Dict[str, List[int]] = field(default_factory=dict)
+
+    def add(self, delta: int) -> None:
+        if not self.count or delta > self.max:
+            self.max = delta
+        if not self.count or delta < self.min:
+            self.min = delta
+        self.total += delta
+        self.count += 1
+
+    def add_sites(self, diffs) -> None:
+        for d in diffs:
+            if not d.size_diff:
+                continue
+            frame = d.traceback[0]
+            key = f"{frame.filename}:{frame.lineno}"
+            site = self.sites.get(key)
+            if site is None:
+                self.sites[key] = [d.size_diff, d.count_diff]
+            else:
+                site[0] += d.size_diff
+                site[1] += d.count_diff
+
+    def top_sites(self, n: int) -> List[Tuple[str, int, int]]:
+        rows = sorted(self.sites.items(), key=lambda kv: kv[1][0], reverse=True)
+        return [(k, v[0], v[1]) for k, v in rows[:n]]
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return 0
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Context manager returned by PerfTracker.time(); a plain class keeps per-call overhead low."""
+
+    __slots__ = ("tracker", "name", "count", "start", "timed", "memory", "mem_start", "snapshot", "overhead")
+
+    def __init__(self, tracker: "PerfTracker", name: str, count: int, timed: bool, memory: bool = False) -> None:
+        self.tracker = tracker
+        self.name = name
+        self.count = count
+        self.timed = timed
+        self.memory = memory
+        self.start = 0.0
+        self.mem_start = 0
+        self.snapshot = None
+        self.overhead = 0.0
+
+    def __enter__(self) -> None:
+        tracker = self.tracker
+        tracker._stack.append(self.name)
+        if self.memory:
+            tracker._memory_enter(self)
+        if self.timed:
+            self.overhead = tracker._overhead
+            self.start = time.perf_counter()
+        return None
+
+    def __exit__(self, *exc) -> bool:
+        tracker = self.tracker
+        end = 0.0
+        if self.timed:
+            # Memory sampling inside this span is not charged to it.
+            end = time.perf_counter() - (tracker._overhead - self.overhead)
+        if self.memory:
+            tracker._memory_exit(self)
+        tracker._close(self, end)
+        return False
+
 
 class PerfTracker:
-    def __init__(self, enabled: bool = False, level: str = "basic") -> None:
+    """
+    Named timing spans.
+
+    Modes (combinable):
+      - flat (default): per-name totals, used by report().
+      - hierarchical: spans also aggregate by their path of open parents
+        (e.g. tick > phase/act_batch > act/agent), with self time per node.
+      - sample_every=N: each span name is only timed on every Nth call; counts stay
+        exact and report() extrapolates totals from the timed calls.
+      - trace: timed spans are also recorded as events for export_chrome_trace()
+        and export_speedscope(); without trace, export_speedscope() writes the
+        aggregated hierarchical tree.
+      - memory="rss" | "tracemalloc": spans whose name starts with one of
+        memory_spans (by default the tick and its phases) also record the change
+        in process RSS, or in traced Python heap, between enter and exit. With
+        tracemalloc and memory_top > 0, timed tracked spans also diff heap
+        snapshots and accumulate the net bytes allocated per source line, so
+        report() can show where each phase's growth comes from. Time spent
+        sampling memory is subtracted from every open span's timing.
+
+    Spans must be opened and closed on one thread (the kernel only times from the
+    main thread; worker pools are timed around the whole map).
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        level: str = "basic",
+        *,
+        hierarchical: bool = False,
+        sample_every: int = 1,
+        trace: bool = False,
+        max_trace_events: int = 1_000_000,
+        memory: Optional[str] = None,
+        memory_top: int = 0,
+        memory_spans: Tuple[str, ...] = ("tick", "phase/"),
+    ) -> None:
         self.enabled = bool(enabled)
         self.level = str(level)
+        self.hierarchical = bool(hierarchical)
+        self.sample_every = max(1, int(sample_every))
+        self.trace = bool(trace)
+        self.max_trace_events = int(max_trace_events)
         self.stats: Dict[str, PerfStats] = {}
+        self.tree: Dict[Tuple[str, ...], PerfStats] = {}
+        # (name, depth, start, end) for timed spans when trace is on
+        self.events: List[Tuple[str, int, float, float]] = []
+        self.dropped_events = 0
+        self._stack: List[str] = []
+        self._origin = time.perf_counter()
+        self.memory: Optional[str] = None
+        self.memory_top = 0
+        self.memory_spans = tuple(memory_spans)
+        self.memory_stats: Dict[str, MemoryStats] = {}
+        self._started_tracemalloc = False
+        # Seconds spent sampling memory so far (excluded from span durations).
+        self._overhead = 0.0
+        self.configure(memory=memory, memory_top=memory_top)
 
     def set_enabled(self, enabled: bool, level: str | None = None) -> None:
         self.enabled = bool(enabled)
         if level is not None:
             self.level = str(level)
 
-    @contextmanager
-    def time(self, name: str, count: int = 1) -> Iterator[None]:
+    def configure(
+        self,
+        *,
+        hierarchical: Optional[bool] = None,
+        sample_every: Optional[int] = None,
+        trace: Optional[bool] = None,
+        memory: Optional[str] = None,
+        memory_top: Optional[int] = None,
+    ) -> None:
+        """Change modes; memory="" (or "off") turns memory accounting off."""
+        if hierarchical is not None:
+            self.hierarchical = bool(hierarchical)
+        if sample_every is not None:
+            self.sample_every = max(1, int(sample_every))
+        if trace is not None:
+            self.trace = bool(trace)
+        if memory_top is not None:
+            self.memory_top = max(0, int(memory_top))
+        if memory is not None:
+            mode = str(memory).lower() or None
+            if mode == "off":
+                mode = None
+            if mode is not None and mode not in MEMORY_MODES:
+                raise ValueError(f"unknown memory mode: {memory}")
+            self.memory = mode
+        if self.memory == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        elif self.memory != "tracemalloc" and self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self) -> None:
+        self.memory_stats.clear()
+        self.stats.clear()
+        self.tree.clear()
+        self.events.clear()
+        self.dropped_events = 0
+        self._stack.clear()
+        self._origin = time.perf_counter()
+
+    # ----------------------------
+    # Spans
+    # ----------------------------
+    def time(self, name: str, count: int = 1):
         if not self.enabled:
-            yield
-            return
-        start = time.perf_counter()
-        try:
-            yield
-        finally:
-            dur = time.perf_counter() - start
+            return _NULL_SPAN
+        timed = True
+        if self.sample_every > 1:
             stat = self.stats.get(name)
-            if stat is None:
-                stat = PerfStats()
-                self.stats[name] = stat
-            stat.add(dur, count=count)
+            timed = stat is None or stat.calls % self.sample_every == 0
+        memory = self.memory is not None and name.startswith(self.memory_spans)
+        return _Span(self, name, count, timed, memory)
+
+    @staticmethod
+    def _stat(table: dict, key) -> PerfStats:
+        stat = table.get(key)
+        if stat is None:
+            stat = PerfStats()
+            table[key] = stat
+        return stat
+
+    def _close(self, span: _Span, end: float) -> None:
+        stack = self._stack
+        if self.hierarchical:
+            path = tuple(stack)
+        stack.pop()
+        stat = self._stat(self.stats, span.name)
+        if not span.timed:
+            stat.skip(span.count)
+            if self.hierarchical:
+                self._stat(self.tree, path).skip(span.count)
+            return
+        dur = end - span.start
+        stat.add(dur, count=span.count)
+        if self.hierarchical:
+            self._stat(self.tree, path).add(dur, count=span.count)
+        if self.trace:
+            if len(self.events) < self.max_trace_events:
+                self.events.append((span.name, len(stack), span.start - self._origin, end - self._origin))
+            else:
+                self.dropped_events += 1
+
+    def _sites_snapshot(self) -> "tracemalloc.Snapshot":
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+
+    def _memory_enter(self, span: _Span) -> None:
+        t0 = time.perf_counter()
+        if self.memory == "rss":
+            span.mem_start = current_rss_bytes()
+        elif not tracemalloc.is_tracing():
+            span.memory = False
+        else:
+            if self.memory_top and span.timed:
+                span.snapshot = self._sites_snapshot()
+            span.mem_start = tracemalloc.get_traced_memory()[0]
+        self._overhead += time.perf_counter() - t0
+
+    def _memory_exit(self, span: _Span) -> None:
+        t0 = time.perf_counter()
+        self._record_memory(span)
+        self._overhead += time.perf_counter() - t0
+
+    def _record_memory(self, span: _Span) -> None:
+        if self.memory == "rss":
+            delta = current_rss_bytes() - span.mem_start
+        else:
+            delta = tracemalloc.get_traced_memory()[0] - span.mem_start
+        stat = self.memory_stats.get(span.name)
+        if stat is None:
+            stat = MemoryStats()
+            self.memory_stats[span.name] = stat
+        stat.add(delta)
+        if span.snapshot is not None:
+            stat.add_sites(self._sites_snapshot().compare_to(span.snapshot, "lineno"))
+            span.snapshot = None
+
+    # ----------------------------
+    # Reports
+    # ----------------------------
+    def memory_report(self, top_sites: Optional[int] = None) -> List[str]:
+        top_sites = self.memory_top if top_sites is None else int(top_sites)
+        what = "process RSS" if self.memory == "rss" else "traced Python heap"
+        lines = [f"MEMORY REPORT ({what}; net change per span):"]
+        rows = sorted(self.memory_stats.items(), key=lambda kv: kv[1].total, reverse=True)
+        for name, m in rows:
+            avg = m.total / m.count if m.count else 0.0
+            lines.append(
+                f"{name}: net={m.total / _MB:+.3f}MB count={m.count} avg={avg / _MB:+.4f}MB "
+                f"max={m.max / _MB:+.4f}MB min={m.min / _MB:+.4f}MB"
+            )
+            for site, size, blocks in m.top_sites(top_sites):
+                if size <= 0:
+                    break
+                lines.append(f"  {site}: {size / _MB:+.3f}MB ({blocks:+d} blocks)")
+        return lines
 
     def report(self, top: int = 20) -> str:
         if not self.stats:
             return "TIMING REPORT: no data collected."
-        rows = sorted(self.stats.items(), key=lambda kv: kv[1].total, reverse=True)
-        lines = ["TIMING REPORT (top by total time):"]
+        rows = sorted(self.stats.items(), key=lambda kv: kv[1].estimated_total, reverse=True)
+        sampled = any(s.sampled != s.calls for s in self.stats.values())
+        header = "TIMING REPORT (top by total time):"
+        if sampled:
+            header = f"TIMING REPORT (top by estimated total; 1 in {self.sample_every} calls timed):"
+        lines = [header]
         for name, s in rows[:top]:
-            avg = s.total / s.count if s.count else 0.0
+            avg = s.total / s.sampled if s.sampled else 0.0
             lines.append(
-                f"{name}: total={s.total:.4f}s count={s.count} avg={avg:.6f}s max={s.max:.6f}s"
+                f"{name}: total={s.estimated_total:.4f}s count={s.count} avg={avg:.6f}s max={s.max:.6f}s"
             )
+        if self.hierarchical and self.tree:
+            lines.append("")
+            lines.extend(self.tree_report())
+        if self.memory_stats:
+            lines.append("")
+            lines.extend(self.memory_report())
         return "\n".join(lines)
+
+    def self_times(self) -> Dict[Tuple[str, ...], float]:
+        """Estimated self time per tree path (total minus the totals of direct children)."""
+        out = {path: s.estimated_total for path, s in self.tree.items()}
+        for path, s in self.tree.items():
+            parent = path[:-1]
+            if parent in out:
+                out[parent] -= s.estimated_total
+        return {path: max(0.0, v) for path, v in out.items()}
+
+    def tree_report(self) -> List[str]:
+        self_time = self.self_times()
+        lines = ["TIMING TREE (total / self):"]
+        for path in sorted(self.tree):
+            s = self.tree[path]
+            indent = "  " * (len(path) - 1)
+            lines.append(
+                f"{indent}{path[-1]}: total={s.estimated_total:.4f}s self={self_time[path]:.4f}s count={s.count}"
+            )
+        return lines
+
+    # ----------------------------
+    # Export
+    # ----------------------------
+    def chrome_trace(self) -> dict:
+        """Chrome trace-event JSON (chrome://tracing, Perfetto) from recorded spans."""
+        events = [
+            {
+                "name": name,
+                "cat": name.split("/", 1)[0],
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": 0,
+                "tid": 0,
+                "args": {"depth": depth},
+            }
+            for name, depth, start, end in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def speedscope(self, name: str = "gsocialsim") -> dict:
+        """
+        speedscope JSON: an evented profile from recorded spans when trace is on,
+        otherwise a sampled profile weighted by the hierarchical self times.
+        """
+        frames: List[dict] = []
+        frame_index: Dict[str, int] = {}
+
+        def frame(label: str) -> int:
+            i = frame_index.get(label)
+            if i is None:
+                i = len(frames)
+                frame_index[label] = i
+                frames.append({"name": label})
+            return i
+
+        if self.events:
+            spans = sorted(self.events, key=lambda e: (e[2], -e[3]))
+            out: List[dict] = []
+            open_spans: List[Tuple[int, float]] = []
+            for label, _, start, end in spans:
+                while open_spans and open_spans[-1][1] <= start:
+                    f, close_at = open_spans.pop()
+                    out.append({"type": "C", "frame": f, "at": close_at})
+                f = frame(label)
+                out.append({"type": "O", "frame": f, "at": start})
+                open_spans.append((f, end))
+            while open_spans:
+                f, close_at = open_spans.pop()
+                out.append({"type": "C", "frame": f, "at": close_at})
+            profile = {
+                "type": "evented",
+                "name": name,
+                "unit": "seconds",
+                "startValue": spans[0][2] if spans else 0.0,
+                "endValue": max((e[3] for e in spans), default=0.0),
+                "events": out,
+            }
+        else:
+            self_time = self.self_times()
+            paths = sorted(p for p in self_time if self_time[p] > 0.0)
+            samples = [[frame(label) for label in path] for path in paths]
+            weights = [self_time[p] for p in paths]
+            profile = {
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0.0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [profile],
+            "name": name,
+            "exporter": "gsocialsim.util.perf",
+        }
+
+    def export_chrome_trace(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def export_speedscope(self, path: str, name: str = "gsocialsim") -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.speedscope(name), f)
@@ -213,6 +213,32 @@ def parse_args() -> argparse.Namespace:
         help="Timing detail level",
     )
     p.add_argument("--timing-top", type=int, default=20, help="Timing report top N rows")
+    p.add_argument("--timing-tree", action="store_true", help="Also report nested (parent/child) span timings")
+    p.add_argument(
+        "--timing-sample",
+        type=int,
+        default=1,
+        help="Only time every Nth call of each span (totals are extrapolated)",
+    )
+    p.add_argument(
+        "--timing-trace",
+        type=str,
+        default=None,
+        help="Write spans to this file: *.speedscope.json for speedscope, else Chrome trace JSON",
+    )
+    p.add_argument(
+        "--timing-memory",
+        type=str,
+        default="",
+        choices=["", "rss", "tracemalloc"],
+        help="Also report per-phase memory deltas (process RSS or traced Python heap)",
+    )
+    p.add_argument(
+        "--timing-memory-top",
+        type=int,
+        default=0,
+        help="With --timing-memory tracemalloc: top N allocation sites per phase",
+    )
     p.add_argument(
         "--debug-logs",
         default=False,
@@ -239,6 +265,22 @@ def parse_args() -> argparse.Namespace:
         action=argparse.BooleanOptionalAction,
         help="Enable agent-centric batch processing (default on)",
     )
+    p.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Use the population-wide vectorized perception engine",
+    )
+    p.add_argument(
+        "--belief-tensor",
+        action="store_true",
+        help="Store all agent beliefs in one structure-of-arrays tensor",
+    )
+    p.add_argument(
+        "--shards",
+        type=int,
+        default=0,
+        help="Run ACT/PERCEIVE in this many forked shard workers (0 = off)",
+    )
 
     return p.parse_args()
 
@@ -250,12 +292,21 @@ def main() -> None:
         seed=args.seed,
         enable_timing=args.timing,
         timing_level=args.timing_level,
+        timing_hierarchical=args.timing_tree,
+        timing_sample_every=args.timing_sample,
+        timing_trace=bool(args.timing_trace),
+        timing_memory=args.timing_memory,
+        timing_memory_top=args.timing_memory_top,
         enable_debug_logging=args.debug_logs,
         enable_parallel=args.parallel,
         parallel_workers=args.parallel_workers,
         max_recipients_per_content=args.max_recipients,
         max_perceptions_per_tick=args.max_perceptions,
         enable_batch_all=args.batch,
+        enable_vectorized_perception=args.vectorized,
+        enable_belief_tensor=args.belief_tensor,
+        enable_sharding=args.shards > 0,
+        shard_workers=args.shards,
     )
     extra_agents = max(0, int(args.agents) - 4)
     setup_simulation_scenario(
@@ -285,6 +336,12 @@ def main() -> None:
     print_sanity_summary(sim_kernel)
     if args.timing:
         print(sim_kernel.perf.report(top=args.timing_top))
+        if args.timing_trace:
+            if args.timing_trace.endswith(".speedscope.json"):
+                sim_kernel.perf.export_speedscope(args.timing_trace)
+            else:
+                sim_kernel.perf.export_chrome_trace(args.timing_trace)
+            print(f"Timing trace written to: {args.timing_trace}")
 
     # Export
     if args.viz == "full" and args.out == "influence_graph.html":
@@ -0,0 +1,121 @@
+"""
+Shared kernel builders for the determinism / equivalence tests.
+
+Tests that compare two runs (execution modes, checkpoints, forks) build their
+kernels with `make_kernel` and compare them with `kernel_fingerprint`, so every
+comparison covers the same state.
+"""
+
+from typing import Callable, Optional, Sequence, Tuple
+
+import pytest
+
+from gsocialsim.agents.agent import Agent
+from gsocialsim.kernel.world_kernel import WorldKernel
+from gsocialsim.stimuli.data_source import DataSource
+from gsocialsim.stimuli.stimulus import Stimulus
+from gsocialsim.types import AgentId
+
+
+class StimulusSource(DataSource):
+    """`per_tick` stimuli every tick from two sources, cycling over topics and stances."""
+
+    def __init__(
+        self,
+        topics: Sequence[str] = ("T",),
+        per_tick: int = 4,
+        stances: Tuple[float, float] = (-0.5, 0.5),
+    ):
+        self.topics = list(topics)
+        self.per_tick = per_tick
+        self.stances = stances
+
+    def get_stimuli(self, tick: int):
+        return [
+            Stimulus(
+                id=f"S{tick}_{i}",
+                source=f"SRC{i % 2}",
+                tick=tick,
+                content_text="stim",
+                metadata={"topic": self.topics[i % len(self.topics)], "stance": self.stances[i % 2]},
+            )
+            for i in range(self.per_tick)
+        ]
+
+
+def build_kernel(
+    *,
+    prefix: str = "A",
+    n_agents: int = 8,
+    seed: int = 1,
+    agent_seed: int = 100,
+    edges: Sequence[Tuple[int, float]] = ((1, 0.6),),
+    source: Optional[DataSource] = None,
+    topics: Sequence[str] = ("T",),
+    per_tick: int = 4,
+    stances: Tuple[float, float] = (-0.5, 0.5),
+    life_cycle: bool = False,
+    agent_setup: Optional[Callable[[int, Agent], None]] = None,
+    **kernel_kwargs,
+) -> WorldKernel:
+    """
+    Kernel with agents `{prefix}{i}` on a ring: agent i follows i+offset with the
+    given trust for each (offset, trust) in `edges`. `source` defaults to a
+    StimulusSource(topics, per_tick, stances); with life_cycle the synthetic
+    population CSV is disabled.
+    """
+    k = WorldKernel(seed=seed, enable_debug_logging=False, **kernel_kwargs)
+    if life_cycle:
+        k.physical_world.population_csv_path = None
+    else:
+        k.physical_world.enable_life_cycle = False
+    for i in range(n_agents):
+        a = Agent(id=AgentId(f"{prefix}{i}"), seed=agent_seed + i)
+        if agent_setup is not None:
+            agent_setup(i, a)
+        a.budgets.action_bank = 100.0
+        a.budgets.reset_for_tick()
+        k.agents.add_agent(a)
+    for i in range(n_agents):
+        for offset, trust in edges:
+            k.network.graph.add_edge(follower=f"{prefix}{i}", followed=f"{prefix}{(i + offset) % n_agents}", trust=trust)
+    if source is None:
+        source = StimulusSource(topics, per_tick, stances)
+    k.stimulus_engine.register_data_source(source)
+    return k
+
+
+def fingerprint(k: WorldKernel, *, analytics: bool = False, rng: bool = True):
+    """
+    Comparable simulation state: clock, per-agent beliefs, identity, policy counts,
+    working memory, attention bank and rng position, plus trust and follow-edge
+    trust. With analytics, exposure/consumption counts too (checkpoints start
+    with fresh analytics, so they are opt-in). rng=False leaves out the rng
+    position, which differs when an agent is skipped for a tick but does not
+    affect later draws (streams restart every tick).
+    """
+    agents = {}
+    for aid, a in k.agents.items():
+        agents[aid] = (
+            sorted((t, round(b.stance, 12), round(b.confidence, 12)) for t, b in a.beliefs.topics.items()),
+            a.identity.identity_rigidity,
+            dict(a.policy.action_counts),
+            list(a.recent_impressions.keys()),
+            a.budgets.attention_bank_minutes,
+            a.rng.getstate() if rng else None,
+        )
+    trust = sorted((key, rel.trust) for key, rel in k.gsr._relations.items())
+    out = (k.clock.t, agents, trust, dict(k.network.graph._edge_trust))
+    if analytics:
+        out += (dict(k.analytics.exposure_counts), dict(k.analytics.consumed_counts))
+    return out
+
+
+@pytest.fixture
+def make_kernel():
+    return build_kernel
+
+
+@pytest.fixture
+def kernel_fingerprint():
+    return fingerprint
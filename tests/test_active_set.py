@@ -0,0 +1,86 @@
+from gsocialsim.kernel.world_kernel import WorldKernel
+from gsocialsim.agents.agent import Agent
+from gsocialsim.physical.geo_world import LifePhase
+from gsocialsim.types import AgentId
+
+
+# No follows and no stimuli: these tests only look at schedules and budgets.
+_POPULATION = dict(prefix="N", n_agents=12, seed=17, agent_seed=900, edges=(), per_tick=0, life_cycle=True)
+
+
+def _sleeping(k: WorldKernel, tod: int):
+    return {
+        aid for aid, sched in k.physical_world.schedules.items()
+        if sched.daily_phase.get(tod) == LifePhase.SLEEP
+    }
+
+
+def test_sleeping_agents_are_not_visited_and_have_no_budget(make_kernel):
+    k = make_kernel(**_POPULATION)
+    visits = []
+    for agent in k.agents.values():
+        original = agent.plan_action
+
+        def counted(tick, context=None, _aid=agent.id, _orig=original):
+            visits.append((tick, _aid))
+            return _orig(tick, context)
+
+        agent.plan_action = counted
+
+    k.step(k.clock.ticks_per_day)
+    saw_sleepers = False
+    for tick in range(k.clock.ticks_per_day):
+        visited = {aid for t, aid in visits if t == tick}
+        sleeping = _sleeping(k, tick)
+        saw_sleepers = saw_sleepers or bool(sleeping)
+        assert not (visited & sleeping)
+        assert visited | sleeping == set(k.agents.keys())
+    assert saw_sleepers
+
+    tod = k.clock.tick_of_day
+    k.step(1)
+    for aid in _sleeping(k, tod):
+        assert k.world_context.time_remaining_by_agent[aid] == 0.0
+
+
+def test_index_follows_population_changes(make_kernel):
+    k = make_kernel(**_POPULATION)
+    k.step(2)
+    index = k._active_index
+    k.agents.replace("N0", Agent(id=AgentId("M0"), seed=1))
+    k.step(1)
+    assert "N0" not in k.active_agent_ids()
+    k.step(1)
+    assert k._active_index is not index
+
+
+def test_table_reset_matches_per_agent_reset(make_kernel):
+    k = make_kernel(**_POPULATION)
+    k.step(3)
+    world = k.physical_world
+    minutes_per_tick = float(k.clock.seconds_per_tick) / 60.0
+    table = world.availability_table(minutes_per_tick)
+    assert table.dtype.name == "float32"
+    assert table.shape == (len(list(k.agents.keys())), k.clock.ticks_per_day)
+
+    for _ in range(k.clock.ticks_per_day):
+        tod = k.clock.tick_of_day
+        k._reset_tick_budgets(k.clock.t)
+        assert k._active_index.has_table
+        vectorized = dict(k.world_context.time_remaining_by_agent)
+        for agent in k.agents.values():
+            minutes = world.get_available_minutes(agent.id, tod, minutes_per_tick, agent.rng, k.clock.ticks_per_day)
+            assert minutes == world.scheduled_minutes(agent.id, tod, minutes_per_tick)
+            k._reset_agent_budget(agent, minutes_per_tick)
+            assert vectorized[agent.id] == k.world_context.time_remaining_by_agent[agent.id]
+        k.clock.advance(1)
+
+
+def test_active_set_reproduces_flag_off_state(make_kernel, kernel_fingerprint):
+    population = dict(prefix="N", n_agents=8, seed=8, agent_seed=500, topics=("T_0", "T_1", "T_2"), life_cycle=True)
+    on = make_kernel(**population)
+    off = make_kernel(enable_active_set=False, **population)
+    # Two day boundaries: budget regen and dream draws happen after skipped ticks.
+    on.step(2 * on.clock.ticks_per_day + 8)
+    off.step(2 * off.clock.ticks_per_day + 8)
+    assert kernel_fingerprint(on, analytics=True, rng=False) == kernel_fingerprint(off, analytics=True, rng=False)
@@ -0,0 +1,43 @@
+import numpy as np
+
+from gsocialsim.agents.agent import Agent
+from gsocialsim.agents.agent_rng import AgentRng, agent_key, derive_key, derive_keys, uniform_at
+from gsocialsim.kernel.sim_clock import SimClock
+
+
+def test_scalar_and_bulk_draws_agree():
+    rng = AgentRng.for_agent(7, "A1")
+    scalar = [rng.random() for _ in range(5)]
+    bulk = uniform_at(np.full(5, rng.key, dtype=np.uint64), 0, np.arange(5))
+    assert scalar == bulk.tolist()
+
+    keys = np.array([agent_key(1, "x"), agent_key(2, "y")], dtype=np.uint64)
+    assert derive_keys(keys, "perceive/expose").tolist() == [derive_key(int(k), "perceive/expose") for k in keys]
+
+
+def test_draws_depend_only_on_key_tick_and_counter():
+    clock = SimClock()
+    a = AgentRng.for_agent(3, "A", clock)
+    b = AgentRng.for_agent(3, "A", clock)
+    a.random()
+    a.random()
+    clock.advance(1)
+    # b skipped tick 0 entirely but sees the same tick-1 sequence.
+    assert [a.random() for _ in range(3)] == [b.random() for _ in range(3)]
+
+    state = a.getstate()
+    x = a.gauss(0.0, 1.0)
+    a.setstate(state)
+    assert a.gauss(0.0, 1.0) == x
+    assert AgentRng.for_agent(3, "B").random() != AgentRng.for_agent(3, "A").random()
+
+
+def test_agent_uses_counter_stream_with_random_api():
+    agent = Agent(id="R0", seed=11)
+    rng = agent.rng
+    assert isinstance(rng, AgentRng)
+    assert 0 <= rng.randrange(10) < 10
+    assert len(rng.sample(list(range(20)), 5)) == 5
+    assert rng.choices(["a", "b"], weights=[1.0, 0.0], k=3) == ["a", "a", "a"]
+    assert 0.0 <= rng.betavariate(2, 5) <= 1.0
+    assert len(rng.getstate()) == 5
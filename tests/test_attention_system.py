@@ -2,9 +2,11 @@ import unittest
 from unittest.mock import Mock, patch
 from gsocialsim.kernel.world_kernel import WorldKernel
 from gsocialsim.agents.agent import Agent
+from gsocialsim.agents.attention_system import AttentionSystem
 from gsocialsim.types import AgentId, TopicId
 from gsocialsim.kernel.events import DeepFocusEvent, AllocateAttentionEvent
 from gsocialsim.agents.impression import Impression, IntakeMode
+from gsocialsim.stimuli.content_item import ContentItem
 
 class TestAttentionSystem(unittest.TestCase):
 
@@ -57,5 +59,66 @@ class TestAttentionSystem(unittest.TestCase):
         self.assertTrue(found_event, "A DeepFocusEvent should have been scheduled for the high-salience topic.")
         print("Verified: High salience correctly schedules a DeepFocusEvent.")
 
+    def test_plan_perception_only_evaluates_exposed_items(self):
+        kernel = WorldKernel(seed=5, enable_debug_logging=False)
+        agent = Agent(id=AgentId("lazy"), seed=6)
+        kernel.agents.add_agent(agent)
+        evaluate = agent.attention.evaluate
+        calls = []
+        agent.attention.evaluate = lambda content, is_physical=False, cache=None: calls.append(content.id) or evaluate(
+            content, is_physical=is_physical, cache=cache
+        )
+
+        plans = []
+        for i in range(40):
+            content = ContentItem(id=f"C{i}", author_id="X", topic=TopicId("T_Lazy"), stance=0.3)
+            plans.append(agent.plan_perception(content, kernel.world_context))
+        exposed = [p.content.id for p in plans if p.exposed]
+        self.assertTrue(0 < len(exposed) < len(plans))
+        self.assertEqual(calls, exposed)
+        self.assertTrue(all(p.impression is None for p in plans if not p.exposed))
+        self.assertIn("T_Lazy", kernel.gsr.topics)
+
+    def test_impression_template_shared_across_viewers(self):
+        kernel = WorldKernel(seed=7, enable_debug_logging=False)
+        content = ContentItem(id="B1", author_id="a0", topic=TopicId("T_Flyweight"), stance=0.4)
+        calls = []
+        evaluate = AttentionSystem._evaluate
+        with patch.object(
+            AttentionSystem,
+            "_evaluate",
+            lambda self, c, mode: calls.append((c.id, mode)) or evaluate(self, c, mode),
+        ):
+            impressions = []
+            for i in range(50):
+                agent = Agent(id=AgentId(f"a{i}"), seed=i)
+                impressions.append(agent._build_impression(content, kernel.world_context, False))
+            agent._build_impression(content, kernel.world_context, True)
+
+            self.assertEqual(calls, [("B1", IntakeMode.SCROLL), ("B1", IntakeMode.PHYSICAL)])
+            self.assertEqual(len({id(imp) for imp in impressions}), len(impressions))
+            self.assertTrue(impressions[0].is_self_source)
+            self.assertFalse(any(imp.is_self_source for imp in impressions[1:]))
+            self.assertEqual(impressions[1].stance_signal, impressions[2].stance_signal)
+
+            # Another kernel's context has its own cache.
+            other = WorldKernel(seed=8, enable_debug_logging=False)
+            Agent(id=AgentId("b0"), seed=1)._build_impression(content, other.world_context, False)
+            self.assertEqual(len(calls), 3)
+
+    def test_impression_template_cache_is_dropped_on_a_new_tick(self):
+        kernel = WorldKernel(seed=7, enable_debug_logging=False)
+        ctx = kernel.world_context
+        agent = Agent(id=AgentId("viewer"), seed=1)
+        for t in range(20):
+            kernel.clock.t = t
+            for i in range(5):
+                content = ContentItem(id=f"C{t}_{i}", author_id="x", topic=TopicId("T_Evict"), stance=0.1)
+                agent._build_impression(content, ctx, False)
+            self.assertEqual(len(ctx.impression_templates), 5)
+
+        ctx.clear_tick_buffers(kernel.clock.t)
+        self.assertFalse(ctx.impression_templates)
+
 if __name__ == '__main__':
     unittest.main()
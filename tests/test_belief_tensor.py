@@ -0,0 +1,92 @@
+import pytest
+
+from gsocialsim.agents.agent import Agent
+from gsocialsim.agents.belief_state import BeliefStore
+from gsocialsim.agents.belief_tensor import BeliefTensor
+from gsocialsim.agents.belief_update_engine import BeliefDelta
+from gsocialsim.kernel.world_kernel import WorldKernel
+from gsocialsim.types import AgentId, TopicId
+
+
+def test_bound_store_keeps_belief_store_api():
+    tensor = BeliefTensor(agent_capacity=1, topic_capacity=1)
+    store = BeliefStore()
+    store.update(TopicId("T0"), stance=0.2, confidence=0.3, salience=0.1, knowledge=0.0)
+    store.bind(tensor, tensor.allocate_row("A"))
+
+    assert store.get("T0").stance == pytest.approx(0.2, abs=1e-6)
+    store.apply_delta(BeliefDelta(topic_id="T1", stance_delta=2.0, confidence_delta=0.4))
+    store.nudge_salience("T1", 0.5)
+
+    assert set(store.topics.keys()) == {"T0", "T1"}
+    assert store.get("T1").stance == 1.0  # clamped
+    assert store.get("T1").salience == 0.5
+    assert store.topics.pop("T0").confidence == pytest.approx(0.3, abs=1e-6)
+    assert store.get("T0") is None
+    assert tensor.stance.shape[0] >= 1 and tensor.n_topics == 2
+
+
+def test_population_tensor_columns_follow_agents():
+    k = WorldKernel(seed=1, enable_belief_tensor=True, enable_debug_logging=False)
+    for i in range(3):
+        a = Agent(id=AgentId(f"A{i}"), seed=i)
+        a.beliefs.update(TopicId("T"), stance=0.1 * i, confidence=0.5, salience=0.0, knowledge=0.0)
+        k.agents.add_agent(a)
+
+    values, present = k.agents.belief_tensor.column("T")
+    assert present.sum() == 3
+    assert sorted(round(float(v), 5) for v in values[present]) == [0.0, 0.1, 0.2]
+
+    newborn = Agent(id=AgentId("B0"), seed=9)
+    k.agents.replace("A0", newborn)
+    values, present = k.agents.belief_tensor.column("T")
+    assert present.sum() == 2
+    assert newborn.beliefs.tensor is k.agents.belief_tensor
+
+
+def test_row_topics_iterate_in_creation_order():
+    tensor = BeliefTensor(agent_capacity=2, topic_capacity=2)
+    a, b = tensor.allocate_row("A"), tensor.allocate_row("B")
+    tensor.ensure(a, TopicId("T0"))
+    tensor.set(b, TopicId("T1"), 0.1, 0.1, 0.0, 0.0)
+    tensor.apply_delta(b, TopicId("T0"), 0.2, 0.1)
+    tensor.nudge(b, TopicId("T2"), "salience", 0.3)
+    assert tensor.row_topics(a) == ["T0"]
+    assert tensor.row_topics(b) == ["T1", "T0", "T2"]
+
+    # Like a dict: a removed topic that comes back moves to the end.
+    tensor.clear(b, TopicId("T1"))
+    tensor.ensure(b, TopicId("T1"))
+    assert tensor.row_topics(b) == ["T0", "T2", "T1"]
+
+    tensor.release_row(b)
+    assert tensor.allocate_row("C") == b and tensor.row_topics(b) == []
+
+
+def test_vectorized_perception_on_tensor_beliefs_matches_dict_beliefs(make_kernel):
+    def beliefs(enable_belief_tensor):
+        k = make_kernel(
+            prefix="V",
+            n_agents=6,
+            seed=5,
+            edges=((1, 0.7),),
+            topics=("T_A", "T_B"),
+            stances=(-0.4, 0.6),
+            enable_vectorized_perception=True,
+            enable_belief_tensor=enable_belief_tensor,
+        )
+        k.step(6)
+        if enable_belief_tensor:
+            assert all(a.beliefs.tensor is k.agents.belief_tensor for a in k.agents.values())
+        return {aid: [(t, b.stance, b.confidence) for t, b in a.beliefs.topics.items()] for aid, a in k.agents.items()}
+
+    expected = beliefs(False)
+    actual = beliefs(True)
+    # Same topics in the same per-agent order (V2 saw T_B first); values agree to float32 precision.
+    assert [t for t, _, _ in expected["V2"]] == ["T_B", "T_A"]
+    assert {aid: [t for t, _, _ in rows] for aid, rows in actual.items()} == {
+        aid: [t for t, _, _ in rows] for aid, rows in expected.items()
+    }
+    for aid, rows in expected.items():
+        for (_, s, c), (_, s32, c32) in zip(rows, actual[aid]):
+            assert s32 == pytest.approx(s, abs=1e-6) and c32 == pytest.approx(c, abs=1e-6)
@@ -0,0 +1,42 @@
+from gsocialsim.bench import BenchCase, BenchScenario, build_kernel, compare_baselines, run_case
+from gsocialsim.bench.__main__ import parse_size
+from gsocialsim.bench.runner import regressions
+from gsocialsim.fast import perception as fast
+
+
+def test_parse_size_suffixes():
+    assert parse_size("1000") == 1000
+    assert parse_size("10k") == 10_000
+    assert parse_size("1M") == 1_000_000
+
+
+def test_scenario_builds_follow_graph_and_stimuli():
+    sc = BenchScenario(n_agents=30, follow_degree=3, stimuli_per_tick=5, seed=3)
+    k = build_kernel(sc)
+    assert len(list(k.agents.keys())) == 30
+    graph = k.network.graph
+    for aid in k.agents.keys():
+        following = graph.get_following(aid)
+        assert 1 <= len(following) <= 3
+        assert aid not in following
+    stimuli = k.stimulus_engine.tick(0)
+    assert len(stimuli) == 5
+    assert [s.id for s in stimuli] == [s.id for s in build_kernel(sc).stimulus_engine.tick(0)]
+
+
+def test_run_case_reports_throughput_phases_and_restores_backend():
+    before = fast.BACKEND
+    sc = BenchScenario(n_agents=20, follow_degree=2, stimuli_per_tick=4)
+    row = run_case(BenchCase(scenario=sc, mode="batch_all", backend="python", ticks=2, warmup=0))
+    assert row["status"] == "ok"
+    assert row["ticks_per_s"] > 0
+    assert "phase/perceive_batch" in row["phase_s_per_tick"]
+    assert fast.BACKEND == before
+
+
+def test_compare_baselines_flags_regressions():
+    old = {"results": [{"case": "a", "status": "ok", "ticks_per_s": 10.0, "peak_rss_mb": 100.0, "phase_s_per_tick": {}}]}
+    new = {"results": [{"case": "a", "status": "ok", "ticks_per_s": 5.0, "peak_rss_mb": 101.0, "phase_s_per_tick": {}}]}
+    diff = compare_baselines(old, new)
+    assert diff[0]["ticks_per_s_pct"] == -50.0
+    assert regressions(diff, 10.0) == [("a", "ticks_per_s", -50.0)]
@@ -0,0 +1,59 @@
+from gsocialsim.kernel.world_kernel import WorldKernel
+
+
+def _political_agent(i, agent):
+    agent.identity.political_dimensions = {"economic": 0.1 * i}
+    agent.identity.ingroup_labels = {f"g{i % 2}"}
+
+
+_CHECKPOINT = dict(
+    prefix="C",
+    n_agents=8,
+    seed=8,
+    agent_seed=500,
+    topics=("T_0", "T_1", "T_2"),
+    life_cycle=True,
+    agent_setup=_political_agent,
+)
+
+
+def _roundtrip_matches(tmp_path, make_kernel, fingerprint, **kwargs):
+    original = make_kernel(**_CHECKPOINT, **kwargs)
+    original.step(100)  # crosses a day boundary (daily consolidation)
+
+    path = tmp_path / "snap.npz"
+    original.save_checkpoint(str(path))
+    restored = WorldKernel.load_checkpoint(str(path))
+    assert fingerprint(restored) == fingerprint(original)
+    assert restored.physical_world.schedules.keys() == original.physical_world.schedules.keys()
+    # Policies pick topics from beliefs.topics, so its order is state too.
+    assert [list(a.beliefs.topics) for a in restored.agents.values()] == [
+        list(a.beliefs.topics) for a in original.agents.values()
+    ]
+
+    original.step(30)
+    restored.step(30)
+    assert fingerprint(restored) == fingerprint(original)
+
+
+def test_checkpoint_resume_matches_uninterrupted_run(tmp_path, make_kernel, kernel_fingerprint):
+    _roundtrip_matches(tmp_path, make_kernel, kernel_fingerprint)
+
+
+def test_checkpoint_roundtrip_with_belief_tensor(tmp_path, make_kernel, kernel_fingerprint):
+    _roundtrip_matches(tmp_path, make_kernel, kernel_fingerprint, enable_belief_tensor=True)
+
+
+def test_checkpoint_keeps_large_integers_exact(tmp_path, make_kernel):
+    k = make_kernel(**_CHECKPOINT)
+    big = {"C0": (1 << 53) + 1, "C1": (1 << 64) + 3}
+    for aid, seed in big.items():
+        k.agents.get(aid).seed = seed
+    k.agents.get("C2").policy.max_reactive_impressions = (1 << 62) + 7
+
+    path = tmp_path / "big.npz"
+    k.save_checkpoint(str(path))
+    restored = WorldKernel.load_checkpoint(str(path))
+    for aid, seed in big.items():
+        assert restored.agents.get(aid).seed == seed
+    assert restored.agents.get("C2").policy.max_reactive_impressions == (1 << 62) + 7
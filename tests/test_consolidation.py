@@ -0,0 +1,41 @@
+import pytest
+
+from gsocialsim.agents.agent import Agent
+from gsocialsim.agents.belief_update_engine import BeliefDelta
+from gsocialsim.kernel.world_kernel import WorldKernel
+from gsocialsim.types import AgentId, TopicId
+
+
+def _kernel(tensor: bool) -> WorldKernel:
+    k = WorldKernel(seed=3, enable_debug_logging=False, enable_belief_tensor=tensor)
+    for i in range(3):
+        a = Agent(id=AgentId(f"C{i}"), seed=i)
+        a.beliefs.update(TopicId("T"), stance=-0.1, confidence=0.5, salience=0.0, knowledge=0.0)
+        k.agents.add_agent(a)
+    return k
+
+
+@pytest.mark.parametrize("tensor", [False, True])
+def test_deltas_are_summed_per_cell_and_crossings_use_net_change(tensor):
+    k = _kernel(tensor)
+    ctx = k.world_context
+    # C0 crosses (net +0.3); C1 goes up then back down (net 0, no crossing);
+    # C2 gets a new topic and a clamped confidence.
+    ctx.queue_belief_delta("C0", BeliefDelta(topic_id="T", stance_delta=0.1, confidence_delta=0.1))
+    ctx.queue_belief_delta("C1", BeliefDelta(topic_id="T", stance_delta=0.5))
+    ctx.queue_belief_delta("C0", BeliefDelta(topic_id="T", stance_delta=0.2, confidence_delta=0.1))
+    ctx.queue_belief_delta("C1", BeliefDelta(topic_id="T", stance_delta=-0.5))
+    ctx.queue_belief_delta("C2", BeliefDelta(topic_id="U", stance_delta=-0.4, confidence_delta=3.0))
+    ctx.queue_belief_delta("missing", BeliefDelta(topic_id="T", stance_delta=1.0))
+    k._consolidate(0)
+
+    beliefs = {aid: k.agents[aid].beliefs for aid in ("C0", "C1", "C2")}
+    assert beliefs["C0"].get("T").stance == pytest.approx(0.2, abs=1e-6)
+    assert beliefs["C0"].get("T").confidence == pytest.approx(0.7, abs=1e-6)
+    assert beliefs["C1"].get("T").stance == pytest.approx(-0.1, abs=1e-6)
+    assert beliefs["C2"].get("U").stance == pytest.approx(-0.4, abs=1e-6)
+    assert beliefs["C2"].get("U").confidence == 1.0
+
+    crossings = [(e.agent_id, e.topic) for e in k.analytics.crossings]
+    assert crossings == [("C0", "T"), ("C2", "U")]
+    assert k.world_context.deferred_belief_deltas == []
@@ -0,0 +1,50 @@
+import random
+
+from gsocialsim.agents.agent import Agent
+from gsocialsim.agents.agent_rng import AgentRng
+from gsocialsim.agents.daily_digest import DailyDigest
+from gsocialsim.agents.impression import Impression, IntakeMode
+from gsocialsim.types import AgentId, TopicId
+
+
+def _imp(i, topic, stance, threat=0.0):
+    return Impression(IntakeMode.SCROLL, f"C{i}", TopicId(topic), stance, identity_threat=threat)
+
+
+def test_aggregates_and_bounded_reservoir():
+    rng = random.Random(1)
+    digest = DailyDigest(AgentRng(7), max_samples=5)
+    imps = [_imp(i, f"T{i % 3}", rng.uniform(-1, 1)) for i in range(200)]
+    digest.extend(imps)
+
+    assert digest.count == 200
+    assert digest.topic_counts == {"T0": 67, "T1": 67, "T2": 66}
+    expected = sum(imp.stance_signal for imp in imps if imp.topic == "T1")
+    assert abs(digest.topic_stance_sums["T1"] - expected) < 1e-9
+    sample = digest.sample()
+    assert len(sample) == 5 and len({imp.content_id for imp in sample}) == 5
+
+    counts = digest.topic_counts
+    digest.reset()
+    assert not digest and digest.sample() == [] and counts["T0"] == 67
+
+
+def test_reservoir_prefers_heavy_impressions():
+    hits = 0
+    for seed in range(400):
+        digest = DailyDigest(AgentRng(seed), max_samples=1)
+        digest.add(_imp(0, "T", 0.0, threat=1.0))  # weight 0.7
+        for i in range(1, 8):
+            digest.add(_imp(i, "T", 0.0))  # weight 0.2 each
+        hits += digest.sample()[0].content_id == "C0"
+    # P(heavy) = 0.7 / (0.7 + 7 * 0.2) = 1/3
+    assert 0.25 < hits / 400 < 0.42
+
+
+def test_reservoir_draws_do_not_shift_agent_stream():
+    a = Agent(id=AgentId("d1"), seed=3)
+    b = Agent(id=AgentId("d1"), seed=3)
+    for i in range(10):
+        a.daily_digest.add(_imp(i, "T", 0.1))
+    assert [a.rng.random() for _ in range(3)] == [b.rng.random() for _ in range(3)]
+    assert a.daily_digest.count == 10 and b.daily_digest.count == 0
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from gsocialsim.fast import perception as fast
+
+
+def _inputs(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(-1.0, 1.0, n),
+        rng.uniform(-1.0, 1.0, n),
+        rng.random(n) < 0.8,
+        rng.uniform(-0.2, 1.2, n),
+        rng.uniform(0.0, 1.0, n),
+        rng.uniform(0.0, 1.0, n),
+        rng.uniform(0.0, 1.0, n),
+        rng.random(n) < 0.2,
+        rng.uniform(0.0, 1.0, n),
+        rng.random(n) < 0.3,
+    )
+
+
+def test_numpy_batch_matches_scalar_formula():
+    args = _inputs(2000)
+    sd, cd = fast._numpy_belief_deltas(*args)
+    assert sd.dtype == np.float32 and cd.dtype == np.float32
+    for i in range(len(sd)):
+        row = [a[i].item() for a in args]
+        expect = fast._py_belief_delta(*row)
+        assert float(sd[i]) == pytest.approx(expect[0], abs=1e-5)
+        assert float(cd[i]) == pytest.approx(expect[1], abs=1e-5)
+
+
+def test_public_api_never_drops_deltas():
+    sd, cd = fast.compute_belief_deltas(*[a[:3] for a in _inputs(3, seed=1)])
+    assert len(sd) == len(cd) == 3
+    s, c = fast.compute_belief_delta(0.8, 0.0, False, 0.5, 0.5, 0.0, 0.0, False, 0.5, False)
+    assert (s, c) == pytest.approx((0.4, 0.05))
+    assert fast.HAS_BATCH
+
+
+def test_detailed_timing_does_not_change_beliefs(make_kernel, kernel_fingerprint):
+    def run(level: str):
+        k = make_kernel(topics=("T_0", "T_1"), stances=(-0.4, 0.7), enable_timing=True, timing_level=level)
+        k.step(12)
+        return kernel_fingerprint(k)
+
+    assert run("detailed") == run("basic")
@@ -0,0 +1,42 @@
+from gsocialsim.bench import BenchScenario, build_kernel
+
+
+def _kernel(**kwargs):
+    sc = BenchScenario(n_agents=6, follow_degree=2, stimuli_per_tick=3, broadcast_fraction=0.5, seed=4, life_cycle=True)
+    return build_kernel(sc, enable_timing=True, **kwargs)
+
+
+def _state(k):
+    beliefs = {
+        (aid, topic): (round(b.stance, 9), round(b.confidence, 9))
+        for aid, a in k.agents.items()
+        for topic, b in a.beliefs.topics.items()
+    }
+    budgets = {aid: k.world_context.time_remaining_by_agent.get(aid) for aid in k.agents.keys()}
+    return (
+        (k.clock.t, k.clock.day, k.clock.tick_of_day),
+        beliefs,
+        budgets,
+        dict(k.analytics.exposure_counts),
+        len(k.analytics.interactions),
+        {topic: round(r.political_salience, 9) for topic, r in k.gsr.topics.items()},
+    )
+
+
+def test_fast_forward_matches_tick_by_tick_over_nights():
+    fast = _kernel()
+    slow = _kernel(enable_fast_forward=False)
+    days = 2 * fast.clock.ticks_per_day
+    fast.step(days)
+    slow.step(days)
+    assert fast.perf.stats["tick/fast_forward"].count > 0
+    assert fast.perf.stats["tick"].count < days
+    assert _state(fast) == _state(slow)
+
+
+def test_fast_forward_stops_at_requested_ticks():
+    k = _kernel()
+    for _ in range(40):
+        t = k.clock.t
+        k.step(3)
+        assert k.clock.t == t + 3
@@ -0,0 +1,28 @@
+from gsocialsim.agents.agent_rng import AgentRng
+from gsocialsim.kernel.feed import FeedView, sample_feed
+
+
+def test_feed_view_matches_concatenation():
+    segments = [[1, 2, 3], [], [4], [5, 6]]
+    flat = [x for seg in segments for x in seg]
+    view = FeedView(segments)
+    assert len(view) == len(flat)
+    assert list(view) == flat
+    assert [view[i] for i in range(-len(flat), len(flat))] == flat + flat
+    assert view[1:5] == flat[1:5] and view[::-2] == flat[::-2]
+    assert not FeedView([[], []])
+
+
+def test_feed_view_sampling_is_identical_to_list_sampling():
+    segments = [list(range(i * 40, i * 40 + 40)) for i in range(5)]
+    flat = [x for seg in segments for x in seg]
+    for k in (3, 25, 150):
+        a = AgentRng.for_agent(7, "A")
+        b = AgentRng.for_agent(7, "A")
+        assert sample_feed(FeedView(segments), k, a) == b.sample(flat, k)
+
+
+def test_feed_view_shares_segments():
+    shared = ["x", "y"]
+    one, two = FeedView([shared]), FeedView([shared])
+    assert one.segments[0] is two.segments[0] is shared
@@ -0,0 +1,45 @@
+import pytest
+
+from gsocialsim.networks.network_layer import NetworkGraph
+
+
+def _graph() -> NetworkGraph:
+    g = NetworkGraph()
+    g.add_edge("A", "B", trust=0.7)
+    g.add_edge("A", "C")
+    g.add_edge("C", "B", trust=0.2)
+    return g
+
+
+def _ids(g, view):
+    return sorted(g.node_ids[i] for i in view.tolist())
+
+
+def test_views_match_set_adjacency():
+    g = _graph()
+    assert _ids(g, g.followers_view("B")) == ["A", "C"]
+    assert g.followers_view("A").size == 0
+    assert g.followers_view("unknown").size == 0
+    assert g.follower_count("B") == 2
+
+
+def test_index_is_cached_until_topology_changes():
+    g = _graph()
+    index = g.follow_index()
+    assert g.follow_index() is index
+
+    g.update_edge_trust("A", "B", 0.1)
+    g.add_edge("A", "B", trust=0.9)  # existing edge: trust only
+    assert g.follow_index() is index
+
+    g.add_edge("B", "A")
+    rebuilt = g.follow_index()
+    assert rebuilt is not index
+    assert _ids(g, g.followers_view("A")) == ["B"]
+
+
+def test_views_are_read_only():
+    g = _graph()
+    view = g.followers_view("B")
+    with pytest.raises(ValueError):
+        view[0] = 0
@@ -0,0 +1,47 @@
+import pytest
+
+from gsocialsim.kernel.sharding import fork_available
+from gsocialsim.stimuli.stimulus import Stimulus
+from gsocialsim.stimuli.data_source import DataSource
+
+
+class _ShockSource(DataSource):
+    def __init__(self, tick: int, stance: float):
+        self.tick = tick
+        self.stance = stance
+
+    def get_stimuli(self, tick: int):
+        if tick != self.tick:
+            return []
+        return [
+            Stimulus(id=f"shock_{tick}_{i}", source="OUTLET", tick=tick, content_text="shock",
+                     metadata={"topic": "T_Fork", "stance": self.stance})
+            for i in range(20)
+        ]
+
+
+def _stances(k):
+    return {aid: round(a.beliefs.get("T_Fork").stance, 12) if a.beliefs.get("T_Fork") else None
+            for aid, a in k.agents.items()}
+
+
+@pytest.mark.skipif(not fork_available(), reason="copy-on-write branches require os.fork")
+def test_fork_branches_share_state_and_leave_parent_untouched(make_kernel, kernel_fingerprint):
+    def branch(k, shock):
+        if shock is not None:
+            k.stimulus_engine.register_data_source(_ShockSource(tick=k.clock.t, stance=shock))
+        k.step(6)
+        return kernel_fingerprint(k), _stances(k)
+
+    k = make_kernel(prefix="F", n_agents=6, seed=3, agent_seed=40, source=_ShockSource(tick=1, stance=0.0))
+    k.step(3)
+    before = kernel_fingerprint(k)
+
+    baseline, shocked = k.fork([None, 0.9], branch)
+
+    assert kernel_fingerprint(k) == before
+    assert baseline[0][0] == shocked[0][0] == before[0] + 6
+    assert baseline[1] != shocked[1]
+
+    # The untouched branch is exactly what continuing in-process produces.
+    assert branch(k, None) == baseline
@@ -0,0 +1,87 @@
+import json
+
+from gsocialsim.util.perf import PerfTracker
+
+
+def _run(perf: PerfTracker) -> None:
+    for _ in range(4):
+        with perf.time("tick"):
+            with perf.time("phase/act"):
+                for _ in range(10):
+                    with perf.time("act/agent"):
+                        pass
+            with perf.time("phase/perceive"):
+                pass
+
+
+def test_hierarchical_tree_and_sampling():
+    perf = PerfTracker(enabled=True, hierarchical=True, sample_every=5)
+    _run(perf)
+    agent = perf.stats["act/agent"]
+    assert agent.calls == 40 and agent.count == 40 and agent.sampled == 8
+    assert ("tick", "phase/act", "act/agent") in perf.tree
+    assert perf.tree[("tick", "phase/perceive")].calls == 4
+    assert perf._stack == []
+    report = perf.report()
+    assert "1 in 5 calls timed" in report and "TIMING TREE" in report
+
+
+def test_trace_exports(tmp_path):
+    perf = PerfTracker(enabled=True, trace=True)
+    _run(perf)
+    assert len(perf.events) == 4 * 13
+
+    chrome = tmp_path / "trace.json"
+    perf.export_chrome_trace(str(chrome))
+    events = json.loads(chrome.read_text())["traceEvents"]
+    assert {e["name"] for e in events} == {"tick", "phase/act", "act/agent", "phase/perceive"}
+
+    doc = perf.speedscope()
+    profile = doc["profiles"][0]
+    assert profile["type"] == "evented"
+    opens = [e for e in profile["events"] if e["type"] == "O"]
+    closes = [e for e in profile["events"] if e["type"] == "C"]
+    assert len(opens) == len(closes) == len(perf.events)
+
+
+def test_speedscope_from_tree_without_trace():
+    perf = PerfTracker(enabled=True, hierarchical=True)
+    _run(perf)
+    profile = perf.speedscope()["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"]) > 0
+
+
+def test_disabled_tracker_records_nothing():
+    perf = PerfTracker(enabled=False, hierarchical=True, trace=True)
+    _run(perf)
+    assert not perf.stats and not perf.tree and not perf.events
+
+
+def test_memory_deltas_and_top_sites():
+    perf = PerfTracker(enabled=True, memory="tracemalloc", memory_top=3)
+    keep = []
+    try:
+        for _ in range(3):
+            with perf.time("tick"):
+                with perf.time("phase/ingest"):
+                    keep.append(bytearray(256 * 1024))
+                with perf.time("act/agent"):
+                    pass
+    finally:
+        perf.configure(memory="off")
+    ingest = perf.memory_stats["phase/ingest"]
+    assert ingest.count == 3 and ingest.total >= 3 * 256 * 1024
+    assert "act/agent" not in perf.memory_stats
+    site, size, _ = ingest.top_sites(1)[0]
+    assert site.startswith(__file__) and size >= 3 * 256 * 1024
+    report = perf.report()
+    assert "MEMORY REPORT (traced Python heap" in report and "phase/ingest: net=+" in report
+
+
+def test_rss_memory_mode():
+    perf = PerfTracker(enabled=True, memory="rss")
+    with perf.time("phase/consolidate"):
+        pass
+    assert perf.memory_stats["phase/consolidate"].count == 1
+    assert "MEMORY REPORT (process RSS" in perf.report()
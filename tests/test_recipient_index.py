@@ -0,0 +1,34 @@
+import random
+
+from gsocialsim.agents.agent import Agent
+from gsocialsim.kernel.recipients import sample_recipients
+from gsocialsim.kernel.world_kernel import WorldKernel
+from gsocialsim.types import AgentId
+
+
+def _kernel(n: int = 6) -> WorldKernel:
+    k = WorldKernel(seed=1, enable_debug_logging=False)
+    for i in range(n):
+        k.agents.add_agent(Agent(id=AgentId(f"R{i}"), seed=i))
+    k.network.graph.add_edge(follower="R3", followed="R1")
+    k.network.graph.add_edge(follower="R0", followed="R1")
+    return k
+
+
+def test_recipients_cached_and_invalidated_by_version():
+    k = _kernel()
+    assert list(k._eligible_recipients_for_author("R1")) == ["R0", "R1", "R3"]
+    broadcast = k._eligible_recipients_for_author("OUTLET")
+    assert list(broadcast) == sorted(k.agents.keys())
+    assert k._eligible_recipients_for_author("OUTLET") is broadcast
+
+    k.network.graph.add_edge(follower="R5", followed="R1")
+    assert list(k._eligible_recipients_for_author("R1")) == ["R0", "R1", "R3", "R5"]
+    k.agents.add_agent(Agent(id=AgentId("R9"), seed=9))
+    assert "R9" in k._eligible_recipients_for_author("OUTLET")
+
+
+def test_sample_recipients_matches_list_sample():
+    population = [f"A{i}" for i in range(200)]
+    for k in (3, 50):
+        assert sample_recipients(population, k, random.Random(4)) == random.Random(4).sample(population, k)
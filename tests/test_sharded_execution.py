@@ -0,0 +1,34 @@
+import pytest
+
+from gsocialsim.kernel.sharding import fork_available, partition
+
+
+_SHARD = dict(
+    prefix="S",
+    n_agents=10,
+    seed=21,
+    agent_seed=300,
+    edges=((1, 0.6), (3, 0.4)),
+    topics=("T_Shard",),
+    max_perceptions_per_tick=6,
+)
+
+
+def test_partition_is_contiguous_and_complete():
+    items = list(range(10))
+    shards = partition(items, 3)
+    assert [len(s) for s in shards] == [4, 3, 3]
+    assert sum(shards, []) == items
+    assert partition(items[:2], 5) == [[0], [1]]
+
+
+@pytest.mark.skipif(not fork_available(), reason="sharded mode requires os.fork")
+def test_sharded_step_is_independent_of_worker_count(make_kernel, kernel_fingerprint):
+    baseline = make_kernel(**_SHARD)
+    baseline.step(8)
+    expected = kernel_fingerprint(baseline, analytics=True)
+
+    for workers in (1, 2, 3):
+        k = make_kernel(enable_sharding=True, shard_workers=workers, **_SHARD)
+        k.step(8)
+        assert kernel_fingerprint(k, analytics=True) == expected
@@ -0,0 +1,52 @@
+import copy
+import pickle
+
+import pytest
+
+from gsocialsim.agents.agent import PerceptionPlan
+from gsocialsim.agents.attention_system import AttentionSystem
+from gsocialsim.agents.impression import Impression, IntakeMode
+from gsocialsim.analytics.attribution import ExposureEvent
+from gsocialsim.stimuli.content_item import ContentItem
+from gsocialsim.types import TopicId
+
+
+def test_hot_records_have_no_instance_dict():
+    content = ContentItem(id="C1", author_id="A", topic=TopicId("T"), stance=0.2)
+    imp = AttentionSystem().evaluate(content)
+    plan = PerceptionPlan(
+        agent_id="A",
+        content=content,
+        impression=imp,
+        is_physical=False,
+        stimulus_id=None,
+        exposed=True,
+        consumed_roll=True,
+        has_belief=False,
+        attention_cost=imp.attention_cost_minutes,
+        exposure_cost=0.0,
+        consumption_extra_cost=0.0,
+        belief_delta=None,
+        old_stance=0.0,
+    )
+    event = ExposureEvent(timestamp=0, source_actor_id="A", topic=TopicId("T"), is_physical=False)
+    for obj in (content, imp, plan, event):
+        assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        imp.not_a_field = 1
+
+
+def test_impression_annotations_are_fields():
+    imp = Impression(IntakeMode.SCROLL, "C1", TopicId("T"), 0.5)
+    assert imp.attention_cost_minutes == 0.0 and imp.is_self_source is False
+
+    imp.attention_cost_minutes = 3.0
+    dup = copy.copy(imp)
+    dup.is_self_source = True
+    assert dup is not imp and dup.attention_cost_minutes == 3.0
+    assert not imp.is_self_source
+    # Annotations stay out of equality, as when they were dynamic attributes.
+    assert dup == imp
+
+    restored = pickle.loads(pickle.dumps(dup))
+    assert restored.is_self_source and restored.attention_cost_minutes == 3.0
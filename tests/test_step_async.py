@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+from gsocialsim.bench import BenchScenario, build_kernel
+
+
+def _kernel():
+    return build_kernel(BenchScenario(n_agents=40, follow_degree=3, stimuli_per_tick=6, seed=2))
+
+
+def _beliefs(k):
+    return {
+        (aid, topic): round(b.stance, 9) for aid, a in k.agents.items() for topic, b in a.beliefs.topics.items()
+    }
+
+
+def test_step_async_yields_snapshots_and_matches_sync_step():
+    k = _kernel()
+
+    async def run():
+        return [snap async for snap in k.step_async(5, yield_every=2)]
+
+    snaps = asyncio.run(run())
+    assert [s.ticks_done for s in snaps] == [2, 4, 5]
+    assert [s.t for s in snaps] == [2, 4, 5]
+
+    ref = _kernel()
+    ref.step(5)
+    assert _beliefs(k) == _beliefs(ref)
+
+
+def test_step_async_cancel_event_and_task_cancellation_stop_between_ticks():
+    k = _kernel()
+
+    async def run_until_event():
+        cancel = asyncio.Event()
+        seen = []
+        async for snap in k.step_async(10, cancel=cancel):
+            seen.append(snap.t)
+            if snap.t == 3:
+                cancel.set()
+        return seen
+
+    assert asyncio.run(run_until_event()) == [1, 2, 3]
+    assert k.clock.t == 3
+
+    async def cancel_task():
+        loop = asyncio.get_running_loop()
+        step = k.step
+
+        def step_then_cancel(n=1):
+            step(n)
+            if k.clock.t == 6:
+                loop.call_soon_threadsafe(task.cancel)
+
+        k.step = step_then_cancel
+
+        async def consume():
+            async for _ in k.step_async(50, yield_every=50):
+                pass
+
+        task = asyncio.ensure_future(consume())
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        del k.step
+
+    asyncio.run(cancel_task())
+    # Stopped inside the 50-tick chunk, right after a completed CONSOLIDATE.
+    assert 6 <= k.clock.t < 3 + 50
+    ctx = k.world_context
+    assert (ctx.current_tick, ctx.current_phase) == (k.clock.t - 1, "CONSOLIDATE")
+    assert ctx.stimuli_by_tick.get(ctx.current_tick) is None
+
+
+def test_step_async_checks_cancel_before_every_tick():
+    k = _kernel()
+    cancel = threading.Event()
+    step = k.step
+
+    def step_then_cancel(n=1):
+        step(n)
+        if k.clock.t == 7:
+            cancel.set()
+
+    k.step = step_then_cancel
+
+    async def run():
+        return [snap.ticks_done async for snap in k.step_async(50, yield_every=20, cancel=cancel)]
+
+    assert asyncio.run(run()) == [7]
+    assert k.clock.t == 7
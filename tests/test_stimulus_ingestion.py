@@ -0,0 +1,40 @@
+from gsocialsim.kernel.stimulus_ingestion import StimulusIngestionEngine
+from gsocialsim.stimuli.data_source import DataSource
+from gsocialsim.stimuli.stimulus import Stimulus
+
+
+class _Source(DataSource):
+    def get_stimuli(self, tick):
+        return [
+            Stimulus(
+                id=f"S{tick}",
+                source="OUT",
+                tick=tick,
+                content_text="x",
+                metadata={"topic": "T_Intern", "stance": 0.4, "identity_threat": 0.9, "political_salience": 0.7},
+            )
+        ]
+
+
+def test_stimulus_content_is_interned_once_per_stimulus():
+    engine = StimulusIngestionEngine()
+    engine.register_data_source(_Source())
+    (stimulus,) = engine.tick(0)
+    content = engine.content_for(stimulus)
+    assert engine.content_for(stimulus) is content
+    assert (content.topic, content.stance, content.identity_threat) == ("T_Intern", 0.4, 0.9)
+    assert engine.political_salience("S0") == 0.7
+
+
+def test_content_cache_is_evicted_with_the_tick_buffers(make_kernel):
+    k = make_kernel(n_agents=2, source=_Source())
+    engine = k.stimulus_engine
+    k.step(3)
+    assert engine._content_store == {} and engine._political_salience == {}
+
+    (stimulus,) = engine.tick(3)
+    k.world_context.stimuli_by_tick[3] = [stimulus]
+    assert engine.political_salience("S3") == 0.7
+    k.world_context.clear_tick_buffers(3)
+    assert "S3" not in engine._content_store and engine.political_salience("S3") is None
+    assert engine.content_for(stimulus).topic == "T_Intern"
@@ -0,0 +1,58 @@
+import numpy as np
+
+from gsocialsim.kernel.time_ledger import TimeLedger
+from gsocialsim.kernel.world_context import WorldContext
+
+
+def test_ledger_keeps_dict_semantics():
+    ledger = TimeLedger()
+    assert "A" not in ledger
+    assert ledger.get("A") is None
+    assert ledger.spend("A", 10.0)  # no budget set: spending is allowed
+
+    ledger["A"] = 5.0
+    ledger.update({"B": -3.0})
+    assert dict(ledger) == {"A": 5.0, "B": 0.0}
+    assert ledger.spend("A", 2.5)
+    assert not ledger.spend("A", 3.0)
+    assert ledger["A"] == 2.5
+
+    del ledger["A"]
+    assert "A" not in ledger and len(ledger) == 1
+
+
+def test_bulk_set_and_spend():
+    ctx = WorldContext()
+    ids = [f"A{i}" for i in range(100)]
+    ctx.set_time_budgets(ids, np.arange(100, dtype=np.float64))
+    assert ctx.time_remaining_by_agent["A7"] == 7.0
+
+    ok = ctx.spend_many(ids, 50.0)
+    assert ok.tolist() == [i >= 50 for i in range(100)]
+    assert ctx.time_remaining_by_agent["A60"] == 10.0
+    assert ctx.time_remaining_by_agent["A10"] == 10.0
+
+    # Repeated agents are charged in order.
+    ok = ctx.spend_many(["A60", "A60", "A60", "UNBUDGETED"], 4.0)
+    assert ok.tolist() == [True, True, False, True]
+    assert ctx.time_remaining_by_agent["A60"] == 2.0
+
+    ledger = ctx.time_remaining_by_agent
+    remaining = ledger.remaining_many(["A1", "nobody"])
+    assert remaining[0] == 1.0 and np.isinf(remaining[1])
+
+
+def test_spending_exactly_the_remaining_budget_is_allowed():
+    ledger = TimeLedger()
+    ledger["a"] = 1.0
+    assert ledger.spend("a", 0.3)
+    assert ledger.spend("a", 0.7)
+    ledger["b"] = 0.7
+    assert ledger.spend("b", 0.7)
+    assert ledger["b"] == 0.0
+
+    ledger["c"] = 1.0
+    ledger["d"] = 0.7
+    assert ledger.spend_many(["c", "d"], [0.3, 0.7]).all()
+    assert ledger.spend_many(["c", "d"], [0.7, 0.0]).all()
+    assert ledger.spend_many(["c", "c"], [0.0, 0.0]).all()
@@ -0,0 +1,48 @@
+def _rich_attention(i, agent):
+    agent.budgets.attention_bank_minutes = 1000.0
+
+
+_VEC = dict(
+    prefix="V",
+    n_agents=12,
+    agent_seed=100,
+    edges=((1, 0.7),),
+    topics=("T_Vec",),
+    per_tick=5,
+    stances=(-0.4, 0.6),
+    agent_setup=_rich_attention,
+    enable_vectorized_perception=True,
+)
+
+
+def test_vectorized_perception_exposes_consumes_and_updates_beliefs(make_kernel):
+    k = make_kernel(seed=11, **_VEC)
+    k.step(4)
+    exposures = sum(k.analytics.exposure_counts.values())
+    consumed = sum(k.analytics.consumed_counts.values())
+    assert exposures > 0
+    assert 0 < consumed <= exposures
+    assert any(a.beliefs.get("T_Vec") is not None for a in k.agents.values())
+
+
+def test_vectorized_perception_is_deterministic_per_seed(make_kernel, kernel_fingerprint):
+    a = make_kernel(seed=5, **_VEC)
+    b = make_kernel(seed=5, **_VEC)
+    a.step(3)
+    b.step(3)
+    assert kernel_fingerprint(a, analytics=True) == kernel_fingerprint(b, analytics=True)
+
+
+def test_vectorized_perception_respects_time_budget(make_kernel):
+    k = make_kernel(seed=11, max_perceptions_per_tick=0, **_VEC)
+    k.start()
+    k.step(1)
+    for aid in k.agents.keys():
+        assert k.world_context.time_remaining_by_agent[aid] >= 0.0
+
+
+def test_vectorized_perception_caps_items_per_agent(make_kernel):
+    k = make_kernel(seed=11, max_perceptions_per_tick=2, **_VEC)
+    k.step(1)
+    for aid in k.agents.keys():
+        assert k.analytics.exposure_counts.get(aid, 0) <= 2
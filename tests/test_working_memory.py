@@ -0,0 +1,78 @@
+import pickle
+import random
+from collections import OrderedDict
+
+from gsocialsim.agents.agent import Agent
+from gsocialsim.agents.impression import Impression, IntakeMode
+from gsocialsim.agents.working_memory import WorkingMemory
+from gsocialsim.types import AgentId
+
+
+def _reference_put(ref, capacity, key, value):
+    if key in ref:
+        ref.move_to_end(key)
+    ref[key] = value
+    while len(ref) > capacity:
+        ref.popitem(last=False)
+
+
+def test_matches_ordered_dict_recency():
+    rng = random.Random(3)
+    capacity = 7
+    memory = WorkingMemory(capacity)
+    ref = OrderedDict()
+    for step in range(2000):
+        key = f"C{rng.randrange(20)}"
+        if rng.random() < 0.1 and key in ref:
+            del memory[key]
+            del ref[key]
+        else:
+            memory.remember(key, step)
+            _reference_put(ref, capacity, key, step)
+        assert list(memory.items()) == list(ref.items())
+        k = rng.randrange(0, 10)
+        expected = list(ref)[-k:] if k else list(ref)
+        assert memory.last_ids(k) == expected
+
+
+def test_capacity_change_and_mapping_api():
+    memory = WorkingMemory(5)
+    memory.update((f"C{i}", i) for i in range(5))
+    memory["C1"] = "again"
+    assert list(memory) == ["C0", "C2", "C3", "C4", "C1"]
+    assert memory["C1"] == "again" and "C0" in memory
+
+    memory.capacity = 2
+    assert list(memory.items()) == [("C4", 4), ("C1", "again")]
+    memory.capacity = 4
+    memory.update({"C5": 5, "C6": 6, "C7": 7})
+    assert list(memory) == ["C1", "C5", "C6", "C7"]
+
+    restored = pickle.loads(pickle.dumps(memory))
+    assert list(restored.items()) == list(memory.items())
+    memory.clear()
+    assert len(memory) == 0 and memory.last_ids(3) == []
+
+
+def test_agent_working_memory_honours_max_recent_impressions():
+    agent = Agent(id=AgentId("wm"), seed=1, max_recent_impressions=3)
+    assert agent.recent_impressions.capacity == 3
+    agent.max_recent_impressions = 2
+
+    for i in range(4):
+        agent._remember_impression(Impression(IntakeMode.SCROLL, f"C{i}", "T", 0.0))
+    assert list(agent.recent_impressions) == ["C2", "C3"]
+    assert agent.policy._reactive_ids(agent) == ["C2", "C3"]
+
+
+def test_slots_grow_on_demand_and_stay_bounded():
+    memory = WorkingMemory(50)
+    assert memory._ids == [] and memory._items == []
+    for i in range(3):
+        memory.remember(f"C{i}", i)
+    assert len(memory._ids) == 3
+
+    for i in range(1000):
+        memory.remember(f"C{i % 70}", i)
+        assert len(memory._ids) <= 2 * memory.capacity
+    assert len(memory) == 50